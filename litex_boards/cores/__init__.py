@@ -0,0 +1,63 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Generic cores, shared by all the targets through add_args/apply_args (cores that need target
+# specific parameters, e.g. L2 cache, SPI Flash cache or telemetry, are added by the targets).
+
+import sys
+
+from litex_boards.cores.perf_counters import perf_counters_args, add_perf_counters
+from litex_boards.cores.dram_dma import dram_dma_args, add_dram_dma
+from litex_boards.cores.dram_analyzer import dram_analyzer_args, add_dram_analyzer
+from litex_boards.cores.sdram_calib import sdram_calib_args, add_sdram_calib_cache
+from litex_boards.cores.sdram_phase import sdram_phase_args, add_sdram_phase_calib
+from litex_boards.cores.boot_profile import boot_profile_args, add_boot_profile
+from litex_boards.cores.xilinx_config import xilinx_config_args, add_xilinx_fast_config
+from litex_boards.cores.nextpnr_seeds import nextpnr_seeds_args, add_nextpnr_multi_seed
+from litex_boards.cores.clock_plan import clock_plan_args, add_clock_plan_cache
+from litex_boards.cores.dry_run import dry_run_args, soc_dry_run
+
+# Generic Cores ------------------------------------------------------------------------------------
+
+def add_args(parser):
+    """Add the arguments of the generic cores to a target argument parser."""
+    perf_counters_args(parser)
+    dram_dma_args(parser)
+    dram_analyzer_args(parser)
+    sdram_calib_args(parser)
+    sdram_phase_args(parser)
+    boot_profile_args(parser)
+    xilinx_config_args(parser)
+    nextpnr_seeds_args(parser)
+    clock_plan_args(parser)
+    dry_run_args(parser)
+
+def apply_args(soc, args):
+    """Add the generic cores enabled in args to a SoC (after BaseSoC creation, before the build).
+
+    Cores not applicable to the SoC (no SDRAM, other toolchain, ...) are skipped with a warning.
+    With --dry-run, the SoC maps are exported and the target exits (no build).
+    """
+    if args.with_dram_dma:
+        add_dram_dma(soc, min_length=args.dram_dma_min_length)
+    if args.with_dram_analyzer:
+        add_dram_analyzer(soc, depth=args.dram_analyzer_depth)
+    if args.with_sdram_calib_cache:
+        add_sdram_calib_cache(soc)
+    if args.with_sdram_phase_calib:
+        add_sdram_phase_calib(soc)
+    if args.boot_profile != "standard":
+        add_boot_profile(soc, profile=args.boot_profile, flash_offset=args.boot_flash_offset)
+    if args.with_fast_config:
+        add_xilinx_fast_config(soc, configrate=args.config_rate, emcclk_div=args.config_emcclk_div)
+    if args.with_perf_counters:
+        add_perf_counters(soc)
+    if args.nextpnr_seeds > 1:
+        add_nextpnr_multi_seed(soc, seeds=args.nextpnr_seeds, jobs=args.nextpnr_seeds_jobs, history=args.nextpnr_seeds_history)
+    if args.clock_plan_cache is not None:
+        add_clock_plan_cache(soc, args.clock_plan_cache)
+    if args.dry_run:
+        soc_dry_run(soc, args.dry_run_json)
+        sys.exit(0)
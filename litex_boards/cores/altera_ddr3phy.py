@@ -0,0 +1,257 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# 1:4 frequency-ratio DDR3 PHY for Intel/Altera FPGAs (MAX10, Cyclone V) built on DDIO registers.
+
+from functools import reduce
+from operator import or_
+
+from migen import *
+from migen.fhdl.specials import Tristate
+
+from litex.build.io import DDROutput, DDRInput, DifferentialOutput
+
+from litex.soc.interconnect.csr import *
+
+from litedram.common import *
+from litedram.phy.dfi import *
+
+# Serializer ---------------------------------------------------------------------------------------
+
+class _Serializer(Module):
+    """Serialize a sys word (4 DRAM clocks, oldest first) to sys4x: self.o holds the current clock."""
+    def __init__(self, i, load):
+        step   = len(i)//4
+        self.o = Signal(step)
+
+        # # #
+
+        sr = Signal(len(i))
+        self.sync.sys4x += If(load, sr.eq(i)).Else(sr.eq(sr[step:]))
+        self.comb += self.o.eq(sr[:step])
+
+# Altera DDR3 PHY ----------------------------------------------------------------------------------
+
+class AlteraDDR3PHY(Module, AutoCSR):
+    """DDR3 PHY for Intel/Altera FPGAs without hard memory PHY support in LiteDRAM.
+
+    The PHY runs at 1:4 (sys_clk_freq = DRAM clock/4) and serializes the DFI in logic to the DDIO
+    registers of the IOs, it requires the following clock domains (from the same PLL):
+    - sys4x:    DRAM clock (Commands, CK and DQS).
+    - sys4x_dq: DRAM clock with a 270° phase (DQ/DM, centered on the DQS edges).
+    - sys4x_rd: DRAM clock with a [0°, 180°) phase, used to capture the read data.
+
+    DQS is only used for writes: the read data is captured with sys4x_rd and aligned by the BIOS
+    read leveling (8 bitslips and 2 delays, the delay selecting the DDIO sample that starts a DRAM
+    clock, i.e. a half clock shift of the capture). Write leveling is not supported, so the DRAM
+    chips have to be close to the FPGA (as on the Terasic DECA/SoCKit), and since the DDIO registers
+    run in fabric clock domains, the DRAM clock is limited by the fabric timings (sys4x domains).
+    """
+    def __init__(self, pads, sys_clk_freq, cl=None, cwl=None):
+        memtype     = "DDR3"
+        phytype     = self.__class__.__name__
+        tck         = 1/(4*sys_clk_freq)
+        addressbits = len(pads.a)
+        bankbits    = len(pads.ba)
+        nranks      = 1 if not hasattr(pads, "cs_n") else len(pads.cs_n)
+        databits    = len(pads.dq)
+        strobes     = len(pads.dqs_p)
+        nphases     = 4
+        assert databits%8 == 0
+
+        # Parameters -------------------------------------------------------------------------------
+        cl              = get_default_cl( memtype, tck) if cl  is None else cl
+        cwl             = get_default_cwl(memtype, tck) if cwl is None else cwl
+        cl_sys_latency  = get_sys_latency(nphases, cl)
+        cwl_sys_latency = get_sys_latency(nphases, cwl)
+        rdphase         = get_sys_phase(nphases, cl_sys_latency,  cl)
+        wrphase         = get_sys_phase(nphases, cwl_sys_latency, cwl)
+
+        # Registers --------------------------------------------------------------------------------
+        self._rst     = CSRStorage()
+        self._dly_sel = CSRStorage(strobes)
+
+        self._rdly_dq_rst         = CSR()
+        self._rdly_dq_inc         = CSR()
+        self._rdly_dq_bitslip_rst = CSR()
+        self._rdly_dq_bitslip     = CSR()
+
+        self._rdphase = CSRStorage(2, reset=rdphase)
+        self._wrphase = CSRStorage(2, reset=wrphase)
+
+        # PHY settings -----------------------------------------------------------------------------
+        self.settings = PhySettings(
+            phytype       = phytype,
+            memtype       = memtype,
+            databits      = databits,
+            strobes       = strobes,
+            dfi_databits  = 2*databits,
+            nranks        = nranks,
+            nphases       = nphases,
+            rdphase       = self._rdphase.storage,
+            wrphase       = self._wrphase.storage,
+            cl            = cl,
+            cwl           = cwl,
+            read_latency  = cl_sys_latency + 6,
+            write_latency = cwl_sys_latency + 1,
+            read_leveling = True,
+            delays        = 2,
+            bitslips      = 8,
+        )
+
+        # DFI Interface ----------------------------------------------------------------------------
+        self.dfi = dfi = Interface(addressbits, bankbits, nranks, 2*databits, nphases)
+
+        # # #
+
+        # Serializers Load -------------------------------------------------------------------------
+        # sys and sys4x are phase aligned: the sys toggle is seen in sys4x one clock after the sys
+        # edge and the serializers are loaded 2 sys4x clocks after it (DFI registered twice below).
+        toggle   = Signal()
+        toggle_d = Signal(2)
+        load     = Signal()
+        self.sync       += toggle.eq(~toggle)
+        self.sync.sys4x += toggle_d.eq(Cat(toggle, toggle_d[0]))
+        self.comb       += load.eq(toggle_d[0] != toggle_d[1])
+
+        # Clock ------------------------------------------------------------------------------------
+        # CK rises in the middle of the sys4x clock: commands are centered on it.
+        for i in range(len(pads.clk_p)):
+            clk_se = Signal()
+            self.specials += DDROutput(i1=0, i2=1, o=clk_se, clk=ClockSignal("sys4x"))
+            self.specials += DifferentialOutput(clk_se, pads.clk_p[i], pads.clk_n[i])
+
+        # Commands ---------------------------------------------------------------------------------
+        commands = {
+            # Pad name: (DFI name,   Pad type (required or optional))
+            "reset_n" : ("reset_n", "optional"),
+            "cs_n"    : ("cs_n",    "optional"),
+            "a"       : ("address", "required"),
+            "ba"      : ("bank"   , "required"),
+            "ras_n"   : ("ras_n"  , "required"),
+            "cas_n"   : ("cas_n"  , "required"),
+            "we_n"    : ("we_n"   , "required"),
+            "cke"     : ("cke"    , "optional"),
+            "odt"     : ("odt"    , "optional"),
+        }
+        for pad_name, (dfi_name, pad_type) in commands.items():
+            pad = getattr(pads, pad_name, None)
+            if (pad is None):
+                if (pad_type == "required"):
+                    raise ValueError(f"DRAM pad {pad_name} required but not found in pads.")
+                continue
+            for i in range(len(pad)):
+                cmd = Signal(nphases)
+                cmd_d = Signal(nphases)
+                self.sync += [
+                    cmd.eq(Cat(*[getattr(dfi.phases[n], dfi_name)[i] for n in range(nphases)])),
+                    cmd_d.eq(cmd),
+                ]
+                cmd_ser = _Serializer(cmd_d, load)
+                self.submodules += cmd_ser
+                self.specials += DDROutput(i1=cmd_ser.o, i2=cmd_ser.o, o=pad[i], clk=ClockSignal("sys4x"))
+
+        # Write Control Path -----------------------------------------------------------------------
+        # A write burst always fills a sys clock (4 DRAM clocks), its data is registered once and its
+        # commands twice: wrdata_en[0] is the next burst, wrdata_en[1] the current one, wrdata_en[2]
+        # the previous one.
+        wrdata_en = TappedDelayLine(
+            signal = reduce(or_, [dfi.phases[i].wrdata_en for i in range(nphases)]),
+            ntaps  = cwl_sys_latency + 3
+        )
+        self.submodules += wrdata_en
+        wrdata_en = wrdata_en.taps[-3:]
+
+        # DQS/DQ are driven 1 DRAM clock before the burst (preamble) and 1 after it (postamble).
+        dqs_oe = Cat(wrdata_en[1] | wrdata_en[2], wrdata_en[1], wrdata_en[1], wrdata_en[1] | wrdata_en[0])
+        dq_oe  = Cat(wrdata_en[1] | wrdata_en[2], wrdata_en[1], wrdata_en[1], wrdata_en[1])
+        dqs_ser    = _Serializer(Replicate(wrdata_en[1], nphases), load)
+        dqs_oe_ser = _Serializer(dqs_oe, load)
+        dq_oe_ser  = _Serializer(dq_oe, load)
+        self.submodules += dqs_ser, dqs_oe_ser, dq_oe_ser
+
+        # DQS --------------------------------------------------------------------------------------
+        for i in range(strobes):
+            dqs_o    = Signal()
+            dqs_oe_r = Signal()
+            self.sync.sys4x += dqs_oe_r.eq(dqs_oe_ser.o)
+            # DQS rises with CK during the burst.
+            self.specials += DDROutput(i1=0, i2=dqs_ser.o, o=dqs_o, clk=ClockSignal("sys4x"))
+            self.specials += Instance("ALT_IOBUF_DIFF",
+                i_i      = dqs_o,
+                i_oe     = dqs_oe_r,
+                o_o      = Signal(),
+                io_io    = pads.dqs_p[i],
+                io_iobar = pads.dqs_n[i],
+            )
+
+        # DQ/DM ------------------------------------------------------------------------------------
+        # In sys4x_dq, the second beat of a DRAM clock is centered on the DQS rising edge: the data
+        # is delayed by one beat.
+        def wrdata_beats(name, width, i):
+            beats   = Signal(8)
+            beats_d = Signal(8)
+            self.sync += [
+                beats.eq(Cat(*[getattr(dfi.phases[n//2], name)[n%2*width + i] for n in range(8)])),
+                beats_d.eq(beats),
+            ]
+            return Cat(beats_d[7], beats[:7])
+
+        dq_dqs_ratio = databits//strobes
+        for i in range(databits//8):
+            dm_ser = _Serializer(wrdata_beats("wrdata_mask", databits//8, i), load)
+            self.submodules += dm_ser
+            self.specials += DDROutput(i1=dm_ser.o[0], i2=dm_ser.o[1], o=pads.dm[i], clk=ClockSignal("sys4x_dq"))
+
+        for i in range(databits):
+            dq_o    = Signal()
+            dq_oe_r = Signal()
+            dq_i    = Signal()
+            dq_ser  = _Serializer(wrdata_beats("wrdata", databits, i), load)
+            self.submodules += dq_ser
+            self.sync.sys4x_dq += dq_oe_r.eq(dq_oe_ser.o)
+            self.specials += DDROutput(i1=dq_ser.o[0], i2=dq_ser.o[1], o=dq_o, clk=ClockSignal("sys4x_dq"))
+            self.specials += Tristate(pads.dq[i], dq_o, dq_oe_r, dq_i)
+
+            # Read data: DDIO capture in sys4x_rd, 4:1 deserialization in sys4x then sys.
+            dly_sel  = self._dly_sel.storage[i//dq_dqs_ratio]
+            dq_i_h   = Signal()
+            dq_i_l   = Signal()
+            dq_i_dly = Signal()
+            dq_i_des = Signal(8)
+            dq_i_sys = Signal(8)
+            self.specials += DDRInput(i=dq_i, o1=dq_i_h, o2=dq_i_l, clk=ClockSignal("sys4x_rd"))
+            self.sync += [
+                If(self._rdly_dq_rst.re & dly_sel | self._rst.storage,
+                    dq_i_dly.eq(0)
+                ).Elif(self._rdly_dq_inc.re & dly_sel,
+                    dq_i_dly.eq(~dq_i_dly)
+                )
+            ]
+            self.sync.sys4x += [
+                If(dq_i_dly,
+                    dq_i_des.eq(Cat(dq_i_des[2:], dq_i_h, dq_i_l))
+                ).Else(
+                    dq_i_des.eq(Cat(dq_i_des[2:], dq_i_l, dq_i_h))
+                )
+            ]
+            self.sync += dq_i_sys.eq(dq_i_des)
+            dq_i_bitslip = BitSlip(8,
+                i      = dq_i_sys,
+                rst    = (self._rdly_dq_bitslip_rst.re & dly_sel) | self._rst.storage,
+                slp    = self._rdly_dq_bitslip.re & dly_sel,
+                cycles = 1)
+            self.submodules += dq_i_bitslip
+            for n in range(8):
+                self.comb += dfi.phases[n//2].rddata[n%2*databits+i].eq(dq_i_bitslip.o[n])
+
+        # Read Control Path ------------------------------------------------------------------------
+        rddata_en = TappedDelayLine(
+            signal = reduce(or_, [dfi.phases[i].rddata_en for i in range(nphases)]),
+            ntaps  = self.settings.read_latency
+        )
+        self.submodules += rddata_en
+
+        self.comb += [phase.rddata_valid.eq(rddata_en.output) for phase in dfi.phases]
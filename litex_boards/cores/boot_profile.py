@@ -0,0 +1,156 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+from litex.soc.interconnect import wishbone
+
+from litex.soc.cores.dma import WishboneDMAReader, WishboneDMAWriter
+
+from litex.soc.integration.soc import colorer
+
+# Boot Timer ---------------------------------------------------------------------------------------
+
+class BootTimer(Module, AutoCSR):
+    """Boot Timer
+
+    Free-running 64-bit sys_clk cycles counter started with the SoC (power-up/reset), used to
+    measure the boot time:
+    - Writing latch captures the counter in cycles (read by the firmware to time boot stages).
+    - Writing service captures the counter in service_cycles (time-to-service), only the first
+      write is kept so the host can read it at any time (0: service not reached yet).
+    """
+    def __init__(self):
+        self._latch          = CSR()
+        self._cycles         = CSRStatus(64, description="Cycles since power-up (latched).")
+        self._service        = CSR()
+        self._service_cycles = CSRStatus(64, description="Cycles from power-up to service.")
+
+        # # #
+
+        cycles = Signal(64)
+        self.sync += cycles.eq(cycles + 1)
+        self.sync += If(self._latch.re, self._cycles.status.eq(cycles))
+        self.sync += If(self._service.re & (self._service_cycles.status == 0),
+            self._service_cycles.status.eq(cycles)
+        )
+
+# Flash Boot DMA -----------------------------------------------------------------------------------
+
+class FlashBootDMA(Module, AutoCSR):
+    """Flash Boot DMA
+
+    Copies length bytes from src to dst with bus masters (typically from the SPI Flash to main_ram),
+    replacing the CPU copy loop: reads are issued back-to-back at sequential addresses, allowing
+    LiteSPI to keep its burst open, while writes are decoupled by a FIFO.
+
+    Addresses and length must be aligned on the bus data width. Writes go through the SoC bus (and
+    L2 Cache), only the CPU data cache has to be flushed after the copy.
+    """
+    def __init__(self, bus_read, bus_write, fifo_depth=16):
+        assert bus_read.data_width == bus_write.data_width
+        shift = log2_int(bus_read.data_width//8)
+
+        self.src    = CSRStorage(32, description="Source address (in bytes).")
+        self.dst    = CSRStorage(32, description="Destination address (in bytes).")
+        self.length = CSRStorage(32, description="Length (in bytes).")
+        self.start  = CSR()
+        self.done   = CSRStatus(description="Copy done.")
+        self.cycles = CSRStatus(32, description="Duration of the last copy (in sys_clk cycles).")
+
+        # # #
+
+        words     = Signal(32 - shift)
+        rd_offset = Signal(32 - shift)
+        wr_offset = Signal(32 - shift)
+        self.comb += words.eq(self.length.storage[shift:])
+
+        self.submodules.reader = reader = WishboneDMAReader(bus_read)
+        self.submodules.writer = writer = WishboneDMAWriter(bus_write)
+        self.submodules.fifo   = fifo   = stream.SyncFIFO([("data", bus_read.data_width)], fifo_depth, buffered=True)
+        self.comb += [
+            reader.source.connect(fifo.sink),
+            reader.sink.address.eq(self.src.storage[shift:] + rd_offset),
+            reader.sink.last.eq(rd_offset == (words - 1)),
+            writer.sink.address.eq(self.dst.storage[shift:] + wr_offset),
+            writer.sink.data.eq(fifo.source.data),
+        ]
+
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            self.done.status.eq(1),
+            If(self.start.re & (words != 0),
+                NextValue(rd_offset, 0),
+                NextValue(wr_offset, 0),
+                NextValue(self.cycles.status, 0),
+                NextState("RUN")
+            )
+        )
+        fsm.act("RUN",
+            NextValue(self.cycles.status, self.cycles.status + 1),
+            reader.sink.valid.eq(rd_offset != words),
+            If(reader.sink.valid & reader.sink.ready,
+                NextValue(rd_offset, rd_offset + 1)
+            ),
+            writer.sink.valid.eq(fifo.source.valid),
+            fifo.source.ready.eq(writer.sink.ready),
+            If(writer.sink.valid & writer.sink.ready,
+                NextValue(wr_offset, wr_offset + 1),
+                If(wr_offset == (words - 1),
+                    NextState("IDLE")
+                )
+            )
+        )
+
+# Boot Profile -------------------------------------------------------------------------------------
+
+boot_profiles = ["standard", "fast"]
+
+def add_boot_profile(soc, profile="standard", name="boot", flash_offset=None):
+    """Configure the BIOS/SoC for a boot profile.
+
+    - standard: LiteX BIOS defaults.
+    - fast:     No banner/build time/BIOS CRC, no SDRAM memtest, BootTimer and FlashBootDMA (when
+                a SPI Flash and main_ram are present). With flash_offset, the BIOS boots the image
+                at this SPI Flash offset directly.
+
+    Must be called once the SoC is elaborated (after BaseSoC creation), before the build.
+    """
+    assert profile in boot_profiles
+    if profile == "standard":
+        return
+
+    # BIOS (configs that can already be set by the SoC arguments, e.g. --no-ident-version).
+    for config in ["BIOS_NO_PROMPT", "BIOS_NO_BUILD_TIME", "BIOS_NO_CRC"]:
+        soc.add_config(config, check_duplicate=False)
+    if hasattr(soc, "sdram"):
+        soc.add_constant("SDRAM_TEST_DISABLE", check_duplicate=False)
+
+    # Boot Timer.
+    setattr(soc.submodules, f"{name}_timer", BootTimer())
+
+    # Flash Boot DMA.
+    if "spiflash" in soc.bus.regions.keys() and "main_ram" in soc.bus.regions.keys():
+        bus_read  = wishbone.Interface(data_width=soc.bus.data_width)
+        bus_write = wishbone.Interface(data_width=soc.bus.data_width)
+        soc.bus.add_master(name=f"{name}_dma_read",  master=bus_read)
+        soc.bus.add_master(name=f"{name}_dma_write", master=bus_write)
+        setattr(soc.submodules, f"{name}_dma", FlashBootDMA(bus_read, bus_write))
+        if flash_offset is not None:
+            soc.add_constant("FLASH_BOOT_ADDRESS", soc.bus.regions["spiflash"].origin + flash_offset)
+    elif flash_offset is not None:
+        soc.logger.warning("No SPI Flash/main_ram, {} flash boot {}.".format(colorer(name), colorer("skipped", color="yellow")))
+
+    soc.logger.info("{} profile {} {}.".format(
+        colorer(name),
+        colorer(profile),
+        colorer("added", color="green")))
+
+def boot_profile_args(parser):
+    boot_group = parser.add_argument_group(title="Boot Profile options")
+    boot_group.add_argument("--boot-profile",      default="standard", choices=boot_profiles, help="Boot profile (fast: no banner/memtest, boot timer, flash boot DMA).")
+    boot_group.add_argument("--boot-flash-offset", default=None,       type=lambda x: int(x, 0), help="SPI Flash offset of the boot image (fast profile).")
@@ -0,0 +1,165 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import json
+import time
+import tempfile
+
+from migen import Signal
+
+from litex.soc.integration.soc import colorer
+
+from litex.soc.cores.clock.xilinx_common import XilinxClocking
+from litex.soc.cores.clock.intel_common import IntelClocking
+from litex.soc.cores.clock import ECP5PLL, iCE40PLL, NXPLL
+
+# Clock Plans --------------------------------------------------------------------------------------
+
+_clocking_types = (XilinxClocking, IntelClocking, ECP5PLL, iCE40PLL, NXPLL)
+
+def _clocking_modules(module):
+    """Return the PLL/MMCM modules of a Module hierarchy (with their names)."""
+    for name, submodule in getattr(module, "_submodules", []):
+        if isinstance(submodule, _clocking_types):
+            yield name, submodule
+        yield from _clocking_modules(submodule)
+
+def clock_plan_key(pll):
+    """Return the clock plan key of a PLL: type, input frequency, requested outputs and margins."""
+    return json.dumps({
+        "type"       : type(pll).__name__,
+        "clkin_freq" : pll.clkin_freq,
+        "vco_margin" : getattr(pll, "vco_margin", 0),
+        "dpa_en"     : getattr(pll, "dpa_en", False),
+        # Requested outputs: (freq, phase, margin[, dpa]) (first element is the clock Signal).
+        "clkouts"    : [list(clkout[1:]) for n, clkout in sorted(pll.clkouts.items())],
+        # Device constraints (speedgrade dependent ranges).
+        "ranges"     : {k: getattr(pll, k) for k in sorted(dir(pll)) if k.endswith("_range")},
+    }, sort_keys=True)
+
+def clock_plan_outputs(pll, config):
+    """Return the [(n, requested freq, achieved freq, phase)] outputs of a PLL config."""
+    outputs = []
+    for n, clkout in sorted(pll.clkouts.items()):
+        freq = clkout[1]
+        if not freq:
+            continue # Feedback output.
+        achieved = None
+        for fmt in ["clkout{}_freq", "clko{}_freq", "clk{}_freq"]:
+            achieved = config.get(fmt.format(n), achieved)
+        if achieved is None:
+            achieved = config.get("clkout_freq", None) # iCE40PLL (single output).
+        phase = 0
+        for fmt in ["clkout{}_phase", "clko{}_phase", "clk{}_phase"]:
+            phase = config.get(fmt.format(n), phase)
+        outputs.append((n, freq, achieved, phase))
+    return outputs
+
+def clock_plan_pfd(pll, config):
+    """Return the PFD frequency of a PLL config (None if unknown)."""
+    if "divclk_divide" in config:
+        return pll.clkin_freq/config["divclk_divide"]
+    if "clki_div" in config:
+        return pll.clkin_freq/config["clki_div"]
+    if "divr" in config:
+        return pll.clkin_freq/(config["divr"] + 1)
+    if "m" in config:
+        return config["vco"]/config["m"]
+    return None
+
+class ClockPlanCache:
+    """Clock Plan Cache
+
+    Persists the PLL/MMCM configurations computed by the LiteX clocking modules in a JSON file,
+    keyed on (PLL type, input frequency, requested outputs/phases/margins, device ranges), so the
+    parameter search is only done once for all the targets/builds sharing the file. Each plan also
+    records the achieved vs requested output frequencies, making the clock choices auditable.
+
+    The PLL models have no jitter data: the PFD and VCO frequencies (the higher, the lower the
+    output jitter) are reported as jitter indicators.
+    """
+    def __init__(self, filename, logger=None):
+        self.filename = filename
+        self.logger   = logger
+        self.hits     = 0
+        self.misses   = 0
+
+    def load(self):
+        if os.path.exists(self.filename):
+            try:
+                return json.load(open(self.filename))
+            except ValueError:
+                pass
+        return {}
+
+    def store(self, key, plan):
+        # Merge with the file contents (shared between concurrent builds) and atomically replace it.
+        plans      = self.load()
+        plans[key] = plan
+        directory  = os.path.dirname(os.path.abspath(self.filename))
+        with tempfile.NamedTemporaryFile("w", dir=directory, delete=False) as f:
+            json.dump(plans, f, indent=2, sort_keys=True)
+        os.replace(f.name, self.filename)
+
+    def report(self, name, pll, plan, cached):
+        if self.logger is None:
+            return
+        pfd = plan["pfd"]
+        self.logger.info("Clock plan {} ({}, {}): VCO {:3.2f}MHz, PFD {}.".format(
+            colorer(name),
+            type(pll).__name__,
+            colorer("cached", color="green") if cached else colorer("computed", color="yellow"),
+            plan["config"]["vco"]/1e6,
+            "{:3.2f}MHz".format(pfd/1e6) if pfd is not None else "-"))
+        for n, requested, achieved, phase in plan["outputs"]:
+            self.logger.info("  ClkOut{}: requested {:3.2f}MHz, achieved {:3.2f}MHz ({:+.0f}ppm), phase {:3.2f}°.".format(
+                n, requested/1e6, achieved/1e6, (achieved - requested)/requested*1e6, phase))
+
+    def compute_config(self, name, pll, compute_config):
+        key    = clock_plan_key(pll)
+        plan   = self.load().get(key, None)
+        cached = plan is not None
+        if cached:
+            self.hits += 1
+            config = plan["config"]
+            # ECP5PLL: re-create the dedicated feedback output when the config uses one.
+            clkfb = config.get("clkfb", None)
+            if isinstance(pll, ECP5PLL) and clkfb is not None and clkfb not in pll.clkouts:
+                pll.clkouts[clkfb] = (Signal(), 0, 0, 0, 0)
+        else:
+            self.misses += 1
+            config = compute_config()
+            plan   = {
+                "type"    : type(pll).__name__,
+                "config"  : config,
+                "outputs" : clock_plan_outputs(pll, config),
+                "pfd"     : clock_plan_pfd(pll, config),
+                "date"    : time.strftime("%Y-%m-%dT%H:%M:%S"),
+            }
+            self.store(key, plan)
+        self.report(name, pll, plan, cached)
+        # Also record the config in pll.config (left empty by LiteX) for the cores reading it.
+        pll.config = dict(config)
+        return dict(config)
+
+def add_clock_plan_cache(soc, filename="clock_plans.json"):
+    """Use a shared on-disk cache for the PLL/MMCM configurations of a SoC (see ClockPlanCache)."""
+    cache = ClockPlanCache(filename, logger=soc.logger)
+    plls  = list(_clocking_modules(soc))
+    for name, pll in plls:
+        def compute_config(name=name, pll=pll, compute_config=pll.compute_config):
+            return cache.compute_config(name, pll, compute_config)
+        pll.compute_config = compute_config
+    soc.logger.info("{} ({} PLL(s), {}) {}.".format(
+        colorer("Clock plan cache"),
+        colorer(len(plls)),
+        colorer(filename),
+        colorer("added", color="green")))
+    return cache
+
+def clock_plan_args(parser):
+    clock_plan_group = parser.add_argument_group(title="Clock plan options")
+    clock_plan_group.add_argument("--clock-plan-cache", default=None, help="Clock plan (PLL/MMCM configs) cache file, shared between targets/builds.")
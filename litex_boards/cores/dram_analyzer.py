@@ -0,0 +1,275 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+from litex.soc.interconnect import wishbone
+
+from litex.soc.integration.soc import colorer
+
+# Note: LiteDRAM frontends and LiteScope are imported when the analyzer is created (not when the
+# targets import this module).
+
+# DRAM Storage -------------------------------------------------------------------------------------
+
+class _DRAMStorage(Module, AutoCSR):
+    """LiteScope storage in a DRAM ring buffer
+
+    Samples are packed in port data words and continuously written to the ring buffer through a
+    native LiteDRAM port; once triggered, capture continues for length - offset samples (rounded up
+    to a full port data word). The trigger register gives the ring index of the trigger sample, the
+    capture is then read directly from DRAM by the host.
+    """
+    def __init__(self, data_width, sample_width, port, base, depth, fifo_depth=64):
+        from litedram.frontend.dma import LiteDRAMDMAWriter
+        from litescope.core import core_layout
+
+        self.sink = sink = stream.Endpoint(core_layout(data_width))
+
+        self.enable    = CSRStorage()
+        self.done      = CSRStatus()
+
+        self.length    = CSRStorage(32)
+        self.offset    = CSRStorage(32)
+
+        self.mem_level = CSRStatus(32, description="Number of captured samples.")
+        self.trigger   = CSRStatus(32, description="Ring index of the trigger sample.")
+        self.overflow  = CSRStatus(description="Samples dropped (DRAM bandwidth exceeded).")
+
+        # # #
+
+        ratio = port.data_width//sample_width
+        assert ratio*sample_width == port.data_width
+        assert depth % ratio == 0
+        assert fifo_depth < depth//ratio
+
+        # Control.
+        enable   = Signal()
+        enable_d = Signal()
+        self.comb += enable.eq(self.enable.storage)
+        self.sync += enable_d.eq(enable)
+
+        # Packing / Buffering.
+        conv = stream.Converter(sample_width, port.data_width)
+        fifo = stream.SyncFIFO([("data", port.data_width)], fifo_depth, buffered=True)
+        self.submodules += conv, fifo
+        self.comb += conv.source.connect(fifo.sink)
+
+        # DMA.
+        self.submodules.writer = writer = LiteDRAMDMAWriter(port)
+        waddr = Signal(log2_int(depth//ratio))
+        self.comb += [
+            writer.sink.valid.eq(fifo.source.valid),
+            writer.sink.address.eq(base + waddr),
+            writer.sink.data.eq(fifo.source.data),
+            fifo.source.ready.eq(writer.sink.ready),
+        ]
+
+        # Capture.
+        capture = Signal()
+        count   = Signal(32)
+        post    = Signal(32)
+        # Port data words captured/written (same width, wrapping together: compared modulo 2*depth
+        # words, not derived from the sample counter that can wrap during a long wait).
+        words    = Signal(log2_int(depth//ratio) + 1)
+        written  = Signal(log2_int(depth//ratio) + 1)
+        word_end = Signal(reset=1)
+        if ratio > 1:
+            self.comb += word_end.eq(count[:log2_int(ratio)] == (ratio - 1))
+        self.comb += [
+            sink.ready.eq(1),
+            conv.sink.valid.eq(capture & sink.valid),
+            conv.sink.data.eq(sink.data),
+            self.mem_level.status.eq(count),
+        ]
+        self.sync += [
+            If(conv.sink.valid & conv.sink.ready,
+                count.eq(count + 1),
+                post.eq(post + 1),
+                If(word_end,
+                    words.eq(words + 1)
+                )
+            ),
+            If(conv.sink.valid & ~conv.sink.ready,
+                self.overflow.status.eq(1)
+            ),
+            If(writer.sink.valid & writer.sink.ready,
+                waddr.eq(waddr + 1)
+            ),
+            If(port.wdata.valid & port.wdata.ready,
+                written.eq(written + 1)
+            ),
+        ]
+
+        # Stop after length - offset samples, on a port data word boundary.
+        stop = Signal()
+        self.comb += stop.eq(post >= (self.length.storage - self.offset.storage))
+        if ratio > 1:
+            self.comb += If(count[:log2_int(ratio)] != 0, stop.eq(0))
+
+        # FSM.
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            self.done.status.eq(1),
+            If(enable & ~enable_d,
+                NextValue(count, 0),
+                NextValue(waddr, 0),
+                NextValue(words, 0),
+                NextValue(written, 0),
+                NextValue(self.overflow.status, 0),
+                NextState("WAIT")
+            )
+        )
+        fsm.act("WAIT",
+            capture.eq(1),
+            If(sink.valid & sink.hit & conv.sink.ready,
+                NextValue(self.trigger.status, count[:log2_int(depth)]),
+                NextValue(post, 1),
+                NextState("RUN")
+            )
+        )
+        fsm.act("RUN",
+            If(stop,
+                NextState("FLUSH")
+            ).Else(
+                capture.eq(1)
+            )
+        )
+        fsm.act("FLUSH",
+            If(written == words,
+                NextState("IDLE")
+            )
+        )
+
+# DRAM Analyzer ------------------------------------------------------------------------------------
+
+class LiteScopeDRAMAnalyzer(Module, AutoCSR):
+    """LiteScope Analyzer with DRAM storage
+
+    Same frontend (mux/trigger/subsampler) and CSRs as LiteScopeAnalyzer, so the LiteScope driver
+    can be used to configure it, but captures are stored in a ring buffer of depth samples in
+    DRAM (at base, a SoC bus address) and uploaded with bulk reads.
+    """
+    def __init__(self, groups, port, base, main_ram_base, depth, samplerate=1e12, trigger_depth=16,
+        fifo_depth=64, csr_csv="dram_analyzer.csv"):
+        from litescope.core import _Trigger, _SubSampler, _Mux, LiteScopeAnalyzer
+
+        self.groups     = groups = LiteScopeAnalyzer.format_groups(self, groups)
+        self.depth      = depth
+        self.samplerate = int(samplerate)
+
+        self.data_width   = data_width = max([sum([len(s) for s in g]) for g in groups.values()])
+        self.sample_width = sample_width = max(8, 2**bits_for(data_width - 1))
+        assert sample_width <= port.data_width
+        assert depth == 2**log2_int(depth, need_pow2=False)
+
+        self.base    = base
+        self.size    = depth*sample_width//8
+        self.csr_csv = csr_csv
+
+        # # #
+
+        # Create scope clock domain (the DRAM port is in the sys clock domain).
+        self.clock_domains.cd_scope = ClockDomain()
+        self.comb += self.cd_scope.clk.eq(ClockSignal("sys"))
+
+        # Mux
+        self.submodules.mux = _Mux(data_width, len(groups))
+        for i, signals in groups.items():
+            self.comb += [
+                self.mux.sinks[i].valid.eq(1),
+                self.mux.sinks[i].data.eq(Cat(signals))
+            ]
+
+        # Frontend
+        self.submodules.trigger    = _Trigger(data_width, depth=trigger_depth)
+        self.submodules.subsampler = _SubSampler(data_width)
+
+        # Storage
+        self.submodules.storage = _DRAMStorage(data_width, sample_width,
+            port       = port,
+            base       = (base - main_ram_base)//(port.data_width//8),
+            depth      = depth,
+            fifo_depth = fifo_depth)
+
+        # Pipeline
+        self.submodules.pipeline = stream.Pipeline(
+            self.mux.source,
+            self.trigger,
+            self.subsampler,
+            self.storage.sink)
+
+    def export_csv(self, vns, filename):
+        from litescope.core import LiteScopeAnalyzer
+        LiteScopeAnalyzer.export_csv(self, vns, filename)
+        with open(filename, "a") as f:
+            f.write("config,None,sample_width,{}\n".format(self.sample_width))
+            f.write("config,None,base,{}\n".format(self.base))
+
+    def do_exit(self, vns):
+        if self.csr_csv is not None:
+            self.export_csv(vns, self.csr_csv)
+
+# Probes -------------------------------------------------------------------------------------------
+
+def dram_analyzer_probes(soc, ports):
+    """Default probes: LiteDRAM ports (group 0) and SoC bus masters (group 1) handshakes."""
+    groups = {0: [], 1: []}
+    for port in ports:
+        groups[0] += [
+            port.cmd.valid,   port.cmd.ready,   port.cmd.we,
+            port.wdata.valid, port.wdata.ready,
+            port.rdata.valid, port.rdata.ready,
+        ]
+    for name, bus in soc.bus.masters.items():
+        if isinstance(bus, wishbone.Interface):
+            groups[1] += [bus.cyc, bus.stb, bus.ack, bus.we]
+    if not len(groups[1]):
+        groups.pop(1)
+    return groups
+
+def add_dram_analyzer(soc, name="dram_analyzer", depth=2**20, groups=None):
+    """Add a LiteScopeDRAMAnalyzer, with its ring buffer reserved at the top of main_ram.
+
+    The main_ram region is shrunk by the ring buffer size (so it is no longer used by the firmware
+    or OS), its decoding is unchanged and the ring buffer remains accessible from the SoC bus.
+    """
+    if not hasattr(soc, "sdram"):
+        soc.logger.warning("No SDRAM, {} {}.".format(colorer(name), colorer("skipped", color="yellow")))
+        return
+    ports = list(soc.sdram.crossbar.masters)
+    port  = soc.sdram.crossbar.get_port(mode="write")
+    if groups is None:
+        groups = dram_analyzer_probes(soc, ports)
+    main_ram = soc.bus.regions["main_ram"]
+    # Size ring buffer on the sample width.
+    data_width   = max([sum([len(s) for s in g]) for g in groups.values()])
+    sample_width = max(8, 2**bits_for(data_width - 1))
+    size         = depth*sample_width//8
+    assert size <= main_ram.size//2
+    analyzer = LiteScopeDRAMAnalyzer(groups,
+        port          = port,
+        base          = main_ram.origin + main_ram.size - size,
+        main_ram_base = main_ram.origin,
+        depth         = depth,
+        samplerate    = soc.sys_clk_freq,
+        csr_csv       = f"{name}.csv")
+    setattr(soc.submodules, name, analyzer)
+    main_ram.size -= size
+    soc.add_constant(f"{name.upper()}_BASE", analyzer.base)
+    soc.add_constant(f"{name.upper()}_SIZE", analyzer.size)
+    soc.logger.info("{} ({} samples of {}-bit @ 0x{:08x}, top of main_ram reserved) {}.".format(
+        colorer(name),
+        colorer(depth),
+        colorer(sample_width),
+        analyzer.base,
+        colorer("added", color="green")))
+
+def dram_analyzer_args(parser):
+    analyzer_group = parser.add_argument_group(title="DRAM Analyzer options")
+    analyzer_group.add_argument("--with-dram-analyzer",  action="store_true", help="Enable LiteScope Analyzer with DRAM storage (ring buffer at the top of main_ram).")
+    analyzer_group.add_argument("--dram-analyzer-depth", default=2**20, type=int, help="DRAM Analyzer depth (in samples, power of 2).")
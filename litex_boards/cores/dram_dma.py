@@ -0,0 +1,166 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+
+from litex.soc.integration.soc import colorer
+
+# Descriptor Layout --------------------------------------------------------------------------------
+
+_descriptor_layout = [
+    ("src",    32),
+    ("dst",    32),
+    ("length", 32),
+    ("value",  32),
+    ("mode",    1),
+]
+
+# DRAM DMA -----------------------------------------------------------------------------------------
+
+class DRAMDMA(Module, AutoCSR):
+    """DRAM memcpy/memset DMA
+
+    Copies (memcpy) or fills (memset) DRAM regions through native LiteDRAM ports at the controller's
+    data width, bypassing the CPU and the L2 Cache.
+
+    Descriptors (src/dst/length/value/mode) are written to the CSRs and queued by writing the push
+    field of the control register; they are then executed in order. Addresses are SoC bus addresses
+    in main_ram and addresses/length must be aligned on the port data width (in bytes). The done
+    register counts executed descriptors.
+    """
+    def __init__(self, read_port, write_port, base_address, fifo_depth=16, ndescriptors=16):
+        from litedram.frontend.dma import LiteDRAMDMAReader, LiteDRAMDMAWriter
+
+        assert read_port.data_width == write_port.data_width
+        data_width = read_port.data_width
+        shift      = log2_int(data_width//8)
+        aw         = read_port.address_width
+
+        self._src     = CSRStorage(32, description="Source address (memcpy), in bytes.")
+        self._dst     = CSRStorage(32, description="Destination address, in bytes.")
+        self._length  = CSRStorage(32, description="Length, in bytes.")
+        self._value   = CSRStorage(32, description="Fill value (memset), replicated on the data width.")
+        self._control = CSRStorage(fields=[
+            CSRField("mode", size=1, offset=0, values=[
+                ("``0b0``", "memcpy."),
+                ("``0b1``", "memset."),
+            ]),
+            CSRField("push", size=1, offset=1, pulse=True, description="Queue the descriptor."),
+        ])
+        self._status  = CSRStatus(fields=[
+            CSRField("busy",  size=1, offset=0, description="A descriptor is being executed."),
+            CSRField("level", size=bits_for(ndescriptors), offset=8, description="Queued descriptors."),
+        ])
+        self._done    = CSRStatus(32, description="Number of executed descriptors.")
+
+        # # #
+
+        # Descriptors FIFO.
+        self.submodules.descriptors = descriptors = stream.SyncFIFO(_descriptor_layout, ndescriptors)
+        self.comb += [
+            descriptors.sink.valid.eq(self._control.fields.push),
+            descriptors.sink.src.eq(self._src.storage),
+            descriptors.sink.dst.eq(self._dst.storage),
+            descriptors.sink.length.eq(self._length.storage),
+            descriptors.sink.value.eq(self._value.storage),
+            descriptors.sink.mode.eq(self._control.fields.mode),
+            self._status.fields.level.eq(descriptors.level),
+        ]
+
+        # DMAs.
+        self.submodules.reader = reader = LiteDRAMDMAReader(read_port,  fifo_depth=fifo_depth)
+        self.submodules.writer = writer = LiteDRAMDMAWriter(write_port, fifo_depth=fifo_depth)
+
+        # Engine.
+        src       = Signal(aw)
+        dst       = Signal(aw)
+        length    = Signal(aw + 1)
+        value     = Signal(32)
+        memset    = Signal()
+        rd_count  = Signal(aw + 1)
+        wr_count  = Signal(aw + 1)
+        wr_done   = Signal(aw + 1)
+
+        desc = descriptors.source
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            If(desc.valid,
+                desc.ready.eq(1),
+                NextValue(src,      (desc.src - base_address)[shift:]),
+                NextValue(dst,      (desc.dst - base_address)[shift:]),
+                NextValue(length,   desc.length[shift:]),
+                NextValue(value,    desc.value),
+                NextValue(memset,   desc.mode),
+                NextValue(rd_count, 0),
+                NextValue(wr_count, 0),
+                NextValue(wr_done,  0),
+                NextState("RUN")
+            )
+        )
+        fsm.act("RUN",
+            self._status.fields.busy.eq(1),
+            # Reads (memcpy).
+            reader.sink.valid.eq(~memset & (rd_count != length)),
+            reader.sink.address.eq(src + rd_count),
+            If(reader.sink.valid & reader.sink.ready,
+                NextValue(rd_count, rd_count + 1)
+            ),
+            # Writes.
+            If(memset,
+                writer.sink.valid.eq(wr_count != length),
+                writer.sink.data.eq(Replicate(value, max(1, data_width//32))[:data_width]),
+            ).Else(
+                writer.sink.valid.eq(reader.source.valid),
+                writer.sink.data.eq(reader.source.data),
+                reader.source.ready.eq(writer.sink.ready),
+            ),
+            writer.sink.address.eq(dst + wr_count),
+            If(writer.sink.valid & writer.sink.ready,
+                NextValue(wr_count, wr_count + 1)
+            ),
+            # Completion: all write data accepted by the controller.
+            If(write_port.wdata.valid & write_port.wdata.ready,
+                NextValue(wr_done, wr_done + 1)
+            ),
+            If(wr_done == length,
+                NextState("DONE")
+            )
+        )
+        fsm.act("DONE",
+            NextValue(self._done.status, self._done.status + 1),
+            NextState("IDLE")
+        )
+
+def add_dram_dma(soc, name="dram_dma", fifo_depth=16, ndescriptors=16, min_length=None):
+    """Add a DRAMDMA on two native ports of the LiteDRAM crossbar (at the controller data width).
+
+    min_length overrides the minimum transfer length of the firmware (default: 8 x L2 size).
+    """
+    if not hasattr(soc, "sdram"):
+        soc.logger.warning("No SDRAM, {} {}.".format(colorer(name), colorer("skipped", color="yellow")))
+        return
+    read_port  = soc.sdram.crossbar.get_port(mode="read")
+    write_port = soc.sdram.crossbar.get_port(mode="write")
+    dma = DRAMDMA(read_port, write_port,
+        base_address = soc.bus.regions["main_ram"].origin,
+        fifo_depth   = fifo_depth,
+        ndescriptors = ndescriptors)
+    setattr(soc.submodules, name, dma)
+    soc.add_constant(f"{name.upper()}_ALIGNMENT",    read_port.data_width//8)
+    soc.add_constant(f"{name.upper()}_DESCRIPTORS", ndescriptors)
+    if min_length is not None:
+        soc.add_constant(f"{name.upper()}_MIN_LENGTH", min_length)
+    soc.logger.info("{} ({}-bit) {}.".format(
+        colorer(name),
+        colorer(read_port.data_width),
+        colorer("added", color="green")))
+
+def dram_dma_args(parser):
+    dma_group = parser.add_argument_group(title="DRAM DMA options")
+    dma_group.add_argument("--with-dram-dma",       action="store_true",         help="Enable DRAM memcpy/memset DMA.")
+    dma_group.add_argument("--dram-dma-min-length", default=None, type=int,      help="Minimum DMA transfer length (in bytes, shorter ones done by the CPU, default: 8 x L2 size).")
@@ -0,0 +1,76 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import sys
+import json
+
+from litex.soc.integration import export
+from litex.soc.integration.soc import colorer
+
+# SoC Introspection --------------------------------------------------------------------------------
+
+def get_soc_map(soc):
+    """Return the memory regions, CSR/IRQ maps, requested resources and clock domains of a SoC.
+
+    The SoC is finalized (and its fragment elaborated to collect the clock domains) but no
+    Verilog/software is generated.
+    """
+    fragment = soc.get_fragment()
+    platform = soc.platform
+
+    # Memory regions, CSRs and constants (same format as the csr.json of the Builder).
+    d = json.loads(export.get_csr_json(
+        csr_regions = soc.csr_regions,
+        constants   = soc.constants,
+        mem_regions = soc.mem_regions))
+
+    # SoC.
+    d["soc"] = {
+        "platform"     : platform.name,
+        "device"       : platform.device,
+        "sys_clk_freq" : soc.sys_clk_freq,
+        "cpu_type"     : soc.cpu_type,
+        "cpu_variant"  : getattr(soc.cpu, "variant", None),
+    }
+
+    # IRQs.
+    d["irqs"] = dict(soc.irq.locs) if soc.irq.enabled else {}
+
+    # Platform resources.
+    d["resources"] = [{"name": resource[0], "number": resource[1]}
+        for resource, obj in platform.constraint_manager.matched]
+
+    # Clock domains (frequency from the period constraints when available).
+    clocks = getattr(platform.toolchain, "clocks", {})
+    d["clock_domains"] = {}
+    for cd in sorted(fragment.clock_domains, key=lambda cd: cd.name):
+        frequency = None
+        if cd.clk in clocks:
+            frequency = 1e9/clocks[cd.clk]
+        elif cd.name == "sys":
+            frequency = soc.sys_clk_freq
+        d["clock_domains"][cd.name] = {
+            "frequency" : frequency,
+            "reset"     : cd.rst is not None,
+        }
+
+    return d
+
+def soc_dry_run(soc, filename=None):
+    """Write the SoC map (see get_soc_map) as JSON to filename (or stdout)."""
+    contents = json.dumps(get_soc_map(soc), indent=4)
+    if filename is None:
+        sys.stdout.write(contents + "\n")
+    else:
+        with open(filename, "w") as f:
+            f.write(contents)
+        soc.logger.info("SoC map {} to {}.".format(
+            colorer("written", color="green"),
+            colorer(filename)))
+
+def dry_run_args(parser):
+    dry_run_group = parser.add_argument_group(title="Dry-run options")
+    dry_run_group.add_argument("--dry-run",      action="store_true", help="Only elaborate the SoC and export its maps as JSON (no Verilog/software generation).")
+    dry_run_group.add_argument("--dry-run-json", default=None,        help="Dry-run JSON file (default: stdout).")
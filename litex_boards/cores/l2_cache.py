@@ -0,0 +1,124 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import argparse
+
+from migen import *
+
+from litex.soc.interconnect.csr import *
+
+from litex.soc.integration.soc import colorer
+
+# L2 Cache Stats -----------------------------------------------------------------------------------
+
+class L2CacheStats(Module, AutoCSR):
+    """L2 Cache Statistics
+
+    Observes the master (SoC side) and slave (LiteDRAM side) buses of the L2 Cache created by
+    add_sdram and counts:
+    - accesses:   accesses to the L2 Cache.
+    - hits:       accesses served without accessing LiteDRAM.
+    - misses:     accesses that required a line refill from LiteDRAM.
+    - writebacks: dirty lines written back to LiteDRAM.
+    - stalls:     cycles an access was waiting for the L2 Cache.
+
+    Counters are cleared by writing the reset field of the control register.
+    """
+    def __init__(self, cache):
+        self._control    = CSRStorage(fields=[
+            CSRField("reset", size=1, offset=0, pulse=True, description="Write ``1`` to clear counters."),
+        ])
+        self._accesses   = CSRStatus(32, description="Number of accesses to the L2 Cache.")
+        self._hits       = CSRStatus(32, description="Number of L2 Cache hits.")
+        self._misses     = CSRStatus(32, description="Number of L2 Cache misses (line refills).")
+        self._writebacks = CSRStatus(32, description="Number of L2 Cache writebacks.")
+        self._stalls     = CSRStatus(32, description="Number of cycles spent waiting for the L2 Cache.")
+
+        # # #
+
+        master = cache.master
+        slave  = cache.slave
+
+        master_access = Signal()
+        master_done   = Signal()
+        refill        = Signal()
+        writeback     = Signal()
+        self.comb += [
+            master_access.eq(master.cyc & master.stb),
+            master_done.eq(master_access & master.ack),
+            refill.eq(   slave.cyc & slave.stb & slave.ack & ~slave.we),
+            writeback.eq(slave.cyc & slave.stb & slave.ack &  slave.we),
+        ]
+
+        # Remember if the current access required a refill (a writeback can precede it).
+        refilled = Signal()
+        self.sync += [
+            If(master_done,
+                refilled.eq(0)
+            ).Elif(refill,
+                refilled.eq(1)
+            )
+        ]
+
+        # Counters.
+        def counter(csr, inc):
+            return If(self._control.fields.reset,
+                csr.status.eq(0)
+            ).Elif(inc,
+                csr.status.eq(csr.status + 1)
+            )
+        self.sync += [
+            counter(self._accesses,   master_done),
+            counter(self._hits,       master_done & ~(refilled | refill)),
+            counter(self._misses,     master_done &  (refilled | refill)),
+            counter(self._writebacks, writeback),
+            counter(self._stalls,     master_access & ~master.ack),
+        ]
+
+def add_l2_cache_stats(soc, name="l2_cache_stats"):
+    """Add L2CacheStats to the L2 Cache created by add_sdram (if any)."""
+    if not hasattr(soc, "l2_cache"):
+        soc.logger.warning("No L2 Cache, {} {}.".format(colorer(name), colorer("skipped", color="yellow")))
+        return
+    setattr(soc.submodules, name, L2CacheStats(soc.l2_cache))
+    soc.logger.info("{} {}.".format(colorer(name), colorer("added", color="green")))
+
+# L2 Cache Profile ---------------------------------------------------------------------------------
+
+def parse_l2_profile(profile):
+    """Parse a L2 Cache profile: size[:min_data_width[:full_memory_we]] (ex: 16384:256:0)."""
+    fields = profile.split(":")
+    if not (1 <= len(fields) <= 3):
+        raise ValueError("Invalid L2 profile {}, expected size[:min_data_width[:full_memory_we]].".format(profile))
+    r = {"l2_size": int(fields[0], 0)}
+    if len(fields) > 1:
+        r["l2_min_data_width"] = int(fields[1], 0)
+    if len(fields) > 2:
+        r["l2_full_memory_we"] = bool(int(fields[2], 0))
+    return r
+
+class _L2ProfileAction(argparse.Action):
+    def __call__(self, parser, namespace, values, option_string=None):
+        try:
+            profile = parse_l2_profile(values)
+        except ValueError as e:
+            parser.error(str(e))
+        setattr(namespace, self.dest, values)
+        # The size also drives --l2-size, which is already passed to the targets by soc_core_argdict.
+        namespace.l2_size = profile["l2_size"]
+
+def l2_cache_args(parser):
+    l2_group = parser.add_argument_group(title="L2 Cache options")
+    l2_group.add_argument("--l2-profile",    default=None, action=_L2ProfileAction, help="L2 Cache profile: size[:min_data_width[:full_memory_we]] (ex: 16384:256:0).")
+    l2_group.add_argument("--with-l2-stats", action="store_true",                   help="Enable L2 Cache statistics (accesses/hits/misses/writebacks/stalls).")
+
+def l2_cache_argdict(args):
+    r = dict()
+    if args.l2_profile is not None:
+        r.update(parse_l2_profile(args.l2_profile))
+        r.pop("l2_size") # Already provided by soc_core_argdict.
+    if args.with_l2_stats:
+        r["with_l2_stats"] = True
+    return r
@@ -0,0 +1,172 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import re
+import json
+import time
+import shutil
+import hashlib
+import subprocess
+
+from concurrent.futures import ThreadPoolExecutor
+
+from litex.soc.integration.soc import colorer
+
+# NextPNR Multi-Seed -------------------------------------------------------------------------------
+
+_fmax_re = re.compile(r"Max frequency for clock\s+'([^']+)':\s+([\d.]+) MHz \((?:PASS|FAIL) at ([\d.]+) MHz\)")
+
+def _seed_fmax(seed_dir):
+    """Return {clock: (achieved, constraint)} (MHz) of a nextpnr run (JSON report or log)."""
+    report = os.path.join(seed_dir, "report.json")
+    if os.path.exists(report):
+        try:
+            fmax = json.load(open(report)).get("fmax", {})
+            return {clk: (v["achieved"], v["constraint"]) for clk, v in fmax.items()}
+        except (ValueError, KeyError):
+            pass
+    fmax = {}
+    log  = os.path.join(seed_dir, "nextpnr.log")
+    if os.path.exists(log):
+        # Last report of the log (post-routing).
+        for m in _fmax_re.finditer(open(log, errors="ignore").read()):
+            fmax[m.group(1)] = (float(m.group(2)), float(m.group(3)))
+    return fmax
+
+def _seed_score(fmax):
+    """Worst achieved/constraint ratio over the clocks (> 1.0: timing met)."""
+    if not fmax:
+        return 0.0
+    return min(achieved/constraint for achieved, constraint in fmax.values())
+
+class NextPNRMultiSeed:
+    """Run the nextpnr step of a Yosys/NextPNR build with several seeds in parallel.
+
+    Yosys and the packer are run once, nextpnr is run for each seed in its own directory and the
+    result with the best worst-clock Fmax margin is kept. Results are recorded in a JSON history
+    (per target, device and nextpnr options, not per netlist: good seeds tend to remain good across
+    small design changes) and the best known seeds are tried first on the next builds.
+    """
+    def __init__(self, toolchain, seeds=4, jobs=None, history=None, logger=None):
+        self.toolchain = toolchain
+        self.seeds     = seeds
+        self.jobs      = jobs or seeds
+        self.history   = history
+        self.logger    = logger
+
+    def load_history(self):
+        if self.history is not None and os.path.exists(self.history):
+            return json.load(open(self.history))
+        return {}
+
+    def select_seeds(self, key):
+        runs  = sorted(self.load_history().get(key, []), key=lambda r: r["score"], reverse=True)
+        seeds = []
+        for r in runs:
+            if r["seed"] not in seeds:
+                seeds.append(r["seed"])
+        seeds = seeds[:self.seeds//2]
+        seed  = 1
+        while len(seeds) < self.seeds:
+            if seed not in seeds:
+                seeds.append(seed)
+            seed += 1
+        return seeds
+
+    def record(self, key, results):
+        if self.history is None:
+            return
+        history = self.load_history()
+        for seed, fmax, score in results:
+            history.setdefault(key, []).append({
+                "seed"  : seed,
+                "score" : score,
+                "fmax"  : {clk: achieved for clk, (achieved, constraint) in fmax.items()},
+                "date"  : time.strftime("%Y-%m-%dT%H:%M:%S"),
+            })
+        with open(self.history, "w") as f:
+            json.dump(history, f, indent=2)
+
+    def run_script(self, script):
+        lines = [l for l in open(script).read().split("\n") if l.strip() and not l.startswith("#") and l != "set -e"]
+        pnr   = [i for i, l in enumerate(lines) if l.startswith("nextpnr-")]
+        if len(pnr) != 1:
+            raise OSError("Unable to find nextpnr call in {}.".format(script))
+        pnr = pnr[0]
+        run = lambda cmd, **kwargs: subprocess.call(["bash", "-e", "-c", cmd], **kwargs)
+
+        # Synthesis.
+        for cmd in lines[:pnr]:
+            if run(cmd) != 0:
+                raise OSError("Error occured during Yosys's script execution.")
+
+        # History key from the target and the nextpnr command (device, constraints, options).
+        pnr_cmd = re.sub(r"\s--seed\s+\d+", "", lines[pnr])
+        key     = self.toolchain._build_name + "-" + hashlib.sha256(pnr_cmd.encode()).hexdigest()[:16]
+
+        # Place and Route (one directory per seed, outputs redirected).
+        outputs = re.findall(r"--(?:textcfg|asc|fasm|bit)\s+(\S+)", pnr_cmd)
+        def place_and_route(seed):
+            seed_dir = f"seed{seed}"
+            os.makedirs(seed_dir, exist_ok=True)
+            cmd = pnr_cmd
+            for output in outputs:
+                cmd = cmd.replace(f" {output}", f" {os.path.join(seed_dir, output)}")
+            cmd += f" --seed {seed} --report {seed_dir}/report.json --log {seed_dir}/nextpnr.log"
+            if run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) != 0:
+                return seed, {}, -1.0
+            fmax = _seed_fmax(seed_dir)
+            return seed, fmax, _seed_score(fmax)
+        seeds = self.select_seeds(key)
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            results = list(executor.map(place_and_route, seeds))
+        self.record(key, [r for r in results if r[2] >= 0])
+
+        # Keep best result.
+        seed, fmax, score = max(results, key=lambda r: r[2])
+        if score < 0:
+            raise OSError("Error occured during Nextpnr's script execution (all seeds failed).")
+        for output in outputs:
+            shutil.copy(os.path.join(f"seed{seed}", output), output)
+        if self.logger is not None:
+            for s, f, sc in results:
+                self.logger.info("Seed {}: {}{}.".format(
+                    colorer(s),
+                    ", ".join("{} {:.2f}MHz".format(clk, achieved) for clk, (achieved, _) in f.items()) or "failed",
+                    colorer(" (selected)", color="green") if s == seed else ""))
+
+        # Packer.
+        for cmd in lines[pnr + 1:]:
+            if run(cmd) != 0:
+                raise OSError("Error occured during packer's script execution.")
+
+def add_nextpnr_multi_seed(soc, seeds=4, jobs=None, history="nextpnr_seeds.json"):
+    """Run the nextpnr step of Yosys/NextPNR builds with several seeds in parallel (see NextPNRMultiSeed).
+
+    history is relative to the gateware directory when not absolute.
+    """
+    toolchain = soc.platform.toolchain
+    if not hasattr(toolchain, "_nextpnr"):
+        soc.logger.warning("Not a Yosys/NextPNR toolchain, {} {}.".format(
+            colorer("nextpnr multi-seed"),
+            colorer("skipped", color="yellow")))
+        return
+    multi_seed = NextPNRMultiSeed(toolchain,
+        seeds   = seeds,
+        jobs    = jobs,
+        history = history,
+        logger  = soc.logger)
+    toolchain.run_script = multi_seed.run_script
+    soc.logger.info("{} ({} seeds) {}.".format(
+        colorer("nextpnr multi-seed"),
+        colorer(seeds),
+        colorer("added", color="green")))
+
+def nextpnr_seeds_args(parser):
+    seeds_group = parser.add_argument_group(title="NextPNR Multi-Seed options")
+    seeds_group.add_argument("--nextpnr-seeds",         default=1,    type=int,        help="Number of nextpnr seeds run in parallel (best Fmax kept).")
+    seeds_group.add_argument("--nextpnr-seeds-jobs",    default=None, type=int,        help="Parallel nextpnr runs (default: number of seeds).")
+    seeds_group.add_argument("--nextpnr-seeds-history", default="nextpnr_seeds.json",  help="Seed/Fmax history file (relative to the gateware directory).")
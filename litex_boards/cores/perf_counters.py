@@ -0,0 +1,115 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import re
+
+from migen import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import wishbone
+from litex.soc.interconnect import axi
+
+from litex.soc.integration.soc import colorer
+
+# Bus Taps -----------------------------------------------------------------------------------------
+
+def _bus_tap(bus):
+    """Return (active, transfer, wait) Signals/expressions for a SoC bus or LiteDRAM native port."""
+    # Wishbone.
+    if isinstance(bus, wishbone.Interface):
+        active   = bus.cyc & bus.stb
+        transfer = active & bus.ack
+        wait     = active & ~bus.ack
+    # AXI / AXI-Lite.
+    elif isinstance(bus, (axi.AXIInterface, axi.AXILiteInterface)):
+        active   = bus.aw.valid | bus.w.valid | bus.b.valid | bus.ar.valid | bus.r.valid
+        transfer = (bus.w.valid & bus.w.ready) | (bus.r.valid & bus.r.ready)
+        wait     = ((bus.aw.valid & ~bus.aw.ready) |
+                    (bus.w.valid  & ~bus.w.ready)  |
+                    (bus.ar.valid & ~bus.ar.ready))
+    # LiteDRAM native port.
+    elif hasattr(bus, "cmd") and hasattr(bus, "rdata") and hasattr(bus, "wdata"):
+        active   = bus.cmd.valid | bus.wdata.valid | bus.rdata.valid
+        transfer = (bus.wdata.valid & bus.wdata.ready) | (bus.rdata.valid & bus.rdata.ready)
+        wait     = bus.cmd.valid & ~bus.cmd.ready
+    else:
+        raise ValueError("Unsupported bus {} for performance counters.".format(bus))
+    return active, transfer, wait
+
+# Performance Counters -----------------------------------------------------------------------------
+
+class PerfCounters(Module, AutoCSR):
+    """Bus Performance Counters
+
+    Free-running 32-bit counters for each tapped bus:
+    - active:    cycles with an access in progress (utilization).
+    - transfers: data beats transferred.
+    - waits:     cycles an access was stalled by the interconnect/slave (wait-states/contention).
+
+    Writing the snapshot register latches all counters (and the cycles counter) at the same cycle,
+    the host then computes utilization from the deltas between two snapshots (modulo 2^32).
+    """
+    def __init__(self, taps):
+        self._snapshot = CSR()
+        self._cycles   = CSRStatus(32, description="Cycles counter (snapshot).")
+
+        # # #
+
+        cycles = Signal(32)
+        self.sync += cycles.eq(cycles + 1)
+        self.sync += If(self._snapshot.re, self._cycles.status.eq(cycles))
+
+        self.taps = []
+        for name, bus in taps:
+            active, transfer, wait = _bus_tap(bus)
+            for field, inc in [("active", active), ("transfers", transfer), ("waits", wait)]:
+                counter = Signal(32)
+                csr     = CSRStatus(32, name=f"{name}_{field}")
+                setattr(self, f"_{name}_{field}", csr)
+                self.sync += [
+                    If(inc, counter.eq(counter + 1)),
+                    If(self._snapshot.re, csr.status.eq(counter)),
+                ]
+            self.taps.append(name)
+
+def _tap_name(prefix, name):
+    return prefix + re.sub(r"[^a-z0-9_]", "_", str(name).lower())
+
+def add_perf_counters(soc, name="perf_counters", with_masters=True, with_slaves=True, with_sdram_ports=True):
+    """Add PerfCounters tapping the SoC bus masters/slaves and LiteDRAM crossbar ports.
+
+    Must be called once the SoC is elaborated (after BaseSoC creation), before the build.
+    """
+    taps = []
+    if with_masters:
+        taps += [(_tap_name("m_", n), bus) for n, bus in soc.bus.masters.items()]
+    if with_slaves:
+        taps += [(_tap_name("s_", n), bus) for n, bus in soc.bus.slaves.items()]
+    if with_sdram_ports and hasattr(soc, "sdram"):
+        taps += [(_tap_name("p", n), port) for n, port in enumerate(soc.sdram.crossbar.masters)]
+
+    # Skip the buses that can't be tapped (other bus standards).
+    supported = []
+    for tap_name, bus in taps:
+        try:
+            _bus_tap(bus)
+        except ValueError:
+            soc.logger.warning("Unsupported bus {}, {} tap {}.".format(
+                colorer(tap_name),
+                colorer(name),
+                colorer("skipped", color="yellow")))
+            continue
+        supported.append((tap_name, bus))
+    taps = supported
+
+    setattr(soc.submodules, name, PerfCounters(taps))
+    soc.logger.info("{} ({} taps) {}.".format(
+        colorer(name),
+        colorer(len(taps)),
+        colorer("added", color="green")))
+
+def perf_counters_args(parser):
+    perf_group = parser.add_argument_group(title="Performance Counters options")
+    perf_group.add_argument("--with-perf-counters", action="store_true", help="Enable bus performance counters (SoC bus masters/slaves, LiteDRAM ports).")
@@ -0,0 +1,107 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.soc.interconnect.csr import *
+
+from litex.soc.integration.soc import colorer
+
+# SDRAM PHY Calibration Shadow ---------------------------------------------------------------------
+
+# (name, reset CSR, increment CSR) of the per-module delays/bitslips set by the leveling.
+_calibration_counters = [
+    ("rdly_dq",         "_rdly_dq_rst",         "_rdly_dq_inc"),
+    ("rdly_dq_bitslip", "_rdly_dq_bitslip_rst", "_rdly_dq_bitslip"),
+    ("wdly_dq",         "_wdly_dq_rst",         "_wdly_dq_inc"),
+    ("wdly_dqs",        "_wdly_dqs_rst",        "_wdly_dqs_inc"),
+    ("wdly_dq_bitslip", "_wdly_dq_bitslip_rst", "_wdly_dq_bitslip"),
+]
+
+class SDRAMPHYCalibrationShadow(Module, AutoCSR):
+    """SDRAM PHY Calibration Shadow
+
+    The PHY delays/bitslips are only controlled with reset/increment strobes, so the result of the
+    BIOS leveling can't be read back from the PHY. This module follows the strobes (and the module
+    selection) to maintain the number of increments since the last reset of each delay/bitslip,
+    allowing the firmware to save the calibration and restore it later by replaying the increments
+    (modulo the PHY delays/bitslips).
+
+    Counters of the module selected with sel are exposed on the status registers.
+    """
+    def __init__(self, phy, counter_width=16):
+        modules = len(phy._dly_sel.storage)
+
+        self.sel = CSRStorage(bits_for(modules - 1), description="Module selection.")
+        if hasattr(phy, "_cdly_rst"):
+            self.cdly = CSRStatus(counter_width, description="Command delay increments.")
+
+        # # #
+
+        # Command delay (global).
+        if hasattr(phy, "_cdly_rst"):
+            self.sync += [
+                If(phy._cdly_rst.re,
+                    self.cdly.status.eq(0)
+                ).Elif(phy._cdly_inc.re,
+                    self.cdly.status.eq(self.cdly.status + 1)
+                )
+            ]
+
+        # Per-module delays/bitslips.
+        self.counters = []
+        for name, rst, inc in _calibration_counters:
+            if not (hasattr(phy, rst) and hasattr(phy, inc)):
+                continue
+            rst = getattr(phy, rst)
+            inc = getattr(phy, inc)
+            counters = Array(Signal(counter_width) for _ in range(modules))
+            for m in range(modules):
+                self.sync += [
+                    If(phy._dly_sel.storage[m],
+                        If(rst.re,
+                            counters[m].eq(0)
+                        ).Elif(inc.re,
+                            counters[m].eq(counters[m] + 1)
+                        )
+                    )
+                ]
+            csr = CSRStatus(counter_width, name=name, description=f"{name} increments of selected module.")
+            setattr(self, f"_{name}", csr)
+            self.comb += csr.status.eq(counters[self.sel.storage])
+            self.counters.append(name)
+
+def add_sdram_calib_cache(soc, name="sdram_calib", temperature_band=10):
+    """Add a SDRAMPHYCalibrationShadow and the constants used by the calibration cache firmware.
+
+    The calibration record is stored in the last sector of the SPI Flash.
+    """
+    if not hasattr(soc, "ddrphy") or not hasattr(soc.ddrphy, "_dly_sel"):
+        soc.logger.warning("No leveling capable SDRAM PHY, {} {}.".format(colorer(name), colorer("skipped", color="yellow")))
+        return
+    if "spiflash" not in soc.bus.regions.keys():
+        soc.logger.warning("No SPI Flash, {} {}.".format(colorer(name), colorer("skipped", color="yellow")))
+        return
+    if not hasattr(soc.spiflash_core, "master"):
+        soc.logger.warning("No SPI Flash master, {} calibration can't be saved.".format(colorer(name)))
+    # Calibration key: DNA and XADC temperature on 7-Series devices.
+    if soc.platform.device.startswith("xc7"):
+        if not hasattr(soc, "dna"):
+            from litex.soc.cores.dna import DNA
+            soc.submodules.dna = DNA()
+            soc.dna.add_timing_constraints(soc.platform, soc.sys_clk_freq, soc.crg.cd_sys.clk)
+        if not hasattr(soc, "xadc"):
+            from litex.soc.cores.xadc import XADC
+            soc.submodules.xadc = XADC()
+    setattr(soc.submodules, name, SDRAMPHYCalibrationShadow(soc.ddrphy))
+    soc.add_constant(f"{name.upper()}_FLASH_OFFSET", soc.bus.regions["spiflash"].size - 4096)
+    soc.add_constant(f"{name.upper()}_TEMPERATURE_BAND", temperature_band)
+    soc.logger.info("{} {}.".format(
+        colorer(name),
+        colorer("added", color="green")))
+
+def sdram_calib_args(parser):
+    calib_group = parser.add_argument_group(title="SDRAM Calibration Cache options")
+    calib_group.add_argument("--with-sdram-calib-cache", action="store_true", help="Enable SDRAM calibration cache in SPI Flash (requires --with-spi-flash).")
@@ -0,0 +1,147 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.soc.interconnect.csr import *
+
+from litex.soc.integration.soc import colorer
+
+from litex.soc.cores.clock import ECP5PLL, CycloneIVPLL, Cyclone10LPPLL, Max10PLL
+
+_supported_plls = (ECP5PLL, CycloneIVPLL, Cyclone10LPPLL, Max10PLL)
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def record_pll_config(pll):
+    """Record the config computed at the PLL finalization in pll.config (left empty by LiteX)."""
+    compute_config = pll.compute_config
+    def record_config():
+        pll.config = compute_config()
+        return pll.config
+    pll.compute_config = record_config
+
+# SDRAM Clock Phase --------------------------------------------------------------------------------
+
+class SDRAMClockPhase(Module, AutoCSR):
+    """SDRAM Clock Phase
+
+    Dynamic phase shift of the PLL output generating the SDR SDRAM clock, allowing the firmware to
+    sweep the clock phase at boot, find the valid window with a memtest and lock-in its center.
+
+    Supported PLLs:
+    - ECP5PLL: PHASESEL/PHASEDIR/PHASESTEP interface (DPHASE_SOURCE enabled).
+    - CycloneIVPLL/Cyclone10LPPLL/Max10PLL: ALTPLL PHASECOUNTERSELECT/PHASEUPDOWN/PHASESTEP
+      interface (SCANCLK from sys).
+
+    In both cases a step shifts the output by 1/8 of the VCO period. Writing step issues a step in
+    the direction set by direction (1: delay, 0: advance), done is set once the PLL completed it.
+    The number of steps per period and the initial phase (in steps) are read from the PLL config
+    once finalized.
+    """
+    def __init__(self, pll, clkout, pulse_cycles=8, settle_cycles=64):
+        assert isinstance(pll, _supported_plls)
+        self.pll    = pll
+        self.clkout = clkout
+
+        self.direction = CSRStorage(description="Step direction (1: delay, 0: advance).")
+        self.step      = CSR()
+        self.done      = CSRStatus(description="Step done.")
+        self.steps     = CSRStatus(16, description="Number of steps per clock period.")
+        self.initial   = CSRStatus(16, description="Initial phase (in steps).")
+
+        # # #
+
+        record_pll_config(pll)
+
+        phase_step = Signal()
+        phase_done = Signal(reset=1)
+
+        # ECP5PLL.
+        if isinstance(pll, ECP5PLL):
+            pll.expose_dpa()
+            self.comb += [
+                pll.phase_sel.eq((clkout - 1)%4), # CLKOP: 3, CLKOS: 0, CLKOS2: 1, CLKOS3: 2.
+                pll.phase_dir.eq(~self.direction.storage),
+                pll.phase_step.eq(phase_step),
+                pll.phase_load.eq(0),
+            ]
+        # ALTPLL.
+        elif isinstance(pll, (CycloneIVPLL, Cyclone10LPPLL, Max10PLL)):
+            pll.params.update(
+                p_PORT_PHASECOUNTERSELECT = "PORT_USED",
+                p_PORT_PHASEUPDOWN        = "PORT_USED",
+                p_PORT_PHASESTEP          = "PORT_USED",
+                p_PORT_PHASEDONE          = "PORT_USED",
+                p_PORT_SCANCLK            = "PORT_USED",
+                i_PHASECOUNTERSELECT      = 0b010 + clkout, # C0: 0b010, C1: 0b011, ...
+                i_PHASEUPDOWN             = self.direction.storage,
+                i_PHASESTEP               = phase_step,
+                i_SCANCLK                 = ClockSignal("sys"),
+                o_PHASEDONE               = phase_done,
+            )
+
+        # Step FSM.
+        count = Signal(max=max(pulse_cycles, settle_cycles) + 1)
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            self.done.status.eq(1),
+            NextValue(count, pulse_cycles - 1),
+            If(self.step.re,
+                NextState("PULSE")
+            )
+        )
+        fsm.act("PULSE",
+            phase_step.eq(1),
+            NextValue(count, count - 1),
+            If(count == 0,
+                NextValue(count, settle_cycles - 1),
+                NextState("SETTLE")
+            )
+        )
+        fsm.act("SETTLE",
+            NextValue(count, count - 1),
+            If((count == 0) & phase_done,
+                NextState("IDLE")
+            )
+        )
+
+    def do_finalize(self):
+        # PLL config is computed at its finalization (no-op if already finalized).
+        self.pll.finalize()
+        config = self.pll.config
+        n      = self.clkout
+        freq   = config.get(f"clko{n}_freq", config.get(f"clk{n}_freq"))
+        phase  = self.pll.clkouts[n][2]
+        steps  = 8*round(config["vco"]/freq)
+        self.comb += [
+            self.steps.status.eq(steps),
+            self.initial.status.eq(round(phase*steps/360)%steps),
+        ]
+
+def add_sdram_phase_calib(soc, name="sdram_phase"):
+    """Add a SDRAMClockPhase on the SDR SDRAM clock PLL output.
+
+    The CRG exposes the PLL and output generating the SDRAM clock as sdram_pll/sdram_pll_clkout.
+    """
+    if not hasattr(soc, "sdram"):
+        soc.logger.warning("No SDRAM, {} {}.".format(colorer(name), colorer("skipped", color="yellow")))
+        return
+    pll = getattr(soc.crg, "sdram_pll", None)
+    if not isinstance(pll, _supported_plls):
+        soc.logger.warning("No SDRAM clock PLL with dynamic phase shift, {} {}.".format(
+            colorer(name), colorer("skipped", color="yellow")))
+        return
+    n = soc.crg.sdram_pll_clkout
+    setattr(soc.submodules, name, SDRAMClockPhase(pll, n))
+    soc.logger.info("{} ({}, ClkOut{}) {}.".format(
+        colorer(name),
+        type(pll).__name__,
+        n,
+        colorer("added", color="green")))
+
+def sdram_phase_args(parser):
+    phase_group = parser.add_argument_group(title="SDRAM Clock Phase options")
+    phase_group.add_argument("--with-sdram-phase-calib", action="store_true", help="Enable SDR SDRAM clock phase calibration at boot (PLL dynamic phase shift).")
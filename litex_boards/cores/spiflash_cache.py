@@ -0,0 +1,155 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import wishbone
+
+from litex.soc.integration.soc import colorer
+
+# SPI Flash Cache ----------------------------------------------------------------------------------
+
+class SPIFlashCache(Module, AutoCSR):
+    """SPI Flash XIP Cache
+
+    Read-only direct-mapped cache in front of the memory-mapped SPI Flash for code executed in
+    place. Misses refill a whole line with consecutive 32-bit reads that the LiteSPI MMAP merges
+    into a single SPI burst, so the command/address/dummy phases are only paid once per line instead
+    of once per word. Writes are acknowledged and ignored (the Flash is written through the LiteSPI
+    master).
+
+    The cache is invalidated with the flush CSR or the flush signal (connected by
+    add_spi_flash_cache to the LiteSPI master when present: the cache is then invalidated at the end
+    of each master transfer, so Flash writes/erases are never hidden by stale lines).
+
+    Accesses/Misses counters allow measuring the efficiency of the cache on a given firmware.
+    """
+    def __init__(self, slave, size=4*1024, line_size=16):
+        assert line_size in [4, 8, 16, 32, 64]
+        assert size >= line_size
+        self.bus   = bus = wishbone.Interface()
+        self.flush = Signal()
+
+        self._flush    = CSR() # Write to invalidate the cache.
+        self._accesses = CSRStatus(32, description="Number of accesses to the SPI Flash.")
+        self._misses   = CSRStatus(32, description="Number of line refills from the SPI Flash.")
+
+        # # #
+
+        nlines     = size//line_size
+        offsetbits = log2_int(line_size//4)
+        linebits   = log2_int(nlines)
+        tagbits    = len(bus.adr) - linebits - offsetbits
+        adr_offset = bus.adr[:offsetbits]
+        adr_line   = bus.adr[offsetbits:offsetbits + linebits]
+        adr_tag    = bus.adr[offsetbits + linebits:]
+
+        # Line refills as 32-bit consecutive accesses.
+        line_bus = wishbone.Interface(data_width=8*line_size)
+        self.submodules.converter = wishbone.Converter(line_bus, slave)
+        self.comb += [
+            line_bus.adr.eq(bus.adr[offsetbits:]),
+            line_bus.sel.eq(2**(line_size)-1),
+        ]
+
+        # Data/Tag memories (tags are initialized as invalid).
+        data_mem  = Memory(8*line_size, nlines)
+        data_port = data_mem.get_port(write_capable=True)
+        tag_mem   = Memory(tagbits + 1, nlines)
+        tag_port  = tag_mem.get_port(write_capable=True)
+        self.specials += data_mem, data_port, tag_mem, tag_port
+        tag_valid = tag_port.dat_r[-1]
+        tag_tag   = tag_port.dat_r[:-1]
+
+        flush_line = Signal(linebits)
+        self.comb += [
+            data_port.adr.eq(adr_line),
+            data_port.dat_w.eq(line_bus.dat_r),
+            tag_port.adr.eq(adr_line),
+            tag_port.dat_w.eq(Cat(adr_tag, 1)),
+            bus.dat_r.eq(Array(data_port.dat_r[32*n:32*(n + 1)] for n in range(line_size//4))[adr_offset]),
+        ]
+
+        # Flush requests are kept pending until the end of the current access.
+        flush_pending = Signal()
+        flush_clear   = Signal()
+        self.sync += [
+            If(self.flush | self._flush.re,
+                flush_pending.eq(1)
+            ).Elif(flush_clear,
+                flush_pending.eq(0)
+            )
+        ]
+
+        # Control FSM.
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            If(flush_pending,
+                flush_clear.eq(1),
+                NextValue(flush_line, 0),
+                NextState("FLUSH")
+            ).Elif(bus.cyc & bus.stb,
+                NextState("TEST-HIT")
+            )
+        )
+        fsm.act("TEST-HIT",
+            If(bus.we | (tag_valid & (tag_tag == adr_tag)),
+                bus.ack.eq(1),
+                NextState("IDLE")
+            ).Else(
+                NextState("REFILL")
+            )
+        )
+        fsm.act("REFILL",
+            line_bus.stb.eq(1),
+            line_bus.cyc.eq(1),
+            line_bus.we.eq(0),
+            If(line_bus.ack,
+                data_port.we.eq(1),
+                tag_port.we.eq(1),
+                NextState("TEST-HIT")
+            )
+        )
+        fsm.act("FLUSH",
+            tag_port.adr.eq(flush_line),
+            tag_port.dat_w.eq(0),
+            tag_port.we.eq(1),
+            NextValue(flush_line, flush_line + 1),
+            If(flush_line == (nlines - 1),
+                NextState("IDLE")
+            )
+        )
+
+        # Counters.
+        self.sync += [
+            If(bus.cyc & bus.stb & bus.ack,
+                self._accesses.status.eq(self._accesses.status + 1)
+            ),
+            If(line_bus.cyc & line_bus.stb & line_bus.ack,
+                self._misses.status.eq(self._misses.status + 1)
+            )
+        ]
+
+def add_spi_flash_cache(soc, name="spiflash", size=4*1024, line_size=16):
+    """Insert a SPIFlashCache between the SoC bus and a SPI Flash added with add_spi_flash."""
+    slave = soc.bus.slaves.pop(name)
+    cache = SPIFlashCache(slave, size=size, line_size=line_size)
+    setattr(soc.submodules, name + "_cache", cache)
+    soc.bus.slaves[name] = cache.bus
+
+    # Invalidate the cache at the end of each LiteSPI master transfer (Flash writes/erases).
+    master = getattr(getattr(soc, name + "_core", None), "master", None)
+    if master is not None:
+        master_cs_d = Signal(len(master.cs))
+        soc.sync += master_cs_d.eq(master.cs)
+        soc.comb += cache.flush.eq((master_cs_d & ~master.cs) != 0)
+
+    soc.logger.info("{} Cache ({} bytes, {} bytes lines{}) {}.".format(
+        colorer(name),
+        colorer(size),
+        colorer(line_size),
+        ", flushed on master transfers" if master is not None else "",
+        colorer("added", color="green")))
@@ -0,0 +1,133 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+
+from litex.soc.cores.xadc import XADC
+
+# Telemetry XADC -----------------------------------------------------------------------------------
+
+class TelemetryXADC(XADC):
+    """7-Series XADC with VAUX channels added to its sequence
+
+    The VAUX channels are enabled in the sequencer registers (INIT_49) and averaged with the
+    internal channels when averaging is set (INIT_4B).
+    """
+    def __init__(self, analog_pads=None, vaux=(), averaging=True):
+        XADC.__init__(self, analog_pads)
+        mask = 0
+        for channel in vaux:
+            mask |= (1 << channel)
+        xadc = [s for s in self._fragment.specials if isinstance(s, Instance) and s.of == "XADC"][0]
+        for item in xadc.items:
+            if isinstance(item, Instance.Parameter):
+                if item.name == "INIT_49":
+                    item.value = Constant(mask, 16)
+                if item.name == "INIT_4B" and averaging:
+                    item.value = Constant(mask, 16)
+
+# System Monitor Telemetry -------------------------------------------------------------------------
+
+_record_layout = [
+    ("timestamp", 40),
+    ("value",     16),
+    ("channel",    8),
+]
+
+class SystemMonitorTelemetry(Module, AutoCSR):
+    """System Monitor (XADC/SYSMON) Telemetry
+
+    Continuously records the System Monitor conversions in a FIFO as timestamped records that are
+    streamed to the host. Every period (in sys_clk cycles), one full sequence of conversions is
+    recorded (from a temperature conversion to the next one), each record being:
+
+    - word 0: timestamp[31:0] (sys_clk cycles).
+    - word 1: raw value[15:0] | channel[23:16] | timestamp[39:32].
+
+    The records are read from the data register (2 reads per record, lower word first, each read
+    pops a word); level gives the number of records available. Records are dropped when the FIFO
+    is full (dropped register) and conversions are not recorded while the DRP is used by the CPU.
+    """
+    def __init__(self, sysmon, fifo_depth=512):
+        self.enable  = CSRStorage(description="Enable telemetry.")
+        self.period  = CSRStorage(32, reset=100000, description="Recording period (in sys_clk cycles).")
+        self.level   = CSRStatus(bits_for(fifo_depth), description="Records available.")
+        self.data    = CSRStatus(32, description="Record data (each read pops a 32-bit word).")
+        self.dropped = CSRStatus(32, description="Dropped records.")
+
+        # # #
+
+        # Timestamp.
+        timestamp = Signal(40)
+        self.sync += timestamp.eq(timestamp + 1)
+
+        # Period.
+        timer   = Signal(32)
+        pending = Signal()
+        self.sync += [
+            If(~self.enable.storage,
+                timer.eq(0),
+                pending.eq(0),
+            ).Elif(timer >= self.period.storage,
+                timer.eq(0),
+                pending.eq(1),
+            ).Else(
+                timer.eq(timer + 1),
+            )
+        ]
+
+        # Conversions (in auto-sampling mode, DRP address is the converted channel).
+        conversion = Signal()
+        first      = Signal()
+        capture    = Signal()
+        self.comb += [
+            conversion.eq(sysmon.drdy & ~sysmon.drp_en),
+            first.eq(sysmon.dadr == 0), # Temperature.
+        ]
+        self.sync += [
+            If(conversion & first,
+                capture.eq(pending),
+                If(pending, pending.eq(0))
+            ),
+            If(~self.enable.storage,
+                capture.eq(0)
+            )
+        ]
+
+        # FIFO.
+        self.submodules.fifo = fifo = stream.SyncFIFO(_record_layout, fifo_depth, buffered=True)
+        self.comb += [
+            fifo.sink.valid.eq(conversion & Mux(first, pending, capture)),
+            fifo.sink.timestamp.eq(timestamp),
+            fifo.sink.value.eq(sysmon.do),
+            fifo.sink.channel.eq(sysmon.dadr),
+            self.level.status.eq(fifo.level),
+        ]
+        self.sync += If(fifo.sink.valid & ~fifo.sink.ready,
+            self.dropped.status.eq(self.dropped.status + 1)
+        )
+
+        # Readout.
+        conv = stream.Converter(64, 32)
+        self.submodules += conv
+        self.comb += [
+            fifo.source.connect(conv.sink, omit={"timestamp", "value", "channel"}),
+            conv.sink.data.eq(Cat(
+                fifo.source.timestamp[:32],
+                fifo.source.value,
+                fifo.source.channel,
+                fifo.source.timestamp[32:])),
+            conv.source.ready.eq(self.data.we),
+            self.data.status.eq(conv.source.data),
+        ]
+
+def add_telemetry(soc, sysmon, name="telemetry", labels=None, fifo_depth=512):
+    """Add a SystemMonitorTelemetry, labels ({channel: label}) are exported as constants."""
+    setattr(soc.submodules, name, SystemMonitorTelemetry(sysmon, fifo_depth=fifo_depth))
+    for channel, label in (labels or {}).items():
+        soc.add_constant(f"{name.upper()}_CHANNEL{channel}", label)
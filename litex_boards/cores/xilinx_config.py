@@ -0,0 +1,91 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import re
+
+from litex.soc.integration.soc import colorer
+
+# Xilinx Fast Configuration ------------------------------------------------------------------------
+
+# Bitstream properties set by the fast configuration (existing platform values are replaced).
+_fast_config_properties = [
+    "BITSTREAM.GENERAL.COMPRESS",
+    "BITSTREAM.CONFIG.CONFIGRATE",
+    "BITSTREAM.CONFIG.EXTMASTERCCLK_EN",
+    "BITSTREAM.CONFIG.SPI_BUSWIDTH",
+    "BITSTREAM.CONFIG.SPI_FALL_EDGE",
+    "BITSTREAM.CONFIG.SPI_32BIT_ADDR",
+]
+
+# 7-Series internal CCLK (CONFIGRATE, MHz): nominal rate whose -50%/+50% tolerance stays below the
+# SPI Fast Read frequency of the Flash parts used on the boards (>= 80MHz), data being sampled on
+# the falling edge.
+_xc7_configrate = 50
+
+def _flash_config(platform):
+    """Return the (SPI width, size in MB) of the configuration Flash from the platform write_cfgmem."""
+    for command in getattr(platform.toolchain, "additional_commands", []):
+        m = re.search(r"write_cfgmem.*-interface spix(\d) -size (\d+)", command)
+        if m is not None:
+            return int(m.group(1)), int(m.group(2))
+    return None
+
+def add_xilinx_fast_config(soc, compress=True, configrate=None, emcclk_div=None):
+    """Configure the Vivado bitstream for the fastest safe configuration from SPI Flash.
+
+    Applies to 7-Series platforms with a known configuration Flash (platforms providing a
+    write_cfgmem command): compressed bitstream, fast internal CCLK (or external EMCCLK with
+    emcclk_div, requires an oscillator on the EMCCLK pin), SPI width of the Flash (x1/x2/x4/x8),
+    32-bit addressing for Flashes > 16MB and a matching write_cfgmem command.
+    """
+    platform = soc.platform
+    name     = "fast_config"
+    if not hasattr(platform.toolchain, "bitstream_commands"):
+        soc.logger.warning("Not a Vivado toolchain, {} {}.".format(colorer(name), colorer("skipped", color="yellow")))
+        return
+    if not platform.device.startswith("xc7"):
+        soc.logger.warning("Not a 7-Series device, {} {}.".format(colorer(name), colorer("skipped", color="yellow")))
+        return
+    flash = _flash_config(platform)
+    if flash is None:
+        soc.logger.warning("No known configuration Flash, {} {}.".format(colorer(name), colorer("skipped", color="yellow")))
+        return
+    width, size = flash
+
+    # Bitstream properties.
+    properties = {}
+    if compress:
+        properties["BITSTREAM.GENERAL.COMPRESS"] = "TRUE"
+    if emcclk_div is not None:
+        properties["BITSTREAM.CONFIG.EXTMASTERCCLK_EN"] = f"div-{emcclk_div}"
+    else:
+        properties["BITSTREAM.CONFIG.CONFIGRATE"] = str(_xc7_configrate if configrate is None else configrate)
+    properties["BITSTREAM.CONFIG.SPI_BUSWIDTH"]  = str(width)
+    properties["BITSTREAM.CONFIG.SPI_FALL_EDGE"] = "YES"
+    if size > 16:
+        properties["BITSTREAM.CONFIG.SPI_32BIT_ADDR"] = "YES"
+    commands = [c for c in platform.toolchain.bitstream_commands
+        if not any(p in c for p in _fast_config_properties)]
+    for k, v in properties.items():
+        commands.append(f"set_property {k} {v} [current_design]")
+    platform.toolchain.bitstream_commands = commands
+
+    # Flash image.
+    commands = [c for c in platform.toolchain.additional_commands if "write_cfgmem" not in c]
+    commands.append(f"write_cfgmem -force -format bin -interface spix{width} -size {size} "
+        "-loadbit \"up 0x0 {build_name}.bit\" -file {build_name}.bin")
+    platform.toolchain.additional_commands = commands
+
+    soc.logger.info("{} (SPI x{}, {}) {}.".format(
+        colorer(name),
+        colorer(width),
+        colorer("EMCCLK/{}".format(emcclk_div) if emcclk_div is not None else "CCLK {}MHz".format(properties["BITSTREAM.CONFIG.CONFIGRATE"])),
+        colorer("added", color="green")))
+
+def xilinx_config_args(parser):
+    config_group = parser.add_argument_group(title="Xilinx Configuration options")
+    config_group.add_argument("--with-fast-config",  action="store_true",          help="Enable compressed bitstream and fast SPI Flash configuration.")
+    config_group.add_argument("--config-rate",       default=None, type=int,       help="Internal CCLK rate (in MHz, default: fastest safe rate).")
+    config_group.add_argument("--config-emcclk-div", default=None, type=int,       help="Use external EMCCLK with this divider (requires an EMCCLK oscillator).")
@@ -242,9 +242,9 @@ _connectors = [
         "vsns5v0_n"  : "B12",
         "vsns5v0_p"  : "C12",
         "isns5v0_n"  : "F14",
-        "isns5v0_n"  : "F13",
+        "isns5v0_p"  : "F13",
         "isns0v95_n" : "A16",
-        "isns0v95_n" : "A15",
+        "isns0v95_p" : "A15",
         } ),
 ]
 
@@ -332,6 +332,23 @@ def numato_sdcard_pmod_io(pmod):
 ]
 _numato_sdcard_pmod_io = numato_sdcard_pmod_io("pmodd") # SDCARD PMOD on JD.
 
+# XADC Power Measurements --------------------------------------------------------------------------
+
+_xadc_power_io = [
+    # VAUX1: vsns5v0, VAUX2: vsnsvu, VAUX9: isns5v0, VAUX10: isns0v95.
+    ("xadc_power", 0,
+        Subsignal("vsns5v0_p",  Pins("XADC:vsns5v0_p")),
+        Subsignal("vsns5v0_n",  Pins("XADC:vsns5v0_n")),
+        Subsignal("vsnsvu_p",   Pins("XADC:vsnsuv_p")),
+        Subsignal("vsnsvu_n",   Pins("XADC:vsnsuv_n")),
+        Subsignal("isns5v0_p",  Pins("XADC:isns5v0_p")),
+        Subsignal("isns5v0_n",  Pins("XADC:isns5v0_n")),
+        Subsignal("isns0v95_p", Pins("XADC:isns0v95_p")),
+        Subsignal("isns0v95_n", Pins("XADC:isns0v95_n")),
+        IOStandard("LVCMOS33"),
+    ),
+]
+
 # Platform -----------------------------------------------------------------------------------------
 
 class Platform(XilinxPlatform):
@@ -87,9 +87,10 @@ _io = [
     ),
 
     # Shared camera control signals
-    ("cam_ctrl",
+    ("cam_ctrl", 0,
         Subsignal("cam_reset", Pins("T1")),
         Subsignal("cam_frame_sync", Pins("U1")),
+        IOStandard("LVCMOS18H")
     ),
 
     # HyperRAM
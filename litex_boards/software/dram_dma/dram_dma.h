@@ -0,0 +1,148 @@
+/*
+ * This file is part of LiteX-Boards.
+ *
+ * SPDX-License-Identifier: BSD-2-Clause
+ *
+ * DRAM memcpy/memset DMA firmware library (header only).
+ *
+ * Drives the DRAMDMA core added with --with-dram-dma. Aligned bodies are transferred by the DMA
+ * (through native LiteDRAM ports), unaligned heads/tails, non main_ram regions and transfers
+ * shorter than DRAM_DMA_MIN_LENGTH with the CPU.
+ *
+ * Coherency: before each transfer, dirty L2 lines are written back by reading a L2-sized region
+ * that does not overlap the destination (the L2 Cache is direct-mapped), so no stale destination
+ * line can remain in L2 after the transfer. CPU data caches are flushed before/after the transfer.
+ */
+
+#ifndef __DRAM_DMA_H
+#define __DRAM_DMA_H
+
+#include <stdint.h>
+#include <string.h>
+
+#include <system.h>
+
+#include <generated/soc.h>
+#include <generated/csr.h>
+#include <generated/mem.h>
+
+#ifdef CSR_DRAM_DMA_BASE
+
+#define DRAM_DMA_MEMCPY 0
+#define DRAM_DMA_MEMSET 1
+
+/* Shorter transfers are done with the CPU: each DMA transfer reads a L2-sized region and flushes
+ * the CPU data caches. Can be set with --dram-dma-min-length (or defined before the include). */
+#ifndef DRAM_DMA_MIN_LENGTH
+#ifdef CONFIG_L2_SIZE
+#define DRAM_DMA_MIN_LENGTH (8*CONFIG_L2_SIZE)
+#else
+#define DRAM_DMA_MIN_LENGTH 4096
+#endif
+#endif
+
+static inline int dram_dma_in_main_ram(uintptr_t addr, size_t len)
+{
+	return (addr >= MAIN_RAM_BASE) && ((addr + len) <= (MAIN_RAM_BASE + MAIN_RAM_SIZE));
+}
+
+/* Returns 0 when no main_ram region can be used (the transfer must then be done with the CPU). */
+static inline int dram_dma_l2_writeback(uintptr_t dst, size_t len)
+{
+#ifdef CONFIG_L2_SIZE
+	uintptr_t region = MAIN_RAM_BASE;
+	unsigned int i;
+	/* Use a L2-sized region of main_ram not overlapping the destination. */
+	if (dst < (MAIN_RAM_BASE + CONFIG_L2_SIZE))
+		region = (dst + len + CONFIG_L2_SIZE - 1) & ~((uintptr_t) CONFIG_L2_SIZE - 1);
+	if ((region + CONFIG_L2_SIZE) > (MAIN_RAM_BASE + MAIN_RAM_SIZE))
+		return 0;
+	for (i = 0; i < CONFIG_L2_SIZE/4; i++)
+		((volatile uint32_t *) region)[i];
+#endif
+	return 1;
+}
+
+static inline void dram_dma_submit(int mode, uintptr_t dst, uintptr_t src, uint32_t value, size_t len)
+{
+	/* Wait for a free descriptor. */
+	while (((dram_dma_status_read() >> CSR_DRAM_DMA_STATUS_LEVEL_OFFSET) &
+		((1 << CSR_DRAM_DMA_STATUS_LEVEL_SIZE) - 1)) >= DRAM_DMA_DESCRIPTORS);
+	dram_dma_src_write(src);
+	dram_dma_dst_write(dst);
+	dram_dma_length_write(len);
+	dram_dma_value_write(value);
+	dram_dma_control_write(
+		(mode << CSR_DRAM_DMA_CONTROL_MODE_OFFSET) |
+		(1    << CSR_DRAM_DMA_CONTROL_PUSH_OFFSET));
+}
+
+static inline int dram_dma_idle(void)
+{
+	uint32_t status = dram_dma_status_read();
+	/* No queued descriptor and no descriptor being executed. */
+	return (((status >> CSR_DRAM_DMA_STATUS_LEVEL_OFFSET) & ((1 << CSR_DRAM_DMA_STATUS_LEVEL_SIZE) - 1)) == 0) &&
+	       (((status >> CSR_DRAM_DMA_STATUS_BUSY_OFFSET)  & 1) == 0);
+}
+
+static inline void dram_dma_wait(void)
+{
+	while (!dram_dma_idle());
+	flush_cpu_dcache();
+}
+
+/* Returns 0 when the transfer can't be done by the DMA (see dram_dma_l2_writeback). */
+static inline int dram_dma_run(int mode, uintptr_t dst, uintptr_t src, uint32_t value, size_t len)
+{
+	flush_cpu_dcache();
+	if (!dram_dma_l2_writeback(dst, len))
+		return 0;
+	dram_dma_submit(mode, dst, src, value, len);
+	dram_dma_wait();
+	return 1;
+}
+
+static inline void *dram_dma_memcpy(void *dst, const void *src, size_t len)
+{
+	uintptr_t d = (uintptr_t) dst;
+	uintptr_t s = (uintptr_t) src;
+	size_t head, body;
+
+	/* DMA only when both regions are in main_ram and can be aligned together. */
+	if (!dram_dma_in_main_ram(d, len) || !dram_dma_in_main_ram(s, len) ||
+	    ((d - s) % DRAM_DMA_ALIGNMENT) != 0 ||
+	    (d < s + len && s < d + len) ||
+	    len < DRAM_DMA_MIN_LENGTH || len < 2*DRAM_DMA_ALIGNMENT)
+		return memcpy(dst, src, len);
+
+	head = (DRAM_DMA_ALIGNMENT - (d % DRAM_DMA_ALIGNMENT)) % DRAM_DMA_ALIGNMENT;
+	body = (len - head) & ~((size_t) DRAM_DMA_ALIGNMENT - 1);
+	memcpy(dst, src, head);
+	if (!dram_dma_run(DRAM_DMA_MEMCPY, d + head, s + head, 0, body))
+		memcpy((char *) dst + head, (const char *) src + head, body);
+	memcpy((char *) dst + head + body, (const char *) src + head + body, len - head - body);
+	return dst;
+}
+
+static inline void *dram_dma_memset(void *dst, int c, size_t len)
+{
+	uintptr_t d = (uintptr_t) dst;
+	uint32_t value = (c & 0xff) * 0x01010101;
+	size_t head, body;
+
+	if (!dram_dma_in_main_ram(d, len) ||
+	    len < DRAM_DMA_MIN_LENGTH || len < 2*DRAM_DMA_ALIGNMENT)
+		return memset(dst, c, len);
+
+	head = (DRAM_DMA_ALIGNMENT - (d % DRAM_DMA_ALIGNMENT)) % DRAM_DMA_ALIGNMENT;
+	body = (len - head) & ~((size_t) DRAM_DMA_ALIGNMENT - 1);
+	memset(dst, c, head);
+	if (!dram_dma_run(DRAM_DMA_MEMSET, d + head, 0, value, body))
+		memset((char *) dst + head, c, body);
+	memset((char *) dst + head + body, c, len - head - body);
+	return dst;
+}
+
+#endif /* CSR_DRAM_DMA_BASE */
+
+#endif /* __DRAM_DMA_H */
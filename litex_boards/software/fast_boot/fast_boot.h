@@ -0,0 +1,113 @@
+/*
+ * This file is part of LiteX-Boards.
+ *
+ * SPDX-License-Identifier: BSD-2-Clause
+ *
+ * Fast boot firmware library (header only).
+ *
+ * Uses the BootTimer/FlashBootDMA cores added with --boot-profile=fast to copy a boot image from
+ * the SPI Flash to main_ram with the DMA (CPU word copy otherwise), verify it in RAM and jump to
+ * it, reporting the boot time from power-up.
+ *
+ * Boot image format (same as the BIOS flashboot): length (32-bit), CRC32 (32-bit), data.
+ */
+
+#ifndef __FAST_BOOT_H
+#define __FAST_BOOT_H
+
+#include <stdint.h>
+#include <stdio.h>
+
+#include <system.h>
+#include <libbase/crc.h>
+
+#include <generated/soc.h>
+#include <generated/csr.h>
+#include <generated/mem.h>
+
+#ifdef CSR_BOOT_TIMER_BASE
+
+/* Boot Timer. */
+
+static inline uint64_t boot_timer_read(void)
+{
+	boot_timer_latch_write(1);
+	return boot_timer_cycles_read();
+}
+
+static inline uint32_t boot_timer_us(uint64_t cycles)
+{
+	return cycles/(CONFIG_CLOCK_FREQUENCY/1000000);
+}
+
+static inline void boot_timer_report(const char *stage)
+{
+	printf("%s: %u us\n", stage, (unsigned int) boot_timer_us(boot_timer_read()));
+}
+
+/* Mark the time-to-service (first call only is recorded, readable by the host). */
+static inline void boot_timer_service(void)
+{
+	boot_timer_service_write(1);
+}
+
+/* Copy. */
+
+static inline void fast_boot_copy(uintptr_t dst, uintptr_t src, uint32_t len)
+{
+#ifdef CSR_BOOT_DMA_BASE
+	boot_dma_src_write(src);
+	boot_dma_dst_write(dst);
+	boot_dma_length_write(len & ~3);
+	boot_dma_start_write(1);
+	while (!boot_dma_done_read());
+	flush_cpu_dcache();
+	dst += len & ~3;
+	src += len & ~3;
+	len &= 3;
+#endif
+	while (len >= 4) {
+		*(volatile uint32_t *) dst = *(volatile uint32_t *) src;
+		dst += 4;
+		src += 4;
+		len -= 4;
+	}
+	while (len--)
+		*(volatile uint8_t *) dst++ = *(volatile uint8_t *) src++;
+}
+
+/* Boot. */
+
+/* Copy the boot image at flash_addr to ram_addr, returns its length or -1 if invalid. */
+static inline int fast_boot_load(uintptr_t flash_addr, uintptr_t ram_addr)
+{
+	uint32_t length = ((volatile uint32_t *) flash_addr)[0];
+	uint32_t crc    = ((volatile uint32_t *) flash_addr)[1];
+
+	if ((length == 0) || (length == 0xffffffff) || (length > MAIN_RAM_SIZE))
+		return -1;
+	fast_boot_copy(ram_addr, flash_addr + 2*sizeof(uint32_t), length);
+#ifndef FAST_BOOT_NO_CRC
+	/* CRC checked on the RAM copy (faster than on the SPI Flash). */
+	if (crc32((unsigned char *) ram_addr, length) != crc)
+		return -1;
+#else
+	(void) crc;
+#endif
+	return length;
+}
+
+static inline void fast_boot_jump(uintptr_t addr)
+{
+	flush_cpu_icache();
+	flush_cpu_dcache();
+#ifdef CONFIG_L2_SIZE
+	flush_l2_cache();
+#endif
+	boot_timer_report("Boot");
+	((void (*)(void)) addr)();
+}
+
+#endif
+
+#endif
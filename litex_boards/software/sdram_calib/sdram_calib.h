@@ -0,0 +1,351 @@
+/*
+ * This file is part of LiteX-Boards.
+ *
+ * SPDX-License-Identifier: BSD-2-Clause
+ *
+ * SDRAM calibration cache firmware library (header only).
+ *
+ * Saves the SDRAM leveling result (followed by the SDRAMPHYCalibrationShadow core added with
+ * --with-sdram-calib-cache) to the last sector of the SPI Flash, keyed on the FPGA DNA and on a
+ * temperature band, and restores it on the next boots with a quick memtest check. Devices without
+ * DNA/XADC (e.g. ECP5) use a fixed key: the cache is then only checked with the memtest.
+ *
+ * sdram_calib_init() is a drop-in replacement for sdram_init() in boot firmwares: it restores the
+ * cached calibration when valid and otherwise runs the full calibration and saves it. Firmwares
+ * running after the BIOS can also call sdram_calib_save() to save the BIOS calibration.
+ */
+
+#ifndef __SDRAM_CALIB_H
+#define __SDRAM_CALIB_H
+
+#include <stdio.h>
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+
+#include <system.h>
+#include <libbase/crc.h>
+#include <libbase/memtest.h>
+#include <liblitedram/sdram.h>
+
+#include <generated/soc.h>
+#include <generated/csr.h>
+#include <generated/mem.h>
+#include <generated/sdram_phy.h>
+
+#ifdef CSR_SDRAM_CALIB_BASE
+
+#define SDRAM_CALIB_MAGIC      0x53444343 /* SDCC */
+#define SDRAM_CALIB_VERSION    1
+#define SDRAM_CALIB_COUNTERS   5
+#define SDRAM_CALIB_CHECK_SIZE (64*1024)
+
+#ifndef SPI_FLASH_PAGE_SIZE
+#define SPI_FLASH_PAGE_SIZE 256
+#endif
+
+/* Counters index */
+#define SDRAM_CALIB_RDLY_DQ         0
+#define SDRAM_CALIB_RDLY_DQ_BITSLIP 1
+#define SDRAM_CALIB_WDLY_DQ         2
+#define SDRAM_CALIB_WDLY_DQS        3
+#define SDRAM_CALIB_WDLY_DQ_BITSLIP 4
+
+struct sdram_calib_record {
+	uint32_t magic;
+	uint32_t version;
+	uint64_t dna;
+	int32_t  band;
+	uint32_t cdly;
+	uint16_t counters[SDRAM_PHY_MODULES][SDRAM_CALIB_COUNTERS];
+	uint32_t crc;
+};
+
+/*-----------------------------------------------------------------------*/
+/* Key                                                                   */
+/*-----------------------------------------------------------------------*/
+
+static inline uint64_t sdram_calib_dna(void)
+{
+#ifdef CSR_DNA_BASE
+	return dna_id_read();
+#else
+	return 0;
+#endif
+}
+
+static inline int32_t sdram_calib_band(void)
+{
+#ifdef CSR_XADC_TEMPERATURE_ADDR
+	/* Temperature (°C) = Value x 503.975 / 4096 - 273.15. */
+	int32_t temperature = ((int32_t) xadc_temperature_read()*503975/4096 - 273150)/1000;
+	if (temperature < 0)
+		return temperature/SDRAM_CALIB_TEMPERATURE_BAND - 1;
+	return temperature/SDRAM_CALIB_TEMPERATURE_BAND;
+#else
+	return 0;
+#endif
+}
+
+/*-----------------------------------------------------------------------*/
+/* Shadow                                                                */
+/*-----------------------------------------------------------------------*/
+
+static inline void sdram_calib_read(struct sdram_calib_record *r)
+{
+	int m;
+	memset(r, 0, sizeof(*r));
+	r->magic   = SDRAM_CALIB_MAGIC;
+	r->version = SDRAM_CALIB_VERSION;
+	r->dna     = sdram_calib_dna();
+	r->band    = sdram_calib_band();
+#ifdef CSR_SDRAM_CALIB_CDLY_ADDR
+	r->cdly = sdram_calib_cdly_read();
+#endif
+	for (m = 0; m < SDRAM_PHY_MODULES; m++) {
+		sdram_calib_sel_write(m);
+#ifdef CSR_SDRAM_CALIB_RDLY_DQ_ADDR
+		r->counters[m][SDRAM_CALIB_RDLY_DQ] = sdram_calib_rdly_dq_read();
+#endif
+#ifdef CSR_SDRAM_CALIB_RDLY_DQ_BITSLIP_ADDR
+		r->counters[m][SDRAM_CALIB_RDLY_DQ_BITSLIP] = sdram_calib_rdly_dq_bitslip_read();
+#endif
+#ifdef CSR_SDRAM_CALIB_WDLY_DQ_ADDR
+		r->counters[m][SDRAM_CALIB_WDLY_DQ] = sdram_calib_wdly_dq_read();
+#endif
+#ifdef CSR_SDRAM_CALIB_WDLY_DQS_ADDR
+		r->counters[m][SDRAM_CALIB_WDLY_DQS] = sdram_calib_wdly_dqs_read();
+#endif
+#ifdef CSR_SDRAM_CALIB_WDLY_DQ_BITSLIP_ADDR
+		r->counters[m][SDRAM_CALIB_WDLY_DQ_BITSLIP] = sdram_calib_wdly_dq_bitslip_read();
+#endif
+	}
+	r->crc = crc32((unsigned char *) r, offsetof(struct sdram_calib_record, crc));
+}
+
+/*-----------------------------------------------------------------------*/
+/* PHY                                                                   */
+/*-----------------------------------------------------------------------*/
+
+static inline void sdram_calib_dly_sync(void)
+{
+#if defined(SDRAM_PHY_ECP5DDRPHY) || defined(SDRAM_PHY_GW2DDRPHY)
+	/* Sync all DQSBUFM's, By toggling all dly_sel (DQSBUFM.PAUSE) lines. */
+	ddrphy_dly_sel_write(0xff);
+	ddrphy_dly_sel_write(0);
+#endif
+}
+
+static inline void sdram_calib_replay(int module, void (*rst)(uint32_t), void (*inc)(uint32_t), unsigned int count)
+{
+	unsigned int i;
+	ddrphy_dly_sel_write(1 << module);
+	if (rst != NULL)
+		rst(1);
+	for (i = 0; i < count; i++) {
+		inc(1);
+		cdelay(100);
+	}
+	ddrphy_dly_sel_write(0);
+	sdram_calib_dly_sync();
+}
+
+static inline void sdram_calib_apply(const struct sdram_calib_record *r)
+{
+	int m;
+#if defined(CSR_SDRAM_CALIB_CDLY_ADDR) && defined(CSR_DDRPHY_CDLY_RST_ADDR)
+	unsigned int i;
+	ddrphy_cdly_rst_write(1);
+	for (i = 0; i < r->cdly % SDRAM_PHY_DELAYS; i++) {
+		ddrphy_cdly_inc_write(1);
+		cdelay(100);
+	}
+#endif
+	for (m = 0; m < SDRAM_PHY_MODULES; m++) {
+#ifdef CSR_SDRAM_CALIB_WDLY_DQ_ADDR
+		sdram_calib_replay(m, ddrphy_wdly_dq_rst_write, ddrphy_wdly_dq_inc_write,
+			r->counters[m][SDRAM_CALIB_WDLY_DQ] % SDRAM_PHY_DELAYS);
+#endif
+#ifdef CSR_SDRAM_CALIB_WDLY_DQS_ADDR
+#if defined(SDRAM_PHY_USDDRPHY) || defined(SDRAM_PHY_USPDDRPHY)
+		/* Reset DQS delay (by wrapping). */
+		ddrphy_dly_sel_write(1 << m);
+		while (ddrphy_wdly_dqs_inc_count_read() != 0) {
+			ddrphy_wdly_dqs_inc_write(1);
+			cdelay(100);
+		}
+		ddrphy_dly_sel_write(0);
+		sdram_calib_replay(m, NULL, ddrphy_wdly_dqs_inc_write,
+			r->counters[m][SDRAM_CALIB_WDLY_DQS] % SDRAM_PHY_DELAYS);
+#else
+		sdram_calib_replay(m, ddrphy_wdly_dqs_rst_write, ddrphy_wdly_dqs_inc_write,
+			r->counters[m][SDRAM_CALIB_WDLY_DQS] % SDRAM_PHY_DELAYS);
+#endif
+#endif
+#ifdef CSR_SDRAM_CALIB_WDLY_DQ_BITSLIP_ADDR
+		sdram_calib_replay(m, ddrphy_wdly_dq_bitslip_rst_write, ddrphy_wdly_dq_bitslip_write,
+			r->counters[m][SDRAM_CALIB_WDLY_DQ_BITSLIP] % SDRAM_PHY_BITSLIPS);
+#endif
+#ifdef CSR_SDRAM_CALIB_RDLY_DQ_BITSLIP_ADDR
+		sdram_calib_replay(m, ddrphy_rdly_dq_bitslip_rst_write, ddrphy_rdly_dq_bitslip_write,
+			r->counters[m][SDRAM_CALIB_RDLY_DQ_BITSLIP] % SDRAM_PHY_BITSLIPS);
+#endif
+#ifdef CSR_SDRAM_CALIB_RDLY_DQ_ADDR
+		sdram_calib_replay(m, ddrphy_rdly_dq_rst_write, ddrphy_rdly_dq_inc_write,
+			r->counters[m][SDRAM_CALIB_RDLY_DQ] % SDRAM_PHY_DELAYS);
+#endif
+	}
+}
+
+/*-----------------------------------------------------------------------*/
+/* SPI Flash                                                             */
+/*-----------------------------------------------------------------------*/
+
+#ifdef CSR_SPIFLASH_CORE_MASTER_CS_ADDR
+
+static inline void sdram_calib_spi_xfer(const uint8_t *tx, uint8_t *rx, int len)
+{
+	int i;
+	uint8_t b;
+
+	/* Be sure to empty RX queue before doing Xfer. */
+	while (spiflash_core_master_status_rx_ready_read())
+		spiflash_core_master_rxtx_read();
+
+	/* Configure Master (1 byte per Xfer, CS kept asserted). */
+	spiflash_core_master_phyconfig_len_write(8);
+	spiflash_core_master_phyconfig_mask_write(1);
+	spiflash_core_master_phyconfig_width_write(1);
+	spiflash_core_master_cs_write(1);
+	for (i = 0; i < len; i++) {
+		while (!spiflash_core_master_status_tx_ready_read());
+		spiflash_core_master_rxtx_write(tx[i]);
+		while (!spiflash_core_master_status_rx_ready_read());
+		b = spiflash_core_master_rxtx_read();
+		if (rx != NULL)
+			rx[i] = b;
+	}
+	spiflash_core_master_cs_write(0);
+}
+
+static inline void sdram_calib_spi_wait(void)
+{
+	uint8_t tx[2] = {0x05, 0x00}; /* Read Status Register. */
+	uint8_t rx[2];
+	do {
+		sdram_calib_spi_xfer(tx, rx, 2);
+	} while (rx[1] & 0x01); /* Write In Progress. */
+}
+
+static inline void sdram_calib_spi_wren(void)
+{
+	uint8_t tx[1] = {0x06}; /* Write Enable. */
+	sdram_calib_spi_xfer(tx, NULL, 1);
+}
+
+static inline int sdram_calib_flash_write(uint32_t offset, const void *data, int len)
+{
+	uint8_t tx[4 + SPI_FLASH_PAGE_SIZE];
+
+	if (len > SPI_FLASH_PAGE_SIZE)
+		return 0;
+
+	/* Sector Erase (4KB). */
+	sdram_calib_spi_wren();
+	tx[0] = 0x20;
+	tx[1] = (offset >> 16) & 0xff;
+	tx[2] = (offset >>  8) & 0xff;
+	tx[3] = (offset >>  0) & 0xff;
+	sdram_calib_spi_xfer(tx, NULL, 4);
+	sdram_calib_spi_wait();
+
+	/* Page Program. */
+	sdram_calib_spi_wren();
+	tx[0] = 0x02;
+	memcpy(&tx[4], data, len);
+	sdram_calib_spi_xfer(tx, NULL, 4 + len);
+	sdram_calib_spi_wait();
+
+	flush_cpu_dcache();
+	return 1;
+}
+
+#endif /* CSR_SPIFLASH_CORE_MASTER_CS_ADDR */
+
+/*-----------------------------------------------------------------------*/
+/* Save/Restore                                                          */
+/*-----------------------------------------------------------------------*/
+
+/* Save the current calibration (after a full leveling) to SPI Flash. */
+static inline int sdram_calib_save(void)
+{
+#ifdef CSR_SPIFLASH_CORE_MASTER_CS_ADDR
+	struct sdram_calib_record r;
+	sdram_calib_read(&r);
+	if (!sdram_calib_flash_write(SDRAM_CALIB_FLASH_OFFSET, &r, sizeof(r)))
+		return 0;
+	printf("SDRAM calibration saved (band %d).\n", (int) r.band);
+	return memcmp((void *) (SPIFLASH_BASE + SDRAM_CALIB_FLASH_OFFSET), &r, sizeof(r)) == 0;
+#else
+	printf("SDRAM calibration not saved (no SPI Flash master).\n");
+	return 0;
+#endif
+}
+
+/* Restore the calibration from SPI Flash if valid for this board/temperature band and check it. */
+static inline int sdram_calib_restore(void)
+{
+	struct sdram_calib_record r;
+
+	/* Validate record. */
+	memcpy(&r, (void *) (SPIFLASH_BASE + SDRAM_CALIB_FLASH_OFFSET), sizeof(r));
+	if ((r.magic   != SDRAM_CALIB_MAGIC)   ||
+	    (r.version != SDRAM_CALIB_VERSION) ||
+	    (r.crc     != crc32((unsigned char *) &r, offsetof(struct sdram_calib_record, crc))))
+		return 0;
+	if ((r.dna != sdram_calib_dna()) || (r.band != sdram_calib_band())) {
+		printf("SDRAM calibration cache mismatch (DNA/temperature band).\n");
+		return 0;
+	}
+
+	/* Initialize SDRAM with cached calibration. */
+	printf("Initializing SDRAM @0x%08lx (cached calibration)...\n", MAIN_RAM_BASE);
+	sdram_software_control_on();
+#ifdef CSR_DDRPHY_RDPHASE_ADDR
+	ddrphy_rdphase_write(SDRAM_PHY_RDPHASE);
+#endif
+#ifdef CSR_DDRPHY_WRPHASE_ADDR
+	ddrphy_wrphase_write(SDRAM_PHY_WRPHASE);
+#endif
+#ifdef CSR_DDRPHY_RST_ADDR
+	ddrphy_rst_write(1);
+	cdelay(1000);
+	ddrphy_rst_write(0);
+	cdelay(1000);
+#endif
+	init_sequence();
+	sdram_calib_apply(&r);
+	sdram_software_control_off();
+
+	/* Quick check. */
+	if (!memtest((unsigned int *) MAIN_RAM_BASE, SDRAM_CALIB_CHECK_SIZE)) {
+		printf("SDRAM cached calibration check failed.\n");
+		return 0;
+	}
+	return 1;
+}
+
+/* sdram_init() replacement: restore cached calibration or do full calibration and save it. */
+static inline int sdram_calib_init(void)
+{
+	if (sdram_calib_restore())
+		return 1;
+	if (!sdram_init())
+		return 0;
+	sdram_calib_save();
+	return 1;
+}
+
+#endif /* CSR_SDRAM_CALIB_BASE */
+
+#endif /* __SDRAM_CALIB_H */
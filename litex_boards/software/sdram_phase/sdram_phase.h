@@ -0,0 +1,173 @@
+/*
+ * This file is part of LiteX-Boards.
+ *
+ * SPDX-License-Identifier: BSD-2-Clause
+ *
+ * SDR SDRAM clock phase calibration firmware library (header only).
+ *
+ * Sweeps the SDRAM clock phase over a full clock period with the SDRAMClockPhase core (added with
+ * --with-sdram-phase-calib), runs a quick memtest at each phase step, and locks-in the center of
+ * the largest valid window.
+ *
+ * sdram_phase_calibrate() must be called from a firmware running from ROM/SRAM (the SDRAM is
+ * unusable during the sweep and the contents of the first SDRAM_PHASE_CHECK_SIZE bytes are lost).
+ * It runs the SDRAM initialization sequence itself (and at each phase step, since the SDRAM can
+ * latch corrupted commands at invalid phases) and returns with the SDRAM under hardware control:
+ * it replaces sdram_init() in boot firmwares.
+ */
+
+#ifndef __SDRAM_PHASE_H
+#define __SDRAM_PHASE_H
+
+#include <stdio.h>
+#include <stdint.h>
+
+#include <system.h>
+#include <libbase/memtest.h>
+#include <liblitedram/sdram.h>
+
+#include <generated/soc.h>
+#include <generated/csr.h>
+#include <generated/mem.h>
+#include <generated/sdram_phy.h>
+
+#ifdef CSR_SDRAM_PHASE_BASE
+
+#ifndef SDRAM_PHASE_CHECK_SIZE
+#define SDRAM_PHASE_CHECK_SIZE (16*1024)
+#endif
+
+/*-----------------------------------------------------------------------*/
+/* Phase                                                                 */
+/*-----------------------------------------------------------------------*/
+
+static inline void sdram_phase_step(int delay)
+{
+	sdram_phase_direction_write(delay ? 1 : 0);
+	sdram_phase_step_write(1);
+	while (!sdram_phase_done_read());
+}
+
+static inline void sdram_phase_move(int steps)
+{
+	while (steps > 0) {
+		sdram_phase_step(1);
+		steps--;
+	}
+	while (steps < 0) {
+		sdram_phase_step(0);
+		steps++;
+	}
+}
+
+static inline int sdram_phase_degrees(int position)
+{
+	int steps = sdram_phase_steps_read();
+	return ((sdram_phase_initial_read() + position)%steps)*360/steps;
+}
+
+/*-----------------------------------------------------------------------*/
+/* Init                                                                  */
+/*-----------------------------------------------------------------------*/
+
+static inline void sdram_phase_init(void)
+{
+	sdram_software_control_on();
+	init_sequence();
+	sdram_software_control_off();
+}
+
+/*-----------------------------------------------------------------------*/
+/* Check                                                                 */
+/*-----------------------------------------------------------------------*/
+
+static inline int sdram_phase_check(void)
+{
+	struct memtest_config config = {
+		.show_progress = 0,
+		.read_only     = 0,
+		.on_error      = NULL,
+		.arg           = NULL,
+	};
+	unsigned int *addr = (unsigned int *) MAIN_RAM_BASE;
+	sdram_phase_init();
+	if (memtest_bus(addr, SDRAM_PHASE_CHECK_SIZE) != 0)
+		return 0;
+	return memtest_data(addr, SDRAM_PHASE_CHECK_SIZE, 1, &config) == 0;
+}
+
+/*-----------------------------------------------------------------------*/
+/* Calibration                                                           */
+/*-----------------------------------------------------------------------*/
+
+/* Sweep a full period and move to the center of the largest valid window (circular).
+ * Returns the selected position (in steps from the initial phase), or -1 if no valid phase
+ * (the initial phase is then kept). */
+static inline int sdram_phase_calibrate(void)
+{
+	int steps = sdram_phase_steps_read();
+	int i;
+	int first, start, length;
+	int best_start, best_length;
+	int position;
+
+	/* Sweep (back to the initial phase at the end), tracking the valid windows. */
+	first       = -1; /* Length of the window starting at 0 (-1: all steps valid). */
+	start       = 0;
+	length      = 0;
+	best_start  = 0;
+	best_length = 0;
+	printf("SDRAM clock phase: ");
+	for (i = 0; i < steps; i++) {
+		if (sdram_phase_check()) {
+			printf("1");
+			if (length == 0)
+				start = i;
+			length++;
+		} else {
+			printf("0");
+			if (first < 0)
+				first = length;
+			if (length > best_length) {
+				best_start  = start;
+				best_length = length;
+			}
+			length = 0;
+		}
+		sdram_phase_step(1);
+	}
+	printf("\n");
+
+	/* All steps valid (no window edge): keep the initial phase. */
+	if (first < 0) {
+		sdram_phase_init();
+		printf("SDRAM clock phase: all phases valid, keeping %d°.\n", sdram_phase_degrees(0));
+		return 0;
+	}
+
+	/* Window wrapping around the period (joined with the window starting at 0). */
+	if (length + first > best_length) {
+		best_start  = (length > 0) ? start : 0;
+		best_length = length + first;
+	}
+	if (best_length == 0) {
+		sdram_phase_init();
+		printf("SDRAM clock phase: no valid phase, keeping %d°.\n", sdram_phase_degrees(0));
+		return -1;
+	}
+
+	/* Center. */
+	position = (best_start + best_length/2)%steps;
+	sdram_phase_move(position);
+	sdram_phase_init();
+	printf("SDRAM clock phase: window %d°-%d° (%d/%d steps), %d° selected.\n",
+		sdram_phase_degrees(best_start),
+		sdram_phase_degrees(best_start + best_length - 1),
+		best_length, steps,
+		sdram_phase_degrees(position));
+	return position;
+}
+
+#endif /* CSR_SDRAM_PHASE_BASE */
+
+#endif /* __SDRAM_PHASE_H */
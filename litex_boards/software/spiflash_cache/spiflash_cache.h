@@ -0,0 +1,122 @@
+/*
+ * This file is part of LiteX-Boards.
+ *
+ * SPDX-License-Identifier: BSD-2-Clause
+ *
+ * SPI Flash XIP cache firmware library (header only).
+ *
+ * Controls the SPIFlashCache core added with --flash-cache-size (flush, accesses/misses counters)
+ * and provides a cycle-count benchmark (Timer0) of code executed in place: each function is run
+ * with a cold cache (flushed) then with a warm cache, and the cycles are reported with the cache
+ * counters. Running the same benchmark on a build without cache (--flash-cache-size=0) or on a copy
+ * of the function placed in SRAM (a .data.* section, copied from the SPI Flash by crt0) gives the
+ * speed-up.
+ *
+ * Flash writes/erases through the LiteSPI master invalidate the cache in hardware; flush it with
+ * spiflash_cache_flush() when the Flash is modified by other means.
+ */
+
+#ifndef __SPIFLASH_CACHE_H
+#define __SPIFLASH_CACHE_H
+
+#include <stdio.h>
+#include <stdint.h>
+
+#include <system.h>
+
+#include <generated/soc.h>
+#include <generated/csr.h>
+
+/*-----------------------------------------------------------------------*/
+/* Cache                                                                 */
+/*-----------------------------------------------------------------------*/
+
+struct spiflash_cache_stats {
+	uint32_t accesses;
+	uint32_t misses;
+};
+
+static inline void spiflash_cache_flush(void)
+{
+#ifdef CSR_SPIFLASH_CACHE_BASE
+	spiflash_cache_flush_write(1);
+#endif
+	flush_cpu_icache();
+}
+
+static inline void spiflash_cache_stats_read(struct spiflash_cache_stats *stats)
+{
+#ifdef CSR_SPIFLASH_CACHE_BASE
+	stats->accesses = spiflash_cache_accesses_read();
+	stats->misses   = spiflash_cache_misses_read();
+#else
+	stats->accesses = 0;
+	stats->misses   = 0;
+#endif
+}
+
+/*-----------------------------------------------------------------------*/
+/* Benchmark                                                             */
+/*-----------------------------------------------------------------------*/
+
+#ifdef CSR_TIMER0_BASE
+
+#ifndef SPIFLASH_CACHE_BENCH_RUNS
+#define SPIFLASH_CACHE_BENCH_RUNS 8
+#endif
+
+/* Timer0 as a free-running down-counter (also used by busy_wait: not to be called from fn). */
+static inline void spiflash_cache_cycles_start(void)
+{
+	timer0_en_write(0);
+	timer0_reload_write(0);
+	timer0_load_write(0xffffffff);
+	timer0_en_write(1);
+}
+
+static inline uint32_t spiflash_cache_cycles(void)
+{
+	timer0_update_value_write(1);
+	return 0xffffffff - timer0_value_read();
+}
+
+/* Run fn(arg) once with a cold cache, then SPIFLASH_CACHE_BENCH_RUNS times with a warm cache and
+ * report the cycles of the cold run and of the best warm run. Returns the warm cycles. */
+static inline uint32_t spiflash_cache_bench(const char *name, void (*fn)(void *), void *arg)
+{
+	struct spiflash_cache_stats s0, s1;
+	uint32_t cold, warm, cycles;
+	int i;
+
+	/* Cold. */
+	spiflash_cache_flush();
+	spiflash_cache_stats_read(&s0);
+	spiflash_cache_cycles_start();
+	fn(arg);
+	cold = spiflash_cache_cycles();
+	spiflash_cache_stats_read(&s1);
+
+	/* Warm (best run). */
+	warm = 0xffffffff;
+	for (i = 0; i < SPIFLASH_CACHE_BENCH_RUNS; i++) {
+		spiflash_cache_cycles_start();
+		fn(arg);
+		cycles = spiflash_cache_cycles();
+		if (cycles < warm)
+			warm = cycles;
+	}
+
+	printf("%s: cold %lu cycles (%lu accesses, %lu misses), warm %lu cycles (x%lu.%02lu).\n",
+		name,
+		(unsigned long) cold,
+		(unsigned long) (s1.accesses - s0.accesses),
+		(unsigned long) (s1.misses - s0.misses),
+		(unsigned long) warm,
+		(unsigned long) (cold/warm),
+		(unsigned long) ((100*(uint64_t) cold/warm)%100));
+	return warm;
+}
+
+#endif /* CSR_TIMER0_BASE */
+
+#endif /* __SPIFLASH_CACHE_H */
@@ -15,6 +15,8 @@ from litex_boards.platforms import adi_adrv2crr_fmc
 
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 
 from litex.soc.cores.clock import *
 from litex.soc.cores.led import LedChaser
@@ -24,9 +26,6 @@ from litex.soc.cores.xadc import ZynqUSPSystemMonitor
 from litedram.modules import MT40A512M16
 from litedram.phy import usddrphy
 
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(Module):
@@ -77,14 +76,19 @@ class BaseSoC(SoCCore):
                 sys_clk_freq     = sys_clk_freq,
                 iodelay_clk_freq = 400e6)
             self.add_sdram("sdram",
-                phy           = self.ddrphy,
-                module        = MT40A512M16(sys_clk_freq, "1:4"),
-                size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                phy                     = self.ddrphy,
+                module                  = MT40A512M16(sys_clk_freq, "1:4"),
+                size                    = 0x40000000,
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True)
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.usppciephy import USPPCIEPHY
             assert self.csr_data_width == 32
 
             self.submodules.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x4"),
@@ -129,19 +133,24 @@ def main():
     target_group.add_argument("--driver",          action="store_true", help="Generate PCIe driver")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = int(float(args.sys_clk_freq)),
         with_pcie    = args.with_pcie,
-        **soc_core_argdict(args)
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
     )
 
+    apply_args(soc, args)
     builder  = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
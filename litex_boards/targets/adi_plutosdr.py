@@ -18,6 +18,7 @@ from litex.build.xilinx.vivado import vivado_build_args, vivado_build_argdict
 
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 
 from litex.soc.cores.clock import *
 
@@ -84,6 +85,7 @@ def main():
 
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     vivado_build_args(parser)
     args = parser.parse_args()
 
@@ -91,6 +93,7 @@ def main():
         sys_clk_freq        = int(float(args.sys_clk_freq)),
         **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build(**vivado_build_argdict(args))
@@ -14,6 +14,8 @@ from litex.build.xilinx.vivado import vivado_build_args, vivado_build_argdict
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 
 from litex.soc.cores.clock import *
 from litex.soc.cores.led import LedChaser
@@ -66,10 +68,14 @@ class BaseSoC(SoCCore):
                 sys_clk_freq     = sys_clk_freq,
                 iodelay_clk_freq = 200e6)
             self.add_sdram("sdram",
-                phy           = self.ddrphy,
-                module        = AS4C128M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                phy                     = self.ddrphy,
+                module                  = AS4C128M16(sys_clk_freq, "1:4"),
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True)
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -97,6 +103,8 @@ def main():
     target_group.add_argument("--with-spi-flash",  action="store_true", help="Enable SPI Flash (MMAPed).")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     vivado_build_args(parser)
     args = parser.parse_args()
 
@@ -104,9 +112,11 @@ def main():
         variant        = args.variant,
         sys_clk_freq   = int(float(args.sys_clk_freq)),
         with_spi_flash = args.with_spi_flash,
-        **soc_core_argdict(args)
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
     )
 
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build(**vivado_build_argdict(args))
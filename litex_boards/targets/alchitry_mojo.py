@@ -47,9 +47,10 @@ from litex_boards.platforms import alchitry_mojo
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 
 from litex.soc.cores.clock import *
-from litex.soc.cores.video import VideoS6HDMIPHY
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import MT48LC32M8, SDRModule
@@ -117,13 +118,18 @@ class BaseSoC(SoCCore):
             sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
             self.submodules.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
-                phy           = self.sdrphy,
-                module        = MT48LC32M8(sys_clk_freq, sdram_rate),
-                l2_cache_size = kwargs.get("l2_size", 1024)
+                phy                     = self.sdrphy,
+                module                  = MT48LC32M8(sys_clk_freq, sdram_rate),
+                l2_cache_size           = kwargs.get("l2_size", 1024),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True)
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
         
         # HDMI Options -----------------------------------------------------------------------------
         if with_hdmi_shield and (with_video_colorbars or with_video_framebuffer or with_video_terminal):
+            from litex.soc.cores.video import VideoS6HDMIPHY
             self.submodules.videophy = VideoS6HDMIPHY(platform.request("hdmi_out"), clock_domain="hdmi")
             if with_video_colorbars:
                 self.add_video_colorbars(phy=self.videophy, timings="640x480@60Hz", clock_domain="hdmi")
@@ -156,6 +162,8 @@ def main():
     viopts.add_argument("--with-video-colorbars",   action="store_true", help="Enable Video Colorbars (HDMI).")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     # Note: baudrate is fixed because regardless of USB->TTL baud, the AVR <-> FPGA baudrate is
@@ -168,9 +176,11 @@ def main():
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
         with_video_colorbars   = args.with_video_colorbars,
-        **soc_core_argdict(args)
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
     )
 
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
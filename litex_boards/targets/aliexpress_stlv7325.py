@@ -18,17 +18,14 @@ from litex_boards.platforms import aliexpress_stlv7325
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 
 from litedram.modules import MT8JTF12864
 from litedram.phy import s7ddrphy
 
-from liteeth.phy import LiteEthPHY
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -80,13 +77,18 @@ class BaseSoC(SoCCore):
                 sys_clk_freq = sys_clk_freq,
             )
             self.add_sdram("sdram",
-                phy           = self.ddrphy,
-                module        = MT8JTF12864(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192),
+                phy                     = self.ddrphy,
+                module                  = MT8JTF12864(sys_clk_freq, "1:4"),
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True),
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy import LiteEthPHY
             self.submodules.ethphy = LiteEthPHY(
                 clock_pads = self.platform.request("eth_clocks", 0),
                 pads       = self.platform.request("eth", 0),
@@ -98,6 +100,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
@@ -157,6 +160,8 @@ def main():
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -167,17 +172,20 @@ def main():
         eth_dynamic_ip = args.eth_dynamic_ip,
         with_pcie      = args.with_pcie,
         with_sata      = args.with_sata,
-        **soc_core_argdict(args)
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
     )
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
         soc.add_sdcard()
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -12,6 +12,7 @@ from litex_boards.platforms import aliexpress_xc7k420t
 
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 
 from litex.soc.cores.clock import *
 from litex.soc.cores.led import LedChaser
@@ -69,12 +70,14 @@ def main():
     target_group.add_argument("--with-spi-flash", action="store_true", help="Enable SPI-mode flash support.")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = int(float(args.sys_clk_freq)),
         **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
@@ -32,6 +32,7 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 
 # CRG ----------------------------------------------------------------------------------------------
@@ -180,6 +181,7 @@ def main():
     target_group.add_argument("--sys-clk-freq", default=25e6,        help="System clock frequency.")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     vivado_build_args(parser)
     parser.set_defaults(cpu_type="zynqmp")
     args = parser.parse_args()
@@ -188,6 +190,7 @@ def main():
         sys_clk_freq=int(float(args.sys_clk_freq)),
         **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.cpu_type == "zynqmp":
         soc.builder = builder
@@ -17,15 +17,13 @@ from litex.build.xilinx.vivado import vivado_build_args, vivado_build_argdict
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import MT41K128M16
 from litedram.phy import s7ddrphy
 
-from liteeth.phy import LiteEthS7PHYRGMII
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -77,13 +75,18 @@ class BaseSoC(SoCCore):
                 nphases      = 4,
                 sys_clk_freq = sys_clk_freq)
             self.add_sdram("sdram",
-                phy           = self.ddrphy,
-                module        = MT41K128M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                phy                     = self.ddrphy,
+                module                  = MT41K128M16(sys_clk_freq, "1:4"),
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True)
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy import LiteEthS7PHYRGMII
             self.submodules.ethphy = LiteEthS7PHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
@@ -98,6 +101,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x1"),
                 data_width = 128,
                 bar0_size  = 0x20000)
@@ -133,6 +137,8 @@ def main():
     target_group.add_argument("--with-emmc",              action="store_true",  help="Add eMMC")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     vivado_build_args(parser)
     args = parser.parse_args()
 
@@ -149,12 +155,14 @@ def main():
         eth_dynamic_ip         = args.eth_dynamic_ip,
         with_sdram             = args.with_sdram,
         eth_reset_time         = args.eth_reset_time,
-        **soc_core_argdict(args)
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
     )
 
     if args.with_emmc:
         soc.add_sdcard(software_debug=False)
 
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     builder_kwargs = vivado_build_argdict(args) if args.toolchain == "vivado" else {}
     if args.build:
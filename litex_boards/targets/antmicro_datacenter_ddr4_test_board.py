@@ -18,22 +18,16 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
-from litex.soc.cores.video import VideoS7HDMIPHY
 
 from litedram.modules import MTA18ASF2G72PZ
 from litedram.phy.s7ddrphy import A7DDRPHY
 from litedram.init import get_sdram_phy_py_header
-from litedram.core.controller import ControllerSettings
 from litedram.common import PhySettings, GeomSettings, TimingSettings
 
-from liteeth.phy import LiteEthS7PHYRGMII
-from litex.soc.cores.hyperbus import HyperRAM
-
-from litespi.modules import S25FL128S0
-from litespi.opcodes import SpiNorFlashOpCodes as Codes
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -98,12 +92,16 @@ class BaseSoC(SoCCore):
                 phy                     = self.ddrphy,
                 module                  = MTA18ASF2G72PZ(sys_clk_freq, "1:4"),
                 l2_cache_size           = kwargs.get("l2_size", 8192),
-                l2_cache_min_data_width = 256,
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 256),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True),
                 size                    = 0x40000000,
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # HyperRAM ---------------------------------------------------------------------------------
         if with_hyperram:
+            from litex.soc.cores.hyperbus import HyperRAM
             self.submodules.hyperram = HyperRAM(platform.request("hyperram"), sys_clk_freq=sys_clk_freq)
             self.bus.add_slave("hyperram", slave=self.hyperram.bus, region=SoCRegion(origin=0x20000000, size=8*1024*1024))
 
@@ -113,6 +111,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy import LiteEthS7PHYRGMII
             # Traces between PHY and FPGA introduce ignorable delays of ~0.165ns +/- 0.015ns.
             # PHY chip does not introduce delays on TX (FPGA->PHY), however it includes 1.2ns
             # delay for RX CLK so we only need 0.8ns to match the desired 2ns.
@@ -139,6 +138,7 @@ class BaseSoC(SoCCore):
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal or with_video_framebuffer:
+            from litex.soc.cores.video import VideoS7HDMIPHY
             self.submodules.videophy = VideoS7HDMIPHY(platform.request("hdmi_out"), clock_domain="hdmi")
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
@@ -147,6 +147,8 @@ class BaseSoC(SoCCore):
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
+            from litespi.modules import S25FL128S0
+            from litespi.opcodes import SpiNorFlashOpCodes as Codes
             self.add_spi_flash(mode="4x", module=S25FL128S0(Codes.READ_1_1_4), with_master=True)
 
         # System I2C (behing multiplexer) ----------------------------------------------------------
@@ -166,6 +168,7 @@ class BaseSoC(SoCCore):
 
 class LiteDRAMSettingsEncoder(json.JSONEncoder):
     def default(self, o):
+        from litedram.core.controller import ControllerSettings # Imports LiteDRAM frontends.
         if isinstance(o, (ControllerSettings, GeomSettings, PhySettings, TimingSettings)):
             ignored = ["self", "refresh_cls"]
             return {k: v for k, v in vars(o).items() if k not in ignored}
@@ -200,6 +203,8 @@ def main():
     target_group.add_argument("--with-spi-flash",         action="store_true",    help="Enable SPI Flash (MMAPed).")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     vivado_build_args(parser)
     args = parser.parse_args()
 
@@ -219,7 +224,9 @@ def main():
         with_spi_flash         = args.with_spi_flash,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
-        **soc_core_argdict(args))
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args))
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build(**vivado_build_argdict(args))
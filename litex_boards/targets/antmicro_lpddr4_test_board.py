@@ -14,14 +14,13 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import MT53E256M16D1
 from litedram.phy import lpddr4
 
-from liteeth.phy import LiteEthS7PHYRGMII
-from litex.soc.cores.hyperbus import HyperRAM
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -67,11 +66,15 @@ class BaseSoC(SoCCore):
                 phy                     = self.ddrphy,
                 module                  = MT53E256M16D1(sys_clk_freq, "1:8"),
                 l2_cache_size           = kwargs.get("l2_size", 8192),
-                l2_cache_min_data_width = 256,
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 256),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True),
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # HyperRAM ---------------------------------------------------------------------------------
         if with_hyperram:
+            from litex.soc.cores.hyperbus import HyperRAM
             self.submodules.hyperram = HyperRAM(platform.request("hyperram"), sys_clk_freq=sys_clk_freq)
             self.bus.add_slave("hyperram", slave=self.hyperram.bus, region=SoCRegion(origin=0x20000000, size=8*1024*1024))
 
@@ -81,6 +84,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy import LiteEthS7PHYRGMII
             # Traces between PHY and FPGA introduce ignorable delays of ~0.165ns +/- 0.015ns.
             # PHY chip does not introduce delays on TX (FPGA->PHY), however it includes 1.2ns
             # delay for RX CLK so we only need 0.8ns to match the desired 2ns.
@@ -130,6 +134,8 @@ def main():
     target_group.add_argument("--with-uartbone",    action="store_true",    help="Add UartBone on 2nd serial.")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     vivado_build_args(parser)
     args = parser.parse_args()
 
@@ -146,7 +152,9 @@ def main():
         with_sdcard       = args.with_sdcard,
         with_jtagbone     = args.with_jtagbone,
         with_uartbone     = args.with_uartbone,
-        **soc_core_argdict(args))
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args))
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build(**vivado_build_argdict(args))
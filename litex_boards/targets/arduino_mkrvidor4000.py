@@ -16,6 +16,8 @@ from litex_boards.platforms import arduino_mkrvidor4000
 from litex.soc.cores.clock import Cyclone10LPPLL
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 
 from litedram.modules import AS4C4M16
 from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
@@ -39,6 +41,9 @@ class _CRG(Module):
         pll.register_clkin(clk48, 48e6)
         pll.create_clkout(self.cd_sys,    sys_clk_freq)
         pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
+        # SDRAM clock PLL output (see add_sdram_phase_calib).
+        self.sdram_pll        = pll
+        self.sdram_pll_clkout = pll.nclkouts - 1
 
         # SDRAM clock
         self.comb += platform.request("sdram_clock").eq(self.cd_sys_ps.clk)
@@ -62,10 +67,14 @@ class BaseSoC(SoCCore):
         if not self.integrated_main_ram_size:
             self.submodules.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
-                phy           = self.sdrphy,
-                module        = AS4C4M16(sys_clk_freq, "1:1"), # Alliance Memory AS4C4M16
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                phy                     = self.sdrphy,
+                module                  = AS4C4M16(sys_clk_freq, "1:1"), # Alliance Memory AS4C4M16
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True)
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -76,12 +85,16 @@ def main():
     parser.add_argument("--sys-clk-freq",  default=48e6,        help="System clock frequency.")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq  = int(float(args.sys_clk_freq)),
-        **soc_core_argdict(args)
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
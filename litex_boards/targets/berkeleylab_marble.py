@@ -31,14 +31,14 @@ from litex_boards.platforms import berkeleylab_marble
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 
 from litedram.modules import MT8JTF12864, parse_spd_hexdump, SDRAMModule
 from litedram.phy import s7ddrphy
 
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -105,15 +105,20 @@ class BaseSoC(SoCCore):
                 print('DDR3: No spd data specified, falling back to MT8JTF12864')
 
             self.add_sdram("sdram",
-                phy    = self.ddrphy,
-                module = ram_module,
+                phy                     = self.ddrphy,
+                module                  = ram_module,
                 # size=0x40000000,  # Limit its size to 1 GB
-                l2_cache_size = kwargs.get("l2_size", 8192),
-                with_bist     = kwargs.get("with_bist", False)
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True),
+                with_bist               = kwargs.get("with_bist", False)
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.s7rgmii import LiteEthPHYRGMII
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
@@ -156,6 +161,8 @@ def main():
     target_group.add_argument("--spd-dump",       type=str,            help="DDR3 configuration file, dumped using the `spdread` command in LiteX BIOS.")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -164,8 +171,10 @@ def main():
         with_etherbone = args.with_etherbone,
         with_bist = args.with_bist,
         spd_dump = args.spd_dump,
-        **soc_core_argdict(args)
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
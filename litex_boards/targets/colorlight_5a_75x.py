@@ -52,13 +52,13 @@ from litex.build.lattice.trellis import trellis_args, trellis_argdict
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import M12L16161A, M12L64322A
 from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
 
-from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -97,6 +97,9 @@ class _CRG(Module):
             pll.create_clkout(self.cd_sys2x_ps, 2*sys_clk_freq, phase=180) # Idealy 90° but needs to be increased.
         else:
            pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=180) # Idealy 90° but needs to be increased.
+        # SDRAM clock PLL output (see add_sdram_phase_calib).
+        self.sdram_pll        = pll
+        self.sdram_pll_clkout = pll.nclkouts - 1
 
         # USB PLL
         if with_usb_pll:
@@ -153,12 +156,16 @@ class BaseSoC(SoCCore):
                 phy                     = self.sdrphy,
                 module                  = sdram_cls(sys_clk_freq, sdram_rate),
                 l2_cache_size           = kwargs.get("l2_size", 8192),
-                l2_cache_full_memory_we = False,
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", False),
 
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks", eth_phy),
                 pads       = self.platform.request("eth", eth_phy),
@@ -196,6 +203,8 @@ def main():
     target_group.add_argument("--sdram-rate",        default="1:1",                    help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     trellis_args(parser)
     args = parser.parse_args()
 
@@ -208,8 +217,10 @@ def main():
         eth_phy          = args.eth_phy,
         use_internal_osc = args.use_internal_osc,
         sdram_rate       = args.sdram_rate,
-        **soc_core_argdict(args)
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = trellis_argdict(args) if args.toolchain == "trellis" else {}
 
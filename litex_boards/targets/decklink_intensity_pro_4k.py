@@ -19,9 +19,7 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
+from litex_boards.cores import add_args, apply_args
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -52,6 +50,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
@@ -70,6 +69,7 @@ def main():
     target_group.add_argument("--driver",       action="store_true", help="Generate PCIe driver.")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     vivado_build_args(parser)
     args = parser.parse_args()
 
@@ -78,12 +78,14 @@ def main():
         with_pcie    = args.with_pcie | True, # FIXME: Always enable PCIe for now.
         **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     builder_kwargs = vivado_build_argdict(args)
     if args.build:
         builder.build(**builder_kwargs)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
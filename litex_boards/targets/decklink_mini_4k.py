@@ -21,14 +21,12 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
-from litex.soc.cores.video import VideoS7GTPHDMIPHY
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 
 from litedram.modules import MT41K128M16
 from litedram.phy import s7ddrphy
 
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -90,13 +88,18 @@ class BaseSoC(SoCMini):
                 nphases        = 4,
                 sys_clk_freq   = sys_clk_freq)
             self.add_sdram("sdram",
-                phy           = self.ddrphy,
-                module        = MT41K128M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                phy                     = self.ddrphy,
+                module                  = MT41K128M16(sys_clk_freq, "1:4"),
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True)
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
@@ -134,6 +137,7 @@ class BaseSoC(SoCMini):
             self.add_sata(phy=self.sata_phy, mode="read+write")
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal or with_video_framebuffer:
+            from litex.soc.cores.video import VideoS7GTPHDMIPHY
             self.submodules.videophy = VideoS7GTPHDMIPHY(platform.request("hdmi_out"),
                 sys_clk_freq = sys_clk_freq,
                 clock_domain = "hdmi"
@@ -162,6 +166,8 @@ def main():
     pcieopts.add_argument("--with-sata",            action="store_true", help="Enable SATA support (over PCIe2SATA).")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     vivado_build_args(parser)
     args = parser.parse_args()
 
@@ -171,14 +177,17 @@ def main():
         with_sata              = args.with_sata,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
-        **soc_core_argdict(args)
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     builder_kwargs = vivado_build_argdict(args)
     if args.build:
         builder.build(**builder_kwargs)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -22,14 +22,13 @@ from litex_boards.platforms import decklink_quad_hdmi_recorder
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 
 from litedram.common import PHYPadsReducer
 from litedram.modules import MT41J256M16
 from litedram.phy import usddrphy
 
-from litepcie.phy.uspciephy import USPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -58,7 +57,7 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=int(200e6), with_pcie=False, pcie_lanes=4, **kwargs):
+    def __init__(self, sys_clk_freq=int(200e6), sdram_width=64, with_pcie=False, pcie_lanes=4, **kwargs):
         platform = decklink_quad_hdmi_recorder.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -73,21 +72,29 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            ddram_pads = platform.request("ddram")
+            if sdram_width < len(ddram_pads.dq):
+                ddram_pads = PHYPadsReducer(ddram_pads, list(range(sdram_width//8)))
             self.submodules.ddrphy = usddrphy.USDDRPHY(
-                pads             = PHYPadsReducer(platform.request("ddram"), [0, 1, 2, 3]),
+                pads             = ddram_pads,
                 memtype          = "DDR3",
                 sys_clk_freq     = sys_clk_freq,
                 iodelay_clk_freq = 200e6)
             self.add_sdram("sdram",
-                phy           = self.ddrphy,
-                module        = MT41J256M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                phy                     = self.ddrphy,
+                module                  = MT41J256M16(sys_clk_freq, "1:4"),
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True)
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # PCIe -------------------------------------------------------------------------------------
         # FIXME: Does not seem to be working when also enabling DRAM. Has been tested succesfully by
         # disabling DRAM with --integrated-main-ram-size=0x100.
         if with_pcie:
+            from litepcie.phy.uspciephy import USPCIEPHY
             data_width = {
                 4 : 128,
                 8 : 256,
@@ -97,9 +104,9 @@ class BaseSoC(SoCCore):
                 data_width = data_width,
                 bar0_size  = 0x20000)
             self.add_pcie(phy=self.pcie_phy, ndmas=1)
-            # False Paths (FIXME: Improve integration).
-            platform.toolchain.pre_placement_commands.append("set_false_path -from [get_clocks sys_clk] -to [get_clocks pcie_clk_1]")
-            platform.toolchain.pre_placement_commands.append("set_false_path -from [get_clocks pcie_clk_1] -to [get_clocks sys_clk]")
+            # sys <-> pcie crossings are done through the PHY's async FIFOs, declare both clock
+            # trees (including their generated clocks) asynchronous.
+            platform.add_false_path_constraints(self.crg.cd_sys.clk, self.pcie_phy.cd_pcie.clk)
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -110,22 +117,31 @@ def main():
     target_group.add_argument("--build",        action="store_true", help="Build design.")
     target_group.add_argument("--load",         action="store_true", help="Load bitstream.")
     target_group.add_argument("--sys-clk-freq", default=200e6,       help="System clock frequency.")
+    target_group.add_argument("--sdram-width",  default=64,          type=int, choices=[32, 64], help="DDR3 SDRAM data width.")
     target_group.add_argument("--with-pcie",    action="store_true", help="Enable PCIe support.")
+    target_group.add_argument("--pcie-lanes",   default=4,           type=int, choices=[4, 8],   help="PCIe lanes.")
     target_group.add_argument("--driver",       action="store_true", help="Generate PCIe driver.")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq   = int(float(args.sys_clk_freq)),
+        sdram_width    = args.sdram_width,
         with_pcie      = args.with_pcie,
-        **soc_core_argdict(args)
+        pcie_lanes     = args.pcie_lanes,
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
 	)
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
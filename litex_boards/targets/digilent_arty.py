@@ -21,16 +21,17 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
+from litex_boards.cores.telemetry import TelemetryXADC, add_telemetry
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.gpio import GPIOIn, GPIOTristate
-from litex.soc.cores.xadc import XADC
+from litex.soc.cores.xadc import XADC, analog_layout
 from litex.soc.cores.dna  import DNA
 
 from litedram.modules import MT41K128M16
 from litedram.phy import s7ddrphy
 
-from liteeth.phy.mii import LiteEthPHYMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -80,6 +81,7 @@ class BaseSoC(SoCCore):
         with_spi_flash  = False,
         with_buttons    = False,
         with_pmod_gpio  = False,
+        with_telemetry  = False,
         **kwargs):
         platform = digilent_arty.Platform(variant=variant, toolchain=toolchain)
 
@@ -91,7 +93,34 @@ class BaseSoC(SoCCore):
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Arty A7", **kwargs)
 
         # XADC -------------------------------------------------------------------------------------
-        self.submodules.xadc = XADC()
+        if with_telemetry:
+            # Add Power Measurements (VAUX1/2/9/10) to the XADC sequence and stream conversions.
+            platform.add_extension(digilent_arty._xadc_power_io)
+            power_pads  = platform.request("xadc_power")
+            analog_pads = Record(analog_layout)
+            self.comb += [
+                analog_pads.vauxp[1].eq(power_pads.vsns5v0_p),
+                analog_pads.vauxn[1].eq(power_pads.vsns5v0_n),
+                analog_pads.vauxp[2].eq(power_pads.vsnsvu_p),
+                analog_pads.vauxn[2].eq(power_pads.vsnsvu_n),
+                analog_pads.vauxp[9].eq(power_pads.isns5v0_p),
+                analog_pads.vauxn[9].eq(power_pads.isns5v0_n),
+                analog_pads.vauxp[10].eq(power_pads.isns0v95_p),
+                analog_pads.vauxn[10].eq(power_pads.isns0v95_n),
+            ]
+            self.submodules.xadc = TelemetryXADC(analog_pads, vaux=[1, 2, 9, 10])
+            add_telemetry(self, self.xadc, labels={
+                0x00 : "temperature",
+                0x01 : "vccint",
+                0x02 : "vccaux",
+                0x06 : "vccbram",
+                0x11 : "vsns5v0",
+                0x12 : "vsnsvu",
+                0x19 : "isns5v0",
+                0x1a : "isns0v95",
+            })
+        else:
+            self.submodules.xadc = XADC()
 
         # DNA --------------------------------------------------------------------------------------
         self.submodules.dna = DNA()
@@ -104,13 +133,18 @@ class BaseSoC(SoCCore):
                 nphases        = 4,
                 sys_clk_freq   = sys_clk_freq)
             self.add_sdram("sdram",
-                phy           = self.ddrphy,
-                module        = MT41K128M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                phy                     = self.ddrphy,
+                module                  = MT41K128M16(sys_clk_freq, "1:4"),
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True)
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.mii import LiteEthPHYMII
             self.submodules.ethphy = LiteEthPHYMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
@@ -175,8 +209,11 @@ def main():
     target_group.add_argument("--with-jtagbone",       action="store_true",              help="Enable JTAGbone support.")
     target_group.add_argument("--with-spi-flash",      action="store_true",              help="Enable SPI Flash (MMAPed).")
     target_group.add_argument("--with-pmod-gpio",      action="store_true",              help="Enable GPIOs through PMOD.") # FIXME: Temporary test.
+    target_group.add_argument("--with-telemetry",      action="store_true",              help="Enable XADC telemetry streaming (temperature, supplies, power measurements).")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     vivado_build_args(parser)
     args = parser.parse_args()
 
@@ -193,7 +230,9 @@ def main():
         with_jtagbone  = args.with_jtagbone,
         with_spi_flash = args.with_spi_flash,
         with_pmod_gpio = args.with_pmod_gpio,
-        **soc_core_argdict(args)
+        with_telemetry = args.with_telemetry,
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
     )
     if args.sdcard_adapter == "numato":
         soc.platform.add_extension(digilent_arty._numato_sdcard_pmod_io)
@@ -204,6 +243,7 @@ def main():
     if args.with_sdcard:
         soc.add_sdcard()
 
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     builder_kwargs = vivado_build_argdict(args) if args.toolchain == "vivado" else {}
     if args.build:
@@ -20,6 +20,7 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 
 # CRG ----------------------------------------------------------------------------------------------
@@ -104,6 +105,7 @@ def main():
     target_group.add_argument("--sys-clk-freq", default=125e6,       help="System clock frequency.")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     vivado_build_args(parser)
     parser.set_defaults(cpu_type="zynq7000")
     parser.set_defaults(no_uart=True)
@@ -115,6 +117,7 @@ def main():
         sys_clk_freq=int(float(args.sys_clk_freq)),
         **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     builder_kwargs = vivado_build_argdict(args) if args.toolchain == "vivado" else {}
     if args.build:
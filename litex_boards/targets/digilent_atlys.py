@@ -19,6 +19,8 @@ from litex_boards.platforms import digilent_atlys
 
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import MT47H64M16
@@ -169,10 +171,14 @@ class BaseSoC(SoCCore):
                 self.ddrphy.clk4x_rd_strb.eq(self.crg.clk4x_rd_strb),
             ]
             self.add_sdram("sdram",
-                phy           = self.ddrphy,
-                module        = MT47H64M16(sys_clk_freq, "1:2"),
-                l2_cache_size = kwargs.get("l2_size", 8192),
+                phy                     = self.ddrphy,
+                module                  = MT47H64M16(sys_clk_freq, "1:2"),
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True),
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
@@ -214,12 +220,16 @@ def main():
 
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         with_ethernet  = args.with_ethernet,
         with_etherbone = args.with_etherbone,
-        **soc_core_argdict(args))
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args))
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
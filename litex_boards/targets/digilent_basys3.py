@@ -14,7 +14,7 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
-from litex.soc.cores.video import VideoVGAPHY
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 
 # CRG ----------------------------------------------------------------------------------------------
@@ -48,6 +48,7 @@ class BaseSoC(SoCCore):
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal:
+            from litex.soc.cores.video import VideoVGAPHY
             self.submodules.videophy = VideoVGAPHY(platform.request("vga"), clock_domain="vga")
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="vga")
@@ -74,6 +75,7 @@ def main():
     viopts.add_argument("--with-video-terminal", action="store_true", help="Enable Video Terminal (VGA).")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -86,6 +88,7 @@ def main():
         soc.add_spi_sdcard()
     if args.with_sdcard:
         soc.add_sdcard()
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
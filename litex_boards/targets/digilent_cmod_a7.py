@@ -6,6 +6,8 @@
 # Copyright (c) 2021 Michael T. Mayers <michael@tweakoz.com>
 # SPDX-License-Identifier: BSD-2-Clause
 
+import math
+
 from migen import *
 
 from litex.build.io import CRG
@@ -17,6 +19,7 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 from litex.soc.interconnect import wishbone
 
@@ -46,50 +49,158 @@ class _CRG(Module):
 # AsyncSRAM ------------------------------------------------------------------------------------------
 
 class AsyncSRAM(Module):
-    def __init__(self, platform, size):
-        addr_width = size//8
-        data_width = 8
-        self.bus = wishbone.Interface(data_width=data_width,adr_width=addr_width)
-        issiram = platform.request("issiram")
-        addr = issiram.addr
-        data = issiram.data
-        wen = issiram.wen
-        cen = issiram.cen
-        ########################
-        tristate_data = TSTriple(data_width)
-        self.specials += tristate_data.get_tristate(data)
-        ########################
-        chip_ena = self.bus.cyc & self.bus.stb & self.bus.sel[0]
-        write_ena = (chip_ena & self.bus.we)
-        ########################
-        # external write enable, 
-        # external chip enable, 
-        # internal tristate write enable
-        ########################
+    """Async SRAM controller (IS61WV5128BLL, 8-bit)
+
+    Exposes the 8-bit SRAM as a 32-bit Wishbone slave:
+    - Pads are registered and byte accesses are pipelined: the address of the next byte is issued
+    while the previous one is captured, so a word is read in 4 x read_cycles + 3 cycles.
+    - Writes take 1 + write_cycles cycles per byte, bytes not selected are skipped.
+    - A one word read-ahead buffer is filled with the next word after each read, so sequential
+      reads (instruction fetches) are acked immediately while the following word is prefetched.
+    """
+    def __init__(self, pads, sys_clk_freq, tAA=10e-9, tSCE=8e-9, with_read_ahead=True):
+        self.bus = bus = wishbone.Interface()
+
+        # # #
+
+        # Timings (in sys_clk cycles, reads with 6ns margin for IOs/board).
+        read_cycles  = max(1, math.ceil((tAA + 6e-9)*sys_clk_freq))
+        write_cycles = max(1, math.ceil(tSCE*sys_clk_freq))
+
+        # Pads (registered).
+        adr   = Signal(len(pads.addr))
+        cs    = Signal()
+        we    = Signal()
+        oe    = Signal()
+        dat_w = Signal(8)
+        dat_r = Signal(8)
+        cen   = Signal(reset=1)
+        wen   = Signal(reset=1)
+        data  = TSTriple(8)
+        self.specials += data.get_tristate(pads.data)
+        self.sync += [
+            pads.addr.eq(adr),
+            cen.eq(~cs),
+            wen.eq(~we),
+            data.oe.eq(oe),
+            data.o.eq(dat_w),
+            dat_r.eq(data.i),
+        ]
         self.comb += [
-            cen.eq(~chip_ena),
-            wen.eq(~write_ena),
-            tristate_data.oe.eq(write_ena)
+            pads.cen.eq(cen),
+            pads.wen.eq(wen),
         ]
-        ########################
-        # address and data
-        ########################
+
+        # Sequencer.
+        word_adr    = Signal(30)
+        word        = Signal(32)
+        byte        = Signal(2)
+        timer       = Signal(max=max(read_cycles, write_cycles + 1))
+        speculative = Signal()
         self.comb += [
-            addr.eq(self.bus.adr[:addr_width]),
-            self.bus.dat_r.eq(tristate_data.i[:data_width]),
-            tristate_data.o.eq(self.bus.dat_w[:data_width])
+            adr.eq(Cat(byte, word_adr)),
+            dat_w.eq(Array(bus.dat_w[8*i:8*(i + 1)] for i in range(4))[byte]),
+            bus.dat_r.eq(word),
+        ]
+
+        # Read-ahead buffer (holds the next word once a speculative read is done).
+        prefetch_valid = Signal()
+        prefetch_hit   = Signal()
+        self.comb += prefetch_hit.eq(prefetch_valid & (bus.adr == word_adr))
+
+        # Read captures (data of a byte is sampled 2 cycles after the end of its address phase).
+        capture = Signal(2)
+        capture_byte = [Signal(2), Signal(2)]
+        self.sync += [
+            capture[1].eq(capture[0]),
+            capture_byte[1].eq(capture_byte[0]),
+            If(capture[1],
+                Case(capture_byte[1], {i: word[8*i:8*(i + 1)].eq(dat_r) for i in range(4)})
+            )
         ]
-        ########################
-        # generate ack
-        ########################
+
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            NextValue(byte,  0),
+            NextValue(timer, 0),
+            If(bus.cyc & bus.stb,
+                NextValue(speculative, 0),
+                NextValue(word_adr, bus.adr),
+                If(bus.we,
+                    NextValue(prefetch_valid, 0),
+                    NextState("WRITE")
+                ).Elif(prefetch_hit,
+                    # Hit in read-ahead buffer: ack and prefetch next word.
+                    bus.ack.eq(1),
+                    NextValue(prefetch_valid, 0),
+                    NextValue(speculative, 1),
+                    NextValue(word_adr, bus.adr + 1),
+                    NextState("READ")
+                ).Else(
+                    NextValue(prefetch_valid, 0),
+                    NextState("READ")
+                )
+            )
+        )
+        fsm.act("READ",
+            cs.eq(1),
+            If(timer == (read_cycles - 1),
+                NextValue(timer, 0),
+                NextValue(byte, byte + 1),
+                If(byte == 3,
+                    NextState("READ-WAIT")
+                )
+            ).Else(
+                NextValue(timer, timer + 1)
+            )
+        )
         self.sync += [
-            self.bus.ack.eq(self.bus.cyc & self.bus.stb & ~self.bus.ack),
+            capture[0].eq(fsm.ongoing("READ") & (timer == (read_cycles - 1))),
+            capture_byte[0].eq(byte),
         ]
-        ########################
+        fsm.act("READ-WAIT",
+            If(capture[1] & (capture_byte[1] == 3),
+                NextState("READ-DONE")
+            )
+        )
+        fsm.act("READ-DONE",
+            If(speculative,
+                NextValue(prefetch_valid, 1),
+                NextState("IDLE")
+            ).Else(
+                bus.ack.eq(1),
+                If(with_read_ahead,
+                    NextValue(speculative, 1),
+                    NextValue(word_adr, word_adr + 1),
+                    NextState("READ")
+                ).Else(
+                    NextState("IDLE")
+                )
+            )
+        )
+        fsm.act("WRITE",
+            # CE-controlled writes (OE is tied low on the board, so WE is asserted first to keep
+            # the SRAM outputs disabled).
+            we.eq(1),
+            oe.eq(1),
+            cs.eq(Array(bus.sel)[byte] & (timer != 0)),
+            If(~Array(bus.sel)[byte] | (timer == write_cycles),
+                NextValue(timer, 0),
+                NextValue(byte, byte + 1),
+                If(byte == 3,
+                    NextState("WRITE-DONE")
+                )
+            ).Else(
+                NextValue(timer, timer + 1)
+            )
+        )
+        fsm.act("WRITE-DONE",
+            bus.ack.eq(1),
+            NextState("IDLE")
+        )
 
 def addAsyncSram(soc, platform, name, origin, size):
-    ram_bus = wishbone.Interface(data_width=soc.bus.data_width)
-    ram     = AsyncSRAM(platform,size)
+    ram = AsyncSRAM(platform.request("issiram"), sys_clk_freq=soc.sys_clk_freq)
     soc.bus.add_slave(name, ram.bus, SoCRegion(origin=origin, size=size, mode="rw"))
     soc.check_if_exists(name)
     soc.logger.info("ISSIRAM {} {} {}.".format(
@@ -148,6 +259,7 @@ def main():
 
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     vivado_build_args(parser)
     args = parser.parse_args()
 
@@ -161,6 +273,7 @@ def main():
 
     builder_argd = builder_argdict(args)
 
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argd)
     builder_kwargs = vivado_build_argdict(args) if args.toolchain == "vivado" else {}
     if args.build:
@@ -18,12 +18,11 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 from litex.soc.interconnect import wishbone
 
 from litex.soc.integration.soc import colorer
-from litex.soc.cores.video import VideoVGAPHY
-from liteeth.phy.rmii import LiteEthPHYRMII
 
 
 # CRG ----------------------------------------------------------------------------------------------
@@ -55,103 +54,190 @@ class _CRG(Module):
 # CellularRAM (https://media.digikey.com/PDF/Data%20Sheets/Micron%20Technology%20Inc%20PDFs/MT45W8MW16BGX.pdf)
 
 class CellularRAM(Module):
-    def __init__(self, soc, platform):
-
-        sys_clk_freq = soc.sys_clk_freq
-
-        addr_width = 23
-        data_width = 16
-
-        delay_for_70ns = (70e-9) / (1.0/sys_clk_freq)
-        delay_for_70ns = int(math.ceil(delay_for_70ns))+1
-
-        #print("sys_clk_freq<%g> delay_for_70ns<%g>\n"%(sys_clk_freq,delay_for_70ns))
-
-        self.bus = wishbone.Interface(data_width=data_width,adr_width=addr_width)
-
-        self.delaycounter = Signal(5)
-
-        cellram = platform.request("cellularram")
-        addr = cellram.addr
-        data = cellram.data
-        wen = cellram.wen
-        oen = cellram.oen
-        cen = cellram.cen
-        clk = cellram.clk
-        cre = cellram.cre
-        adv = cellram.adv # address valid (low)
-        lb = cellram.lb
-        ub = cellram.ub
-        ########################
-        tristate_data = TSTriple(data_width)
-        self.specials += tristate_data.get_tristate(data)
-        ########################
-        i_rst = ResetSignal("sys")
-        fsm = FSM(reset_state="RESET")
-        fsm = ResetInserter()(fsm)
-        self.submodules.fsm = fsm
-        self.sync += fsm.reset.eq(i_rst)
-        ########################
-        fsm.act("RESET",
-            NextState("INIT"))
-        ########################
-        fsm.act("INIT",
-            NextValue(self.delaycounter,0),
-            NextValue(self.bus.ack,0),
-            NextValue(cen,1),
-            NextValue(adv,1),
-            NextValue(lb,1),
-            NextValue(ub,1),
-            NextValue(clk,0),
-            NextValue(cre,0),
-            NextValue(tristate_data.oe,0),
-            NextState("IDLE"))
-        ########################
+    """CellularRAM controller (MT45W8MW16BGX, 16-bit, asynchronous page mode)
+
+    Exposes the 16-bit CellularRAM as a 32-bit Wishbone slave:
+    - Pads are registered and the two halfwords of a word are read in page mode: only the first
+    access of a page pays tAA, the next ones (within the same 16-halfword page, with CE kept low)
+    only pay tAPA.
+    - A one word read-ahead buffer is filled with the next word after each read. When it is in the
+    same page, the prefetch continues the page access, so sequential reads (instruction fetches)
+    stream at page mode speed.
+    - Writes take 1 + write_cycles cycles per halfword, halfwords not selected are skipped.
+    """
+    def __init__(self, pads, sys_clk_freq, tAA=70e-9, tAPA=20e-9, tCW=70e-9, with_read_ahead=True):
+        self.bus = bus = wishbone.Interface()
+
+        # # #
+
+        # Timings (in sys_clk cycles, reads with 6ns margin for IOs/board).
+        first_cycles = max(1, math.ceil((tAA  + 6e-9)*sys_clk_freq))
+        page_cycles  = max(1, math.ceil((tAPA + 6e-9)*sys_clk_freq))
+        write_cycles = max(1, math.ceil(tCW*sys_clk_freq))
+
+        # Pads (registered, asynchronous mode: clk/cre low, adv low).
+        adr   = Signal(len(pads.addr))
+        cs    = Signal()
+        we    = Signal()
+        oe    = Signal()
+        dat_w = Signal(16)
+        sel   = Signal(2)
+        dat_r = Signal(16)
+        cen   = Signal(reset=1)
+        wen   = Signal(reset=1)
+        oen   = Signal(reset=1)
+        lbn   = Signal(reset=1)
+        ubn   = Signal(reset=1)
+        data  = TSTriple(16)
+        self.specials += data.get_tristate(pads.data)
+        self.sync += [
+            pads.addr.eq(adr),
+            cen.eq(~cs),
+            wen.eq(~we),
+            oen.eq(~(cs & ~we)),
+            lbn.eq(~sel[0]),
+            ubn.eq(~sel[1]),
+            data.oe.eq(oe),
+            data.o.eq(dat_w),
+            dat_r.eq(data.i),
+        ]
+        self.comb += [
+            pads.cen.eq(cen),
+            pads.wen.eq(wen),
+            pads.oen.eq(oen),
+            pads.lb.eq(lbn),
+            pads.ub.eq(ubn),
+            pads.adv.eq(0),
+            pads.clk.eq(0),
+            pads.cre.eq(0),
+        ]
+
+        # Sequencer.
+        word_adr    = Signal(30)
+        word        = Signal(32)
+        half        = Signal()
+        timer       = Signal(max=max(first_cycles, write_cycles + 1))
+        page_open   = Signal()
+        speculative = Signal()
+        self.comb += [
+            adr.eq(Cat(half, word_adr)),
+            dat_w.eq(Mux(half, bus.dat_w[16:], bus.dat_w[:16])),
+            bus.dat_r.eq(word),
+        ]
+
+        # Read-ahead buffer (holds the next word once a speculative read is done).
+        prefetch_valid = Signal()
+        prefetch_hit   = Signal()
+        self.comb += prefetch_hit.eq(prefetch_valid & (bus.adr == word_adr))
+
+        # Read captures (data of a halfword is sampled 2 cycles after the end of its address phase).
+        capture      = Signal(2)
+        capture_half = Signal(2)
+        self.sync += [
+            capture[1].eq(capture[0]),
+            capture_half[1].eq(capture_half[0]),
+            If(capture[1],
+                If(capture_half[1],
+                    word[16:].eq(dat_r)
+                ).Else(
+                    word[:16].eq(dat_r)
+                )
+            )
+        ]
+
+        self.submodules.fsm = fsm = FSM(reset_state="IDLE")
         fsm.act("IDLE",
-            If(self.bus.stb & self.bus.cyc,
-
-                NextValue(lb,~self.bus.sel[0]), 
-                NextValue(ub,~self.bus.sel[1]),
-
-                NextValue(self.delaycounter,0),
-                NextValue(cen,0),
-                NextValue(adv,0),
-                NextValue(addr,self.bus.adr[:addr_width]),
-                If(self.bus.we,
-                    NextValue(wen,0),
-                    NextValue(oen,1),
-                    NextValue(tristate_data.oe,1),
-                    NextValue(tristate_data.o,self.bus.dat_w[:data_width]),
+            NextValue(half,      0),
+            NextValue(timer,     0),
+            NextValue(page_open, 0),
+            If(bus.cyc & bus.stb,
+                NextValue(speculative, 0),
+                NextValue(word_adr, bus.adr),
+                If(bus.we,
+                    NextValue(prefetch_valid, 0),
                     NextState("WRITE")
+                ).Elif(prefetch_hit,
+                    # Hit in read-ahead buffer: ack and prefetch next word.
+                    bus.ack.eq(1),
+                    NextValue(prefetch_valid, 0),
+                    NextValue(speculative, 1),
+                    NextValue(word_adr, bus.adr + 1),
+                    NextState("READ")
                 ).Else(
-                    NextValue(wen,1),
-                    NextValue(oen,0),
-                    NextValue(tristate_data.oe,0),
+                    NextValue(prefetch_valid, 0),
+                    NextState("READ")
+                )
+            )
+        )
+        fsm.act("READ",
+            cs.eq(1),
+            sel.eq(0b11),
+            If(timer == (Mux(page_open, page_cycles, first_cycles) - 1),
+                NextValue(timer, 0),
+                NextValue(half, ~half),
+                NextValue(page_open, 1),
+                If(half,
+                    NextState("READ-WAIT")
+                )
+            ).Else(
+                NextValue(timer, timer + 1)
+            )
+        )
+        self.sync += [
+            capture[0].eq(fsm.ongoing("READ") & (timer == (Mux(page_open, page_cycles, first_cycles) - 1))),
+            capture_half[0].eq(half),
+        ]
+        fsm.act("READ-WAIT",
+            # Keep the page open (CE low) while the last halfword is captured.
+            cs.eq(1),
+            sel.eq(0b11),
+            If(capture[1] & capture_half[1],
+                NextState("READ-DONE")
+            )
+        )
+        fsm.act("READ-DONE",
+            cs.eq(1),
+            sel.eq(0b11),
+            If(speculative,
+                NextValue(prefetch_valid, 1),
+                NextState("IDLE")
+            ).Else(
+                bus.ack.eq(1),
+                If(with_read_ahead,
+                    # Continue the page access if the next word is in the same page (8 words).
+                    NextValue(page_open, word_adr[:3] != 0b111),
+                    NextValue(speculative, 1),
+                    NextValue(word_adr, word_adr + 1),
                     NextState("READ")
+                ).Else(
+                    NextState("IDLE")
                 )
             )
         )
-        ########################
         fsm.act("WRITE",
-            NextValue(self.delaycounter,self.delaycounter+1),
-            If(self.delaycounter==delay_for_70ns,
-                NextValue(self.bus.ack,1),
-                NextState("INIT"))
+            # CE-controlled writes (WE asserted first, OE kept high).
+            we.eq(1),
+            oe.eq(1),
+            sel.eq(Mux(half, bus.sel[2:4], bus.sel[0:2])),
+            cs.eq((sel != 0) & (timer != 0)),
+            If((sel == 0) | (timer == write_cycles),
+                NextValue(timer, 0),
+                NextValue(half, ~half),
+                If(half,
+                    NextState("WRITE-DONE")
+                )
+            ).Else(
+                NextValue(timer, timer + 1)
+            )
         )
-        ########################
-        fsm.act("READ",
-            NextValue(self.delaycounter,self.delaycounter+1),
-            NextValue(self.bus.dat_r,tristate_data.i[:data_width]),
-            If(self.delaycounter==delay_for_70ns,
-                NextValue(self.bus.ack,1),
-                NextState("INIT"))
+        fsm.act("WRITE-DONE",
+            bus.ack.eq(1),
+            NextState("IDLE")
         )
-        ########################
 
 def addCellularRAM(soc, platform, name, origin):
     size = 16*1024*1024
-    ram_bus = wishbone.Interface(data_width=soc.bus.data_width)
-    ram     = CellularRAM(soc,platform)
+    ram  = CellularRAM(platform.request("cellularram"), sys_clk_freq=soc.sys_clk_freq)
     soc.bus.add_slave(name, ram.bus, SoCRegion(origin=origin, size=size, mode="rw"))
     soc.check_if_exists(name)
     soc.logger.info("CELLULARRAM {} {} {}.".format(
@@ -178,6 +264,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.rmii import LiteEthPHYRMII
             self.submodules.ethphy = LiteEthPHYRMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
@@ -188,6 +275,7 @@ class BaseSoC(SoCCore):
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal or with_video_framebuffer:
+            from litex.soc.cores.video import VideoVGAPHY
             self.submodules.videophy = VideoVGAPHY(platform.request("vga"), clock_domain="vga")
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="vga")
@@ -220,6 +308,7 @@ def main():
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (VGA).")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -234,6 +323,7 @@ def main():
         soc.add_spi_sdcard()
     if args.with_sdcard:
         soc.add_sdcard()
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
@@ -15,8 +15,8 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
-from litex.soc.cores.video import VideoVGAPHY
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -46,6 +46,7 @@ class BaseSoC(SoCCore):
 
         # VGA terminal -----------------------------------------------------------------------------
         if with_video_terminal:
+            from litex.soc.cores.video import VideoVGAPHY
             self.submodules.videophy = VideoVGAPHY(platform.request("vga"), clock_domain="vga")
             self.add_video_terminal(phy=self.videophy, timings="640x480@75Hz", clock_domain="vga")
 
@@ -70,6 +71,7 @@ def main():
 
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     vivado_build_args(parser)
     args = parser.parse_args()
 
@@ -79,6 +81,7 @@ def main():
         **soc_core_argdict(args)
     )
 
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build(**vivado_build_argdict(args))
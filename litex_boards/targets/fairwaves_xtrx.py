@@ -32,13 +32,11 @@ from litex_boards.platforms import fairwaves_xtrx
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.clock import *
 
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(Module):
@@ -74,6 +72,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x2"),
                 data_width = 64,
                 bar0_size  = 0x20000)
@@ -112,6 +111,7 @@ def main():
     target_group.add_argument("--driver",          action="store_true", help="Generate PCIe driver.")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -119,11 +119,13 @@ def main():
         with_pcie    = args.with_pcie,
         **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder  = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
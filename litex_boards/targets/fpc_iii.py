@@ -16,13 +16,13 @@ from litex.build.lattice.trellis import trellis_args, trellis_argdict
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import IS43TR16256A
 from litedram.phy import ECP5DDRPHY
 
-from liteeth.phy.mii import LiteEthPHYMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -98,14 +98,19 @@ class BaseSoC(SoCCore):
             self.comb += self.crg.reset.eq(self.ddrphy.init.reset)
             self.comb += ddram.vccio.eq(Replicate(C(1), ddram.vccio.nbits))
             self.add_sdram("sdram",
-                phy           = self.ddrphy,
-                module        = IS43TR16256A(sys_clk_freq, "1:2"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                phy                     = self.ddrphy,
+                module                  = IS43TR16256A(sys_clk_freq, "1:2"),
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True)
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
         self.comb += platform.request("dram_vtt_en").eq(0 if self.integrated_main_ram_size else 1)
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.mii import LiteEthPHYMII
             self.submodules.ethphy = LiteEthPHYMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
@@ -138,6 +143,8 @@ def main():
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     trellis_args(parser)
     args = parser.parse_args()
 
@@ -146,11 +153,13 @@ def main():
         toolchain      = args.toolchain,
         with_ethernet  = args.with_ethernet,
         with_etherbone = args.with_etherbone,
-        **soc_core_argdict(args))
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args))
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
     if args.with_sdcard:
         soc.add_sdcard()
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = trellis_argdict(args) if args.toolchain == "trellis" else {}
     if args.build:
@@ -22,6 +22,8 @@ from litex_boards.platforms import hpcstore_xc7k420t
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 
@@ -29,9 +31,6 @@ from litedram.phy import s7ddrphy
 from litedram.common import PHYPadsReducer
 from litedram.modules import K4B1G0446F
 
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -89,13 +88,18 @@ class BaseSoC(SoCCore):
                 iodelay_clk_freq = 200e6
             )
             self.add_sdram("sdram",
-                phy           = self.ddrphy,
-                module        = K4B1G0446F(sys_clk_freq, "1:4", "800"),
-                l2_cache_size = kwargs.get("l2_size", 8192),
+                phy                     = self.ddrphy,
+                module                  = K4B1G0446F(sys_clk_freq, "1:4", "800"),
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True),
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
@@ -148,6 +152,8 @@ def main():
     target_group.add_argument("--with-sata",       action="store_true", help="Enable SATA support.")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -155,13 +161,16 @@ def main():
         io_voltage     = args.io_voltage,
         with_pcie      = args.with_pcie,
         with_sata      = args.with_sata,
-        **soc_core_argdict(args)
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -28,7 +28,9 @@ from litex.soc.cores.clock import iCE40PLL
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
-from litex.soc.cores.video import VideoDVIPHY
+from litex_boards.cores import add_args, apply_args
+
+from litex_boards.cores.spiflash_cache import add_spi_flash_cache
 from litex.soc.cores.led import LedChaser
 
 kB = 1024
@@ -67,7 +69,7 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, bios_flash_offset, sys_clk_freq=int(24e6), with_led_chaser=True,
-                 with_video_terminal=False, **kwargs):
+                 with_video_terminal=False, sram_size=64*kB, flash_cache_size=0, **kwargs):
         platform = icebreaker.Platform()
         platform.add_extension(icebreaker.break_off_pmod)
 
@@ -80,18 +82,22 @@ class BaseSoC(SoCCore):
         kwargs["integrated_rom_size"]  = 0
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on iCEBreaker", **kwargs)
 
-        # 128KB SPRAM (used as 64kB SRAM / 64kB RAM) -----------------------------------------------
+        # 128KB SPRAM (used as SRAM / RAM, 64kB / 64kB by default) --------------------------------
+        # Note: Hot code can be shadowed in SRAM by placing it in a .data.* section (ex with
+        # __attribute__((section(".data.ramtext")))): It is then copied from SPI Flash at boot
+        # with the initialized data. A larger SRAM leaves more room for it.
+        assert sram_size <= 128*kB
         self.submodules.spram = Up5kSPRAM(size=128*kB)
         self.bus.add_slave("psram", self.spram.bus, SoCRegion(size=128*kB))
         self.bus.add_region("sram", SoCRegion(
                 origin = self.bus.regions["psram"].origin + 0*kB,
-                size   = 64*kB,
+                size   = sram_size,
                 linker = True)
         )
-        if not self.integrated_main_ram_size:
+        if not self.integrated_main_ram_size and sram_size < 128*kB:
             self.bus.add_region("main_ram", SoCRegion(
-                origin = self.bus.regions["psram"].origin + 64*kB,
-                size   = 64*kB,
+                origin = self.bus.regions["psram"].origin + sram_size,
+                size   = 128*kB - sram_size,
                 linker = True)
             )
 
@@ -99,6 +105,8 @@ class BaseSoC(SoCCore):
         from litespi.modules import W25Q128JV
         from litespi.opcodes import SpiNorFlashOpCodes as Codes
         self.add_spi_flash(mode="4x", module=W25Q128JV(Codes.READ_1_1_4), with_master=False)
+        if flash_cache_size:
+            add_spi_flash_cache(self, size=flash_cache_size)
 
         # Add ROM linker region --------------------------------------------------------------------
         self.bus.add_region("rom", SoCRegion(
@@ -110,6 +118,7 @@ class BaseSoC(SoCCore):
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal:
+            from litex.soc.cores.video import VideoDVIPHY
             platform.add_extension(icebreaker.dvi_pmod)
             self.submodules.videophy = VideoDVIPHY(platform.request("dvi"), clock_domain="sys")
             self.add_video_terminal(phy=self.videophy, timings="640x480@75Hz", clock_domain="sys")
@@ -139,18 +148,24 @@ def main():
     target_group.add_argument("--flash",               action="store_true", help="Flash Bitstream and BIOS.")
     target_group.add_argument("--sys-clk-freq",        default=24e6,        help="System clock frequency.")
     target_group.add_argument("--bios-flash-offset",   default="0x40000",   help="BIOS offset in SPI Flash.")
+    target_group.add_argument("--sram-size",           default="0x10000",   help="SRAM size in SPRAM (remaining SPRAM used as RAM).")
+    target_group.add_argument("--flash-cache-size",    default=0, type=int, help="SPI Flash XIP cache size (0 to disable).")
     target_group.add_argument("--with-video-terminal", action="store_true", help="Enable Video Terminal (with DVI PMOD).")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     icestorm_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         bios_flash_offset   = int(args.bios_flash_offset, 0),
         sys_clk_freq        = int(float(args.sys_clk_freq)),
+        sram_size           = int(args.sram_size, 0),
+        flash_cache_size    = args.flash_cache_size,
         with_video_terminal = args.with_video_terminal,
         **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build(**icestorm_argdict(args))
@@ -27,6 +27,9 @@ from litex.soc.cores.clock import iCE40PLL
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
+
+from litex_boards.cores.spiflash_cache import add_spi_flash_cache
 
 kB = 1024
 mB = 1024*kB
@@ -97,7 +100,7 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, bios_flash_offset, sys_clk_freq=int(24e6), revision="v1", **kwargs):
+    def __init__(self, bios_flash_offset, sys_clk_freq=int(24e6), revision="v1", sram_size=64*kB, flash_cache_size=0, **kwargs):
         platform = icebreaker_bitsy.Platform(revision=revision)
 
         # CRG --------------------------------------------------------------------------------------
@@ -112,18 +115,22 @@ class BaseSoC(SoCCore):
         kwargs["integrated_rom_size"]  = 0
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on iCEBreaker-bitsy", **kwargs)
 
-        # 128KB SPRAM (used as 64kB SRAM / 64kB RAM) -----------------------------------------------
+        # 128KB SPRAM (used as SRAM / RAM, 64kB / 64kB by default) --------------------------------
+        # Note: Hot code can be shadowed in SRAM by placing it in a .data.* section (ex with
+        # __attribute__((section(".data.ramtext")))): It is then copied from SPI Flash at boot
+        # with the initialized data. A larger SRAM leaves more room for it.
+        assert sram_size <= 128*kB
         self.submodules.spram = Up5kSPRAM(size=128*kB)
         self.bus.add_slave("psram", self.spram.bus, SoCRegion(size=128*kB))
         self.bus.add_region("sram", SoCRegion(
                 origin = self.bus.regions["psram"].origin + 0*kB,
-                size   = 64*kB,
+                size   = sram_size,
                 linker = True)
         )
-        if not self.integrated_main_ram_size:
+        if not self.integrated_main_ram_size and sram_size < 128*kB:
             self.bus.add_region("main_ram", SoCRegion(
-                origin = self.bus.regions["psram"].origin + 64*kB,
-                size   = 64*kB,
+                origin = self.bus.regions["psram"].origin + sram_size,
+                size   = 128*kB - sram_size,
                 linker = True)
             )
 
@@ -131,6 +138,8 @@ class BaseSoC(SoCCore):
         from litespi.modules import W25Q128JV
         from litespi.opcodes import SpiNorFlashOpCodes as Codes
         self.add_spi_flash(mode="4x", module=W25Q128JV(Codes.READ_1_1_4), with_master=False)
+        if flash_cache_size:
+            add_spi_flash_cache(self, size=flash_cache_size)
 
         # Add ROM linker region --------------------------------------------------------------------
         self.bus.add_region("rom", SoCRegion(
@@ -150,18 +159,24 @@ def main():
     target_group.add_argument("--flash",               action="store_true", help="Flash bitstream and BIOS.")
     target_group.add_argument("--sys-clk-freq",        default=24e6,        help="System clock frequency.")
     target_group.add_argument("--bios-flash-offset",   default="0xa0000",   help="BIOS offset in SPI Flash.")
+    target_group.add_argument("--sram-size",           default="0x10000",   help="SRAM size in SPRAM (remaining SPRAM used as RAM).")
+    target_group.add_argument("--flash-cache-size",    default=0, type=int, help="SPI Flash XIP cache size (0 to disable).")
     target_group.add_argument("--revision",            default="v1",        help="Board revision (v0 or v1).")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     icestorm_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         bios_flash_offset   = int(args.bios_flash_offset, 0),
         sys_clk_freq        = int(float(args.sys_clk_freq)),
+        sram_size           = int(args.sram_size, 0),
+        flash_cache_size    = args.flash_cache_size,
 		revision            = args.revision,
         **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build(**icestorm_argdict(args))
@@ -22,6 +22,9 @@ from litex.soc.cores.clock import iCE40PLL
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
+
+from litex_boards.cores.spiflash_cache import add_spi_flash_cache
 from litex.soc.cores.led import LedChaser
 
 kB = 1024
@@ -69,7 +72,7 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, bios_flash_offset, spi_flash_module="AT25SF161", sys_clk_freq=int(12e6),
-                 with_led_chaser=True, **kwargs):
+                 with_led_chaser=True, sram_size=64*kB, flash_cache_size=0, **kwargs):
         platform = kosagi_fomu_pvt.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -83,18 +86,22 @@ class BaseSoC(SoCCore):
         kwargs["integrated_rom_size"]  = 0
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Fomu", **kwargs)
 
-        # 128KB SPRAM (used as 64kB SRAM / 64kB RAM) -----------------------------------------------
+        # 128KB SPRAM (used as SRAM / RAM, 64kB / 64kB by default) --------------------------------
+        # Note: Hot code can be shadowed in SRAM by placing it in a .data.* section (ex with
+        # __attribute__((section(".data.ramtext")))): It is then copied from SPI Flash at boot
+        # with the initialized data. A larger SRAM leaves more room for it.
+        assert sram_size <= 128*kB
         self.submodules.spram = Up5kSPRAM(size=128*kB)
         self.bus.add_slave("psram", self.spram.bus, SoCRegion(size=128*kB))
         self.bus.add_region("sram", SoCRegion(
                 origin = self.bus.regions["psram"].origin + 0*kB,
-                size   = 64*kB,
+                size   = sram_size,
                 linker = True)
         )
-        if not self.integrated_main_ram_size:
+        if not self.integrated_main_ram_size and sram_size < 128*kB:
             self.bus.add_region("main_ram", SoCRegion(
-                origin = self.bus.regions["psram"].origin + 64*kB,
-                size   = 64*kB,
+                origin = self.bus.regions["psram"].origin + sram_size,
+                size   = 128*kB - sram_size,
                 linker = True)
             )
 
@@ -110,6 +117,8 @@ class BaseSoC(SoCCore):
             "W25Q128JV":  lambda: W25Q128JV( Codes.READ_1_1_4),
         }
         self.add_spi_flash(mode="4x", module=spi_flash_modules[spi_flash_module](), with_master=False)
+        if flash_cache_size:
+            add_spi_flash_cache(self, size=flash_cache_size)
 
         # Add ROM linker region --------------------------------------------------------------------
         self.bus.add_region("rom", SoCRegion(
@@ -162,9 +171,12 @@ def main():
     target_group.add_argument("--build",             action="store_true", help="Build design.")
     target_group.add_argument("--sys-clk-freq",      default=12e6,        help="System clock frequency.")
     target_group.add_argument("--bios-flash-offset", default="0x20000",   help="BIOS offset in SPI Flash.")
+    target_group.add_argument("--sram-size",         default="0x10000",   help="SRAM size in SPRAM (remaining SPRAM used as RAM).")
+    target_group.add_argument("--flash-cache-size",  default=0, type=int, help="SPI Flash XIP cache size (0 to disable).")
     target_group.add_argument("--flash",             action="store_true", help="Flash Bitstream.")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     icestorm_args(parser)
     args = parser.parse_args()
 
@@ -173,8 +185,11 @@ def main():
     soc = BaseSoC(
         bios_flash_offset = dfu_flash_offset + int(args.bios_flash_offset, 0),
         sys_clk_freq      = int(float(args.sys_clk_freq)),
+        sram_size         = int(args.sram_size, 0),
+        flash_cache_size  = args.flash_cache_size,
         **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build(**icestorm_argdict(args))
@@ -20,6 +20,7 @@ from litex.build.generic_platform import *
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 
 from litex.build.lattice.oxide import oxide_args, oxide_argdict
@@ -105,6 +106,7 @@ def main():
     target_group.add_argument("--prog-target",   default="direct",           help="Programming Target (direct or flash).")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     oxide_args(parser)
     args = parser.parse_args()
 
@@ -114,6 +116,7 @@ def main():
         toolchain    = args.toolchain,
         **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = oxide_argdict(args) if args.toolchain == "oxide" else {}
     if args.build:
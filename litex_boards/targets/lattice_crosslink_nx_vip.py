@@ -14,7 +14,8 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 
 from litex_boards.platforms import lattice_crosslink_nx_vip
 
-from litex.soc.cores.hyperbus import HyperRAM
+from litex.soc.cores.bitbang import I2CMaster
+from litex.soc.cores.dma import WishboneDMAWriter
 
 from litex.soc.cores.ram import NXLRAM
 from litex.build.io import CRG
@@ -24,7 +25,12 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
+from litex.soc.cores.gpio import GPIOOut
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+from litex.soc.interconnect import wishbone
 
 from litex.build.lattice.oxide import oxide_args, oxide_argdict
 
@@ -56,16 +62,226 @@ class _CRG(Module):
         self.specials += AsyncResetSynchronizer(self.cd_sys, (por_counter != 0) | self.rst)
 
 
+# HyperRAM Interleaver -----------------------------------------------------------------------------
+
+class _HyperRAMInterleaver(Module):
+    """HyperRAM Interleaver
+
+    Exposes n HyperRAMs as a single memory with 32-bit words interleaved between them (word i goes
+    to HyperRAM i % n at offset i // n). Each access of the (32 x n x burst)-bit bus is done on all
+    HyperRAMs concurrently as a burst of `burst` consecutive words, multiplying bandwidth by n and
+    amortizing the HyperRAM command/latency overhead over the burst.
+    """
+    def __init__(self, buses, burst=2):
+        n = len(buses)
+        self.bus = bus = wishbone.Interface(data_width=32*n*burst)
+
+        # # #
+
+        dones = []
+        for i, hr_bus in enumerate(buses):
+            count = Signal(max=max(burst, 2))
+            dat_r = Signal(32*burst)
+            done  = Signal()
+            dones.append(done)
+
+            # Word j of the burst on HyperRAM i is word (j*n + i) of the bus.
+            sels  = [bus.sel[4*(j*n + i):4*(j*n + i + 1)]     for j in range(burst)]
+            dat_w = [bus.dat_w[32*(j*n + i):32*(j*n + i + 1)] for j in range(burst)]
+            for j in range(burst):
+                self.comb += bus.dat_r[32*(j*n + i):32*(j*n + i + 1)].eq(dat_r[32*j:32*(j + 1)])
+
+            # Only access the HyperRAM on reads or when at least one of its bytes is written.
+            access = Signal()
+            self.comb += access.eq(~bus.we | (Cat(*sels) != 0))
+
+            fsm = FSM(reset_state="IDLE")
+            self.submodules += fsm
+            fsm.act("IDLE",
+                NextValue(count, 0),
+                If(bus.cyc & bus.stb,
+                    If(access,
+                        NextState("ACCESS")
+                    ).Else(
+                        NextState("DONE")
+                    )
+                )
+            )
+            fsm.act("ACCESS",
+                hr_bus.cyc.eq(1),
+                hr_bus.stb.eq(1),
+                hr_bus.we.eq(bus.we),
+                hr_bus.adr.eq(bus.adr*burst + count),
+                hr_bus.sel.eq(Array(sels)[count]),
+                hr_bus.dat_w.eq(Array(dat_w)[count]),
+                If(hr_bus.ack,
+                    NextValue(count, count + 1),
+                    If(count == (burst - 1),
+                        NextState("DONE")
+                    )
+                )
+            )
+            fsm.act("DONE",
+                done.eq(1),
+                If(bus.ack,
+                    NextState("IDLE")
+                )
+            )
+            self.sync += If(fsm.ongoing("ACCESS") & hr_bus.ack,
+                Case(count, {j: dat_r[32*j:32*(j + 1)].eq(hr_bus.dat_r) for j in range(burst)})
+            )
+
+        self.comb += bus.ack.eq(bus.cyc & bus.stb & (Cat(*dones) == (2**n - 1)))
+
+# Test Pattern -------------------------------------------------------------------------------------
+
+class _TestPattern(Module):
+    """Test pattern
+
+    Generates a 16-bit pixel stream with camera framing (first: start of frame, last: end of line)
+    at 1 pixel every `divider` cycles, allowing to validate/benchmark the capture path (line buffers,
+    DMAs, HyperRAMs) without sensors.
+    """
+    def __init__(self, width=640, height=480, divider=4):
+        self.source = source = stream.Endpoint([("data", 16)])
+
+        # # #
+
+        tick  = Signal(max=divider)
+        x     = Signal(max=width)
+        y     = Signal(max=height)
+        frame = Signal(8)
+        self.sync += [
+            tick.eq(tick + 1),
+            If(tick == (divider - 1), tick.eq(0)),
+            If(source.valid & source.ready,
+                x.eq(x + 1),
+                If(x == (width - 1),
+                    x.eq(0),
+                    y.eq(y + 1),
+                    If(y == (height - 1),
+                        y.eq(0),
+                        frame.eq(frame + 1)
+                    )
+                )
+            )
+        ]
+        self.comb += [
+            source.valid.eq(tick == 0),
+            source.first.eq((x == 0) & (y == 0)),
+            source.last.eq(x == (width - 1)),
+            source.data.eq(x + y + frame),
+        ]
+
+# Camera Capture -----------------------------------------------------------------------------------
+
+class _CameraCapture(Module, AutoCSR):
+    """Camera capture to HyperRAM
+
+    Captures a 16-bit pixel stream (first: start of frame, last: end of line) into a ring of frame
+    buffers. Pixels are packed to n x 32-bit words and each 32-bit lane is written to its own
+    HyperRAM through a line buffer and a Wishbone DMA, so the n HyperRAMs are written in parallel
+    (word i of a frame goes to HyperRAM i % n at offset i // n).
+
+    Capture is started/stopped on frame boundaries. The camera can't be stalled, pixels received
+    while the line buffers are full are dropped and counted. The frame buffers base/size registers
+    default to base/frame_size, the buffers reserved for the capture by the SoC.
+    """
+    def __init__(self, n=2, line_depth=512, base=0, frame_size=0):
+        self.sink  = sink = stream.Endpoint([("data", 16)])
+        self.buses = [wishbone.Interface() for _ in range(n)]
+
+        self._enable     = CSRStorage(description="Capture Enable (applied on the next frame).")
+        self._base       = CSRStorage(32, reset=base,       description="Frame buffers base (in bytes, per HyperRAM).")
+        self._frame_size = CSRStorage(32, reset=frame_size, description="Frame size (in bytes, per HyperRAM).")
+        self._nframes    = CSRStorage(8, reset=2, description="Number of frame buffers in the ring.")
+        self._frames     = CSRStatus(32, description="Number of captured frames.")
+        self._index      = CSRStatus(8,  description="Index of the last captured frame buffer.")
+        self._overflows  = CSRStatus(32, description="Number of pixels dropped on overflow.")
+
+        # # #
+
+        # Start/Stop Capture on frame boundaries.
+        active  = Signal()
+        capture = Signal()
+        self.sync += If(sink.valid & sink.first, active.eq(self._enable.storage))
+        self.comb += capture.eq(Mux(sink.first, self._enable.storage, active))
+
+        # Pack pixels to n x 32-bit words.
+        self.submodules.converter = converter = stream.Converter(16, 32*n)
+        self.comb += [
+            sink.connect(converter.sink, omit={"valid", "ready"}),
+            converter.sink.valid.eq(sink.valid & capture),
+            sink.ready.eq(1),
+        ]
+        self.sync += If(converter.sink.valid & ~converter.sink.ready,
+            self._overflows.status.eq(self._overflows.status + 1)
+        )
+
+        # Frame Buffers Addressing (in words, per HyperRAM).
+        frame_words = Signal(30)
+        offset      = Signal(30)
+        slot_base   = Signal(30)
+        slot        = Signal(8)
+        adr         = Signal(30)
+        self.comb += [
+            frame_words.eq(self._frame_size.storage[2:]),
+            adr.eq(self._base.storage[2:] + slot_base + Mux(converter.source.first, 0, offset)),
+        ]
+
+        # Line Buffers / DMAs (one per HyperRAM).
+        ready = Signal()
+        fifos = []
+        for i in range(n):
+            fifo   = stream.SyncFIFO([("address", 30), ("data", 32)], line_depth, buffered=True)
+            writer = WishboneDMAWriter(self.buses[i], endianness="big") # No byte swapping.
+            self.submodules += fifo, writer
+            self.comb += [
+                fifo.sink.valid.eq(converter.source.valid & ready),
+                fifo.sink.address.eq(adr),
+                fifo.sink.data.eq(converter.source.data[32*i:32*(i + 1)]),
+                fifo.source.connect(writer.sink),
+            ]
+            fifos.append(fifo)
+        self.comb += [
+            ready.eq(Cat(*[fifo.sink.ready for fifo in fifos]) == (2**n - 1)),
+            converter.source.ready.eq(ready),
+        ]
+
+        # Frame Counters / Ring Management (a new frame restarts at the beginning of its buffer).
+        self.sync += If(converter.source.valid & converter.source.ready,
+            offset.eq(Mux(converter.source.first, 1, offset + 1)),
+            If(Mux(converter.source.first, 0, offset) == (frame_words - 1),
+                offset.eq(0),
+                self._frames.status.eq(self._frames.status + 1),
+                self._index.status.eq(slot),
+                If(slot == (self._nframes.storage - 1),
+                    slot.eq(0),
+                    slot_base.eq(0)
+                ).Else(
+                    slot.eq(slot + 1),
+                    slot_base.eq(slot_base + frame_words)
+                )
+            )
+        )
+
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
     mem_map = {
-        "rom":  0x00000000,
-        "sram": 0x40000000,
-        "csr":  0xf0000000,
+        "rom":       0x00000000,
+        "sram":      0x40000000,
+        "hyperram0": 0x20000000,
+        "hyperram1": 0x20800000,
+        "csr":       0xf0000000,
     }
     def __init__(self, sys_clk_freq=int(75e6), hyperram="none", toolchain="radiant",
-                 with_led_chaser=True, **kwargs):
+                 with_led_chaser      = True,
+                 hyperram_burst       = 2,
+                 hyperram_cache_size  = 8192,
+                 with_pattern_capture = False,
+                 cameras              = (2, 3),
+                 **kwargs):
         platform = lattice_crosslink_nx_vip.Platform(toolchain=toolchain)
         platform.add_platform_command("ldc_set_sysconfig {{MASTER_SPI_PORT=SERIAL}}")
 
@@ -77,25 +293,120 @@ class BaseSoC(SoCCore):
         kwargs["integrated_sram_size"] = 0
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Crosslink-NX VIP Input Board", **kwargs)
 
+        # Capture Frame Buffers --------------------------------------------------------------------
+        # Reserved at the top of each HyperRAM (capture_size bytes per camera).
+        capture_size     = 1*mB
+        capture_reserved = len(cameras)*capture_size if with_pattern_capture else 0
+
         # SRAM/HyperRAM ----------------------------------------------------------------------------
         if hyperram == "none":
             # 128KB LRAM (used as SRAM) ------------------------------------------------------------
             size = 128*kB
             self.submodules.spram = NXLRAM(32, size)
             self.bus.add_slave("sram", slave=self.spram.bus, region=SoCRegion(size=size))
+        elif hyperram == "dual":
+            # Use both HyperRAMs interleaved as SRAM -----------------------------------------------
+            size = 2*8*1024*kB
+            self.add_hyperrams()
+            hr_buses = [wishbone.Interface() for _ in range(2)]
+            self.submodules.hyperram_interleaver = interleaver = _HyperRAMInterleaver(
+                buses = hr_buses,
+                burst = hyperram_burst)
+            for n in range(2):
+                self.hyperram_masters[n].append(hr_buses[n])
+            sram_bus = wishbone.Interface()
+            if hyperram_cache_size:
+                # Write-back cache in front of the HyperRAMs (one line = one interleaved access).
+                # Note: Not coherent with the Camera Captures, disable it to read frames from CPU.
+                self.submodules.hyperram_cache = wishbone.Cache(
+                    cachesize = hyperram_cache_size//4,
+                    master    = sram_bus,
+                    slave     = interleaver.bus,
+                    reverse   = False)
+            else:
+                self.submodules += wishbone.Converter(sram_bus, interleaver.bus)
+            if capture_reserved:
+                # Capture Frame Buffers at the end of the HyperRAMs, kept out of the SRAM linker
+                # region (CPU data/stack) but accessible from the CPU.
+                self.bus.add_slave("hyperram", slave=sram_bus, region=SoCRegion(
+                    origin = self.mem_map["sram"],
+                    size   = size))
+                self.bus.add_region("sram", SoCRegion(
+                    origin = self.mem_map["sram"],
+                    size   = size - 2*capture_reserved,
+                    linker = True))
+            else:
+                self.bus.add_slave("sram", slave=sram_bus, region=SoCRegion(size=size))
         else:
             # Use HyperRAM generic PHY as SRAM -----------------------------------------------------
+            from litex.soc.cores.hyperbus import HyperRAM
             size = 8*1024*kB
             hr_pads = platform.request("hyperram", int(hyperram))
             self.submodules.hyperram = HyperRAM(hr_pads, sys_clk_freq=sys_clk_freq)
             self.bus.add_slave("sram", slave=self.hyperram.bus, region=SoCRegion(size=size))
 
+        # Pattern Capture --------------------------------------------------------------------------
+        # Note: LiteX has no MIPI CSI-2 receiver (Nexus hard D-PHY) yet: the cameras are brought up
+        # (MCLK, reset/frame-sync, I2C) and each capture is fed by a test pattern.
+        if with_pattern_capture:
+            # Frames are written to both HyperRAMs: When used as SRAM (dual), they appear linearly
+            # in the hyperram region (same interleaving), otherwise each HyperRAM gets its own region.
+            if hyperram not in ["none", "dual"]:
+                raise ValueError(f"Pattern Capture requires both HyperRAMs (hyperram none or dual, not {hyperram}).")
+            if hyperram == "none":
+                self.add_hyperrams()
+                for n in range(2):
+                    hr_bus = wishbone.Interface()
+                    self.bus.add_slave(f"hyperram{n}", hr_bus, SoCRegion(
+                        origin = self.mem_map[f"hyperram{n}"],
+                        size   = 8*mB))
+                    self.hyperram_masters[n].append(hr_bus)
+
+            # Cameras MCLK (sys_clk/4) / Control (Reset released by default).
+            mclk = Signal(2)
+            self.sync += mclk.eq(mclk + 1)
+            for n in cameras:
+                self.comb += platform.request("camera_mclk", n).eq(mclk[1])
+            cam_ctrl = platform.request("cam_ctrl")
+            self.submodules.cam_ctrl = GPIOOut(Cat(cam_ctrl.cam_reset, cam_ctrl.cam_frame_sync), reset=0b01)
+
+            # Cameras: I2C configuration + Pattern Capture (Line Buffers / DMAs to HyperRAMs).
+            for i, n in enumerate(cameras):
+                setattr(self.submodules, f"camera{n}_i2c", I2CMaster(platform.request("i2c", n)))
+                pattern = _TestPattern()
+                capture = _CameraCapture(n=2,
+                    base       = 8*mB - capture_reserved + i*capture_size,
+                    frame_size = 640*480*2//2) # 640x480 16-bit pattern, half of a frame per HyperRAM.
+                setattr(self.submodules, f"camera{n}_pattern", pattern)
+                setattr(self.submodules, f"camera{n}_capture", capture)
+                self.comb += pattern.source.connect(capture.sink)
+                for i, bus in enumerate(capture.buses):
+                    self.hyperram_masters[i].append(bus)
+
+        # HyperRAMs Arbitration --------------------------------------------------------------------
+        for n, masters in enumerate(getattr(self, "hyperram_masters", [])):
+            hr = getattr(self, f"hyperram{n}")
+            if len(masters) == 1:
+                self.comb += masters[0].connect(hr.bus)
+            else:
+                self.submodules += wishbone.Arbiter(masters, hr.bus)
+
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
             self.submodules.leds = LedChaser(
                 pads         = Cat(*[platform.request("user_led", i) for i in range(4)]),
                 sys_clk_freq = sys_clk_freq)
 
+    # HyperRAMs ------------------------------------------------------------------------------------
+
+    def add_hyperrams(self):
+        # Both HyperRAMs, each shared between its masters (see HyperRAMs Arbitration).
+        self.hyperram_masters = [[], []]
+        from litex.soc.cores.hyperbus import HyperRAM
+        for n in range(2):
+            hr = HyperRAM(self.platform.request("hyperram", n), sys_clk_freq=self.sys_clk_freq)
+            setattr(self.submodules, f"hyperram{n}", hr)
+
 # Build --------------------------------------------------------------------------------------------
 
 def main():
@@ -106,19 +417,29 @@ def main():
     target_group.add_argument("--load",          action="store_true", help="Load bitstream.")
     target_group.add_argument("--toolchain",     default="radiant",   help="FPGA toolchain (radiant or prjoxide).")
     target_group.add_argument("--sys-clk-freq",  default=75e6,        help="System clock frequency.")
-    target_group.add_argument("--with-hyperram", default="none",      help="Enable use of HyperRAM chip (none, 0 or 1).")
+    target_group.add_argument("--with-hyperram", default="none",      help="Enable use of HyperRAM chip (none, 0, 1 or dual).")
+    target_group.add_argument("--hyperram-burst",      default=2,    type=int, help="Words per HyperRAM per access in dual mode.")
+    target_group.add_argument("--hyperram-cache-size", default=8192, type=int, help="HyperRAM cache size in dual mode (0 to disable).")
     target_group.add_argument("--prog-target",   default="direct",    help="Programming Target (direct or flash).")
+    target_group.add_argument("--with-pattern-capture", action="store_true", help="Enable test pattern capture to HyperRAMs (capture path/DMA test).")
+    target_group.add_argument("--cameras",              default="2,3",       help="Cameras brought up with --with-pattern-capture (comma separated, 0-3).")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     oxide_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = int(float(args.sys_clk_freq)),
-        hyperram     = args.with_hyperram,
-        toolchain    = args.toolchain,
+        sys_clk_freq         = int(float(args.sys_clk_freq)),
+        hyperram             = args.with_hyperram,
+        toolchain            = args.toolchain,
+        hyperram_burst       = args.hyperram_burst,
+        hyperram_cache_size  = args.hyperram_cache_size,
+        with_pattern_capture = args.with_pattern_capture,
+        cameras              = tuple(int(n) for n in args.cameras.split(",")),
         **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = oxide_argdict(args) if args.toolchain == "oxide" else {}
     if args.build:
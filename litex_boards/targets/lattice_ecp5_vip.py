@@ -17,12 +17,13 @@ from litex.build.lattice.trellis import trellis_args, trellis_argdict
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import MT41K64M16
 from litedram.phy import ECP5DDRPHY
-from litex.soc.cores.video import VideoVGAPHY
 from litex.soc.cores.bitbang import I2CMaster
 
 
@@ -103,13 +104,18 @@ class BaseSoC(SoCCore):
         self.comb += self.crg.stop.eq(self.ddrphy.init.stop)
         self.comb += self.crg.reset.eq(self.ddrphy.init.reset)
         self.add_sdram("sdram",
-            phy           = self.ddrphy,
-            module        = MT41K64M16(sys_clk_freq, "1:2"), # Not entirely MT41J64M16 but similar and works(c)
-            l2_cache_size = kwargs.get("l2_size", 8192),
+            phy                     = self.ddrphy,
+            module                  = MT41K64M16(sys_clk_freq, "1:2"), # Not entirely MT41J64M16 but similar and works(c)
+            l2_cache_size           = kwargs.get("l2_size", 8192),
+            l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+            l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True),
         )
+        if kwargs.get("with_l2_stats", False):
+            add_l2_cache_stats(self)
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal or with_video_framebuffer:
+            from litex.soc.cores.video import VideoVGAPHY
             pads = platform.request("hdmi")
             self.submodules.videophy = VideoVGAPHY(pads, clock_domain="hdmi")
             self.submodules.videoi2c = I2CMaster(pads)
@@ -195,13 +201,17 @@ def main():
     target_group.add_argument("--sys-clk-freq", default=60e6,        help="System clock frequency (default: 60MHz)")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     trellis_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         toolchain    = args.toolchain,
         sys_clk_freq = int(float(args.sys_clk_freq)),
-        **soc_core_argdict(args))
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args))
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = trellis_argdict(args) if args.toolchain == "trellis" else {}
     if args.build:
@@ -20,6 +20,9 @@ from litex.soc.cores.clock import iCE40PLL
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
+
+from litex_boards.cores.spiflash_cache import add_spi_flash_cache
 from litex.soc.cores.led import LedChaser
 
 kB = 1024
@@ -56,7 +59,7 @@ class _CRG(Module):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, bios_flash_offset, sys_clk_freq=int(12e6), with_led_chaser=True, **kwargs):
+    def __init__(self, bios_flash_offset, sys_clk_freq=int(12e6), with_led_chaser=True, flash_cache_size=0, **kwargs):
         platform = lattice_ice40up5k_evn.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -77,6 +80,8 @@ class BaseSoC(SoCCore):
         from litespi.modules import N25Q032A
         from litespi.opcodes import SpiNorFlashOpCodes as Codes
         self.add_spi_flash(mode="1x", module=N25Q032A(Codes.READ_1_1_1))
+        if flash_cache_size:
+            add_spi_flash_cache(self, size=flash_cache_size)
 
         # Add ROM linker region --------------------------------------------------------------------
         self.bus.add_region("rom", SoCRegion(
@@ -134,17 +139,21 @@ def main():
     target_group.add_argument("--build",             action="store_true", help="Build design.")
     target_group.add_argument("--sys-clk-freq",      default=12e6,        help="System clock frequency.")
     target_group.add_argument("--bios-flash-offset", default="0x20000",   help="BIOS offset in SPI Flash.")
+    target_group.add_argument("--flash-cache-size",  default=0, type=int, help="SPI Flash XIP cache size (0 to disable).")
     target_group.add_argument("--flash",             action="store_true", help="Flash Bitstream.")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     icestorm_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         bios_flash_offset = int(args.bios_flash_offset, 0),
         sys_clk_freq      = int(float(args.sys_clk_freq)),
+        flash_cache_size  = args.flash_cache_size,
         **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build(**icestorm_argdict(args))
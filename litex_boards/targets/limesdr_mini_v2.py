@@ -21,14 +21,13 @@ from litex.soc.cores.clock import *
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 from litex.soc.interconnect import stream
 
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 from litex.soc.cores.usb_fifo import FT245PHYSynchronous
 
-from litescope import LiteScopeAnalyzer
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -112,6 +111,7 @@ class BaseSoC(SoCCore):
             else:
                 self.comb += usb_phy.source.ready.eq(1) # Accept incoming stream to validate Host -> FPGA.
 
+            from litescope import LiteScopeAnalyzer
             analyzer_probes = usb_phy.get_litescope_probes()
             self.submodules.analyzer = LiteScopeAnalyzer(analyzer_probes,
                 depth        = 512,
@@ -145,6 +145,7 @@ def main():
     target_group.add_argument("--sys-clk-freq", default=80e6,        help="System clock frequency.")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     trellis_args(parser)
     args = parser.parse_args()
 
@@ -153,6 +154,7 @@ def main():
         toolchain    = args.toolchain,
         **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = trellis_argdict(args) if args.toolchain == "trellis" else {}
     if args.build:
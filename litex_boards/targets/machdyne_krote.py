@@ -30,6 +30,7 @@ from litex_boards.platforms import machdyne_krote
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.clock import iCE40PLL
 from litex.soc.cores.led import LedChaser
 
@@ -114,6 +115,7 @@ def main():
     parser.add_argument("--with-led-chaser", action="store_true", help="Enable LED Chaser.")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -121,6 +123,7 @@ def main():
          sys_clk_freq      = int(float(args.sys_clk_freq)),
          **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
@@ -22,10 +22,11 @@ from litex.soc.cores.clock import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.usb_ohci import USBOHCI
 from litex.soc.cores.video import VideoVGAPHY
-from litex.soc.cores.video import VideoHDMIPHY
 
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 
 from litedram.modules import W9825G6KH6
 from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
@@ -74,6 +75,9 @@ class _CRG(Module):
         else:
             self.clock_domains.cd_sys_ps = ClockDomain()
             pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
+        # SDRAM clock PLL output (see add_sdram_phase_calib).
+        self.sdram_pll        = pll
+        self.sdram_pll_clkout = pll.nclkouts - 1
 
         if sdram_rate == "1:2":
             sdram_clk = ClockSignal("sys2x_ps")
@@ -105,6 +109,7 @@ class BaseSoC(SoCCore):
     }}
     def __init__(self, revision="v1", device="45F", sdram_rate="1:2",
                  sys_clk_freq=int(40e6), toolchain="trellis", with_led_chaser=True, with_usb_host=False, **kwargs):
+        from litex.soc.cores.video import VideoHDMIPHY
         platform = machdyne_schoko.Platform(revision=revision, device=device ,toolchain=toolchain)
 
         # CRG --------------------------------------------------------------------------------------
@@ -124,10 +129,14 @@ class BaseSoC(SoCCore):
 
             self.submodules.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
-                phy           = self.sdrphy,
-                module        = W9825G6KH6(sys_clk_freq, sdram_rate),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                phy                     = self.sdrphy,
+                module                  = W9825G6KH6(sys_clk_freq, sdram_rate),
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True)
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # USB Host ---------------------------------------------------------------------------------
         if with_usb_host:
@@ -185,6 +194,8 @@ def main():
     target_group.add_argument("--with-usb-host",   action="store_true",  help="Enable USB host support.")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     trellis_args(parser)
     args = parser.parse_args()
 
@@ -193,7 +204,8 @@ def main():
         revision     = args.revision,
         device       = args.device,
         sys_clk_freq = int(float(args.sys_clk_freq)),
-        **soc_core_argdict(args))
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args))
 
     if args.with_sdcard:
         soc.add_sdcard()
@@ -201,6 +213,7 @@ def main():
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
 
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = trellis_argdict(args) if args.toolchain == "trellis" else {}
 
@@ -15,20 +15,19 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 from litex.soc.interconnect.csr import *
 from litex.soc.interconnect.axi import *
 from litex.soc.interconnect.wishbone import *
 from litex.soc.cores.bitbang import I2CMaster
 from litex.soc.cores.gpio import GPIOOut
-from litex.soc.cores.video import VideoDVIPHY
 from litex.soc.cores.usb_ohci import USBOHCI
 from migen.fhdl.specials import Tristate
 
 from litedram.modules import IS43TR16512B
 from litedram.phy import s7ddrphy
 
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -75,6 +74,7 @@ class BaseSoC(SoCCore):
 
     def __init__(self, sys_clk_freq=int(100e6), with_ethernet=True, with_etherbone=False,
         with_spi_flash=True, with_usb_host=False, **kwargs):
+        from litex.soc.cores.video import VideoDVIPHY
         platform = mnt_rkx7.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -90,11 +90,15 @@ class BaseSoC(SoCCore):
                 nphases      = 4,
                 sys_clk_freq = sys_clk_freq)
             self.add_sdram("sdram",
-                phy           = self.ddrphy,
-                module        = IS43TR16512B(sys_clk_freq, "1:4"),
-                size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192), # TBD: is L2 really necessary?
+                phy                     = self.ddrphy,
+                module                  = IS43TR16512B(sys_clk_freq, "1:4"),
+                size                    = 0x40000000,
+                l2_cache_size           = kwargs.get("l2_size", 8192), # TBD: is L2 really necessary?
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True),
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -104,6 +108,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.s7rgmii import LiteEthPHYRGMII
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
@@ -208,6 +213,8 @@ def main():
     ethopts.add_argument("--with-etherbone", action="store_true",               help="Enable Etherbone support.")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -216,7 +223,8 @@ def main():
         with_etherbone = args.with_etherbone,
         with_spi_flash = args.with_spi_flash,
         with_usb_host  = args.with_usb_host,
-        **soc_core_argdict(args)
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
     )
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
@@ -225,6 +233,7 @@ def main():
 
     args.csr_csv="csr.csv"
 
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
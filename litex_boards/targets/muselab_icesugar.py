@@ -19,6 +19,9 @@ from litex.soc.cores.clock import iCE40PLL
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
+
+from litex_boards.cores.spiflash_cache import add_spi_flash_cache
 from litex.soc.cores.led import LedChaser
 
 kB = 1024
@@ -56,7 +59,7 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, bios_flash_offset, sys_clk_freq=int(24e6), with_led_chaser=True,
-                 with_video_terminal=False, **kwargs):
+                 with_video_terminal=False, flash_cache_size=0, **kwargs):
         platform = muselab_icesugar.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -79,6 +82,8 @@ class BaseSoC(SoCCore):
         from litespi.modules import W25Q64FV
         from litespi.opcodes import SpiNorFlashOpCodes as Codes
         self.add_spi_flash(mode="1x", module=W25Q64FV(Codes.READ_1_1_1), with_master=False)
+        if flash_cache_size:
+            add_spi_flash_cache(self, size=flash_cache_size)
 
         # Add ROM linker region --------------------------------------------------------------------
         self.bus.add_region("rom", SoCRegion(
@@ -114,16 +119,20 @@ def main():
     target_group.add_argument("--flash",               action="store_true", help="Flash Bitstream.")
     target_group.add_argument("--sys-clk-freq",        default=24e6,        help="System clock frequency.")
     target_group.add_argument("--bios-flash-offset",   default="0x40000",   help="BIOS offset in SPI Flash.")
+    target_group.add_argument("--flash-cache-size",    default=0, type=int, help="SPI Flash XIP cache size (0 to disable).")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     icestorm_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         bios_flash_offset   = int(args.bios_flash_offset, 0),
         sys_clk_freq        = int(float(args.sys_clk_freq)),
+        flash_cache_size    = args.flash_cache_size,
         **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build(**icestorm_argdict(args))
@@ -11,6 +11,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 
 from litex_boards.platforms import myminieye_runber
@@ -62,6 +63,7 @@ def main():
     target_group.add_argument("--sys-clk-freq",default=12e6,        help="System clock frequency.")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -69,6 +71,7 @@ def main():
         **soc_core_argdict(args)
     )
 
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
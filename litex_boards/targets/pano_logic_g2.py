@@ -7,6 +7,7 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
 import os
+import copy
 
 from migen import *
 from migen.genlib.resetsync import AsyncResetSynchronizer
@@ -16,14 +17,17 @@ from litex_boards.platforms import pano_logic_g2
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 
-from liteeth.phy import LiteEthPHY
+from litedram.modules import MT47H64M16
+from litedram.phy import dfi, s6ddrphy
 
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
-    def __init__(self, platform, clk_freq, with_ethernet=False):
+    def __init__(self, platform, clk_freq, with_ethernet=False, sdram_channels=()):
         self.rst = Signal()
         self.clock_domains.cd_sys    = ClockDomain()
 
@@ -40,24 +44,168 @@ class _CRG(Module):
         pll.create_clkout(self.cd_sys, clk_freq)
         platform.add_false_path_constraints(self.cd_sys.clk, pll.clkin) # Ignore sys_clk to pll.clkin path created by SoC's rst.
 
+        # SDRAM clocks -----------------------------------------------------------------------------
+        if len(sdram_channels):
+            self.clock_domains.cd_sdram_half     = ClockDomain()
+            self.clock_domains.cd_sdram_half_ext = ClockDomain(reset_less=True)
+            self.clock_domains.cd_sdram_full     = ClockDomain(reset_less=True)
+            pll.create_clkout(self.cd_sdram_half,     2*clk_freq, phase=270)
+            pll.create_clkout(self.cd_sdram_half_ext, 2*clk_freq, phase=250, with_reset=False)
+            pll.create_clkout(self.cd_sdram_full,     4*clk_freq, buf=None,  with_reset=False)
+
+        # Each channel sits on its own side of the die and needs its own BUFPLL: the IOSERDES
+        # clock/strobe of a channel is then provided in sdram_full_wr_<ch>/sdram_full_rd_<ch>.
+        self.clk4x_strb = {}
+        for ch in sdram_channels:
+            cd_sdram_full_wr = ClockDomain(f"sdram_full_wr_{ch}")
+            cd_sdram_full_rd = ClockDomain(f"sdram_full_rd_{ch}")
+            self.clock_domains += cd_sdram_full_wr, cd_sdram_full_rd
+            self.clk4x_strb[ch] = clk4x_strb = Signal()
+            self.specials += Instance("BUFPLL",
+                p_DIVIDE       = 4,
+                i_PLLIN        = self.cd_sdram_full.clk,
+                i_GCLK         = self.cd_sys.clk,
+                i_LOCKED       = pll.locked,
+                o_IOCLK        = cd_sdram_full_wr.clk,
+                o_SERDESSTROBE = clk4x_strb)
+            self.comb += cd_sdram_full_rd.clk.eq(cd_sdram_full_wr.clk)
+
+            # Off-chip DDR clock.
+            ddram_clk = Signal()
+            ddram_clk_pads = platform.request(f"ddram_clock_{ch}")
+            self.specials += Instance("ODDR2",
+                p_DDR_ALIGNMENT = "NONE",
+                p_INIT          = 0,
+                p_SRTYPE        = "SYNC",
+                i_D0 = 1,
+                i_D1 = 0,
+                i_S  = 0,
+                i_R  = 0,
+                i_CE = 1,
+                i_C0 =  self.cd_sdram_half_ext.clk,
+                i_C1 = ~self.cd_sdram_half_ext.clk,
+                o_Q  = ddram_clk)
+            self.specials += Instance("OBUFDS", i_I=ddram_clk, o_O=ddram_clk_pads.p, o_OB=ddram_clk_pads.n)
+
+# Dual DDR2 PHY ------------------------------------------------------------------------------------
+
+class _DualDDRPHY(Module):
+    """Runs the two 16-bit DDR2 channels in lockstep as a single 32-bit PHY.
+
+    Commands are broadcast to both PHYs and data is split between them (low half-word on channel A,
+    high half-word on channel B), so a single LiteDRAM controller (and the BIOS init sequence) can
+    drive both chips.
+    """
+    def __init__(self, phy_a, phy_b):
+        assert phy_a.settings.databits == phy_b.settings.databits
+        databits = phy_a.settings.databits
+        nphases  = phy_a.settings.nphases
+
+        # PHY settings -----------------------------------------------------------------------------
+        self.settings = copy.copy(phy_a.settings)
+        self.settings.databits     = 2*databits
+        self.settings.dfi_databits = 4*databits
+
+        # DFI Interface ----------------------------------------------------------------------------
+        self.dfi = dfi.Interface(
+            addressbits = len(phy_a.dfi.p0.address),
+            bankbits    = len(phy_a.dfi.p0.bank),
+            nranks      = phy_a.settings.nranks,
+            databits    = 4*databits,
+            nphases     = nphases)
+
+        # # #
+
+        def split(sig, n):
+            return [sig[i*n:(i + 1)*n] for i in range(len(sig)//n)]
+
+        for p, pa, pb in zip(self.dfi.phases, phy_a.dfi.phases, phy_b.dfi.phases):
+            # Commands: broadcast.
+            for name in ["address", "bank", "cas_n", "cs_n", "ras_n", "we_n", "cke", "odt",
+                         "reset_n", "act_n", "wrdata_en", "rddata_en"]:
+                self.comb += [
+                    getattr(pa, name).eq(getattr(p, name)),
+                    getattr(pb, name).eq(getattr(p, name)),
+                ]
+            # Write data/mask: [rise_a, rise_b, fall_a, fall_b] <-> [rise, fall] on each channel.
+            for name, n in [("wrdata", databits), ("wrdata_mask", databits//8)]:
+                chunks = split(getattr(p, name), n)
+                self.comb += [
+                    getattr(pa, name).eq(Cat(*chunks[0::2])),
+                    getattr(pb, name).eq(Cat(*chunks[1::2])),
+                ]
+            # Read data: re-assemble, both channels share the same read latency.
+            chunks_a = split(pa.rddata, databits)
+            chunks_b = split(pb.rddata, databits)
+            self.comb += [
+                p.rddata.eq(Cat(*[c for cs in zip(chunks_a, chunks_b) for c in cs])),
+                p.rddata_valid.eq(pa.rddata_valid),
+            ]
+
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
     def __init__(self, revision, sys_clk_freq=int(50e6), with_ethernet=False, with_etherbone=False,
-                 eth_ip="192.168.1.50", with_led_chaser=True, **kwargs):
+                 eth_ip="192.168.1.50", with_sdram="none", with_led_chaser=True, **kwargs):
         platform = pano_logic_g2.Platform(revision=revision)
         if with_etherbone:
             sys_clk_freq = int(125e6)
 
+        # DDR2 channels ----------------------------------------------------------------------------
+        sdram_channels = {
+            "none" : [],
+            "a"    : ["a"],
+            "b"    : ["b"],
+            "dual" : ["a", "b"],
+        }[with_sdram]
+        if kwargs.get("integrated_main_ram_size", 0):
+            sdram_channels = []
+
         # CRG --------------------------------------------------------------------------------------
         with_ethernet = (with_ethernet or with_etherbone)
-        self.submodules.crg = _CRG(platform, sys_clk_freq, with_ethernet=with_ethernet)
+        self.submodules.crg = _CRG(platform, sys_clk_freq,
+            with_ethernet  = with_ethernet,
+            sdram_channels = sdram_channels)
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Pano Logic G2", **kwargs)
 
+        # DDR2 SDRAM -------------------------------------------------------------------------------
+        if len(sdram_channels):
+            phys = []
+            for ch in sdram_channels:
+                phy = s6ddrphy.S6HalfRateDDRPHY(platform.request(f"ddram_{ch}"),
+                    memtype           = "DDR2",
+                    rd_bitslip        = 0,
+                    wr_bitslip        = 4,
+                    dqs_ddr_alignment = "C0")
+                phy = ClockDomainsRenamer({
+                    "sdram_full_wr" : f"sdram_full_wr_{ch}",
+                    "sdram_full_rd" : f"sdram_full_rd_{ch}",
+                })(phy)
+                self.comb += [
+                    phy.clk4x_wr_strb.eq(self.crg.clk4x_strb[ch]),
+                    phy.clk4x_rd_strb.eq(self.crg.clk4x_strb[ch]),
+                ]
+                setattr(self.submodules, f"ddrphy_{ch}", phy)
+                phys.append(phy)
+            if len(phys) == 1:
+                self.ddrphy = phys[0]
+            else:
+                self.submodules.ddrphy = _DualDDRPHY(*phys)
+            self.add_sdram("sdram",
+                phy                     = self.ddrphy,
+                module                  = MT47H64M16(sys_clk_freq, "1:2"),
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True),
+            )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
+
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy import LiteEthPHY
             self.submodules.ethphy = LiteEthPHY(
                 clock_pads         = self.platform.request("eth_clocks"),
                 pads               = self.platform.request("eth"),
@@ -88,8 +236,11 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true",              help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true",              help="Enable Etherbone support.")
     target_group.add_argument("--eth-ip",          default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address.")
+    target_group.add_argument("--with-sdram",      default="none",                   help="Enable DDR2 SDRAM channel(s) (none, a, b or dual).")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -98,8 +249,11 @@ def main():
         with_ethernet  = args.with_ethernet,
         with_etherbone = args.with_etherbone,
         eth_ip         = args.eth_ip,
-        **soc_core_argdict(args)
+        with_sdram     = args.with_sdram,
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
@@ -16,6 +16,7 @@ from litex_boards.platforms import quicklogic_quickfeather
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.gpio import *
 
@@ -92,10 +93,12 @@ def main():
     target_group = parser.add_argument_group(title="Target options")
     target_group.add_argument("--build", action="store_true", help="Build design.")
     soc_core_args(parser)
+    add_args(parser)
     parser.set_defaults(cpu_type="eos_s3")
     args = parser.parse_args()
 
     soc = BaseSoC(**soc_core_argdict(args))
+    apply_args(soc, args)
     builder = Builder(soc)
     if args.cpu_type == "eos_s3":
         libeos_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "libeos")
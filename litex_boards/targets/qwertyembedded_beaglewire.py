@@ -20,6 +20,8 @@ from litex.soc.cores.clock import iCE40PLL
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.uart import UARTWishboneBridge
 
@@ -83,8 +85,12 @@ class BaseSoC(SoCCore):
             self.add_sdram("sdram",
                 phy                     = self.sdrphy,
                 module                  = MT48LC32M8(sys_clk_freq, "1:1"),
-                l2_cache_size           = kwargs.get("l2_size", 1024)
+                l2_cache_size           = kwargs.get("l2_size", 1024),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True)
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # SPI Flash --------------------------------------------------------------------------------
         from litespi.modules import M25PX32
@@ -115,14 +121,18 @@ def main():
     target_group.add_argument("--sys-clk-freq",      default=50e6,        help="System clock frequency.")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     icestorm_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
          bios_flash_offset = int(args.bios_flash_offset, 0),
          sys_clk_freq      = int(float(args.sys_clk_freq)),
-         **soc_core_argdict(args)
+         **soc_core_argdict(args),
+         **l2_cache_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc,  **builder_argdict(args))
     if args.build:
         builder.build(**icestorm_argdict(args))
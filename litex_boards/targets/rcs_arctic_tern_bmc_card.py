@@ -18,12 +18,12 @@ from litex_boards.platforms import rcs_arctic_tern_bmc_card
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 from litex.soc.integration.soc import SoCRegion
 
 from litedram.modules import MT41J256M16
 from litedram.phy import ECP5DDRPHY
-from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
-from litex.soc.cores.video import VideoGenericPHY
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -119,13 +119,18 @@ class BaseSoC(SoCCore):
         self.comb += self.crg.stop.eq(self.ddrphy.init.stop)
         self.comb += self.crg.reset.eq(self.ddrphy.init.reset)
         self.add_sdram("sdram",
-            phy           = self.ddrphy,
-            module        = MT41J256M16(sys_clk_freq, "1:2"), # Not MT41J256M16, but the AS4C256M16D3C in use has similar specifications
-            l2_cache_size = kwargs.get("l2_size", 8192),
+            phy                     = self.ddrphy,
+            module                  = MT41J256M16(sys_clk_freq, "1:2"), # Not MT41J256M16, but the AS4C256M16D3C in use has similar specifications
+            l2_cache_size           = kwargs.get("l2_size", 8192),
+            l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+            l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True),
         )
+        if kwargs.get("with_l2_stats", False):
+            add_l2_cache_stats(self)
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks", 0),
                 pads       = self.platform.request("eth", 0),
@@ -138,6 +143,7 @@ class BaseSoC(SoCCore):
 
         # Video Output -----------------------------------------------------------------------------
         if with_video_colorbars or with_video_terminal or with_video_framebuffer:
+            from litex.soc.cores.video import VideoGenericPHY
             dvo_pads = platform.request("dvo")
             self.submodules.videophy = VideoGenericPHY(dvo_pads, clock_domain="dvo", with_clk_ddr_output=False)
             if with_video_terminal:
@@ -167,6 +173,8 @@ def main():
     target_group.add_argument("--eth-ip",          default="192.168.1.50", type=str, help="Ethernet/Etherbone IP address.")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     trellis_args(parser)
     args = parser.parse_args()
 
@@ -176,7 +184,9 @@ def main():
         with_ethernet  = args.with_ethernet,
         with_etherbone = args.with_etherbone,
         eth_ip         = args.eth_ip,
-        **soc_core_argdict(args))
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args))
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     builder_kargs = trellis_argdict(args) if args.toolchain == "trellis" else {}
     if args.build:
@@ -15,6 +15,7 @@ from litex.build.io import CRG
 
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 
 from litex.soc.cores.led import LedChaser
 
@@ -51,6 +52,7 @@ def main():
     target_group.add_argument("--toolchain",     default=None,        help="FPGA toolchain.")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     platform_module = importlib.import_module(args.platform)
@@ -59,6 +61,7 @@ def main():
         platform_kwargs["toolchain"] = args.toolchain
     platform = platform_module.Platform(**platform_kwargs)
     soc = BaseSoC(platform,**soc_core_argdict(args))
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
@@ -14,11 +14,10 @@ from litex.soc.cores.clock.gowin_gw1n import GW1NPLL
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.video import *
 
-from litex.soc.cores.hyperbus import HyperRAM
-
 kB = 1024
 mB = 1024*kB
 
@@ -106,6 +105,7 @@ class BaseSoC(SoCCore):
 
         # HyperRAM ---------------------------------------------------------------------------------
         if with_hyperram:
+            from litex.soc.cores.hyperbus import HyperRAM
             class HyperRAMPads:
                 def __init__(self):
                     self.clk   = Signal()
@@ -145,6 +145,7 @@ def main():
     target_group.add_argument("--with-video-terminal",action="store_true", help="System clock frequency.")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -153,6 +154,7 @@ def main():
         **soc_core_argdict(args)
     )
 
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
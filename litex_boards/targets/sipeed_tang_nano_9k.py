@@ -15,11 +15,10 @@ from litex.soc.cores.clock.gowin_gw1n import GW1NPLL
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.video import *
 
-from litex.soc.cores.hyperbus import HyperRAM
-
 kB = 1024
 mB = 1024*kB
 
@@ -87,6 +86,7 @@ class BaseSoC(SoCCore):
 
         # HyperRAM ---------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litex.soc.cores.hyperbus import HyperRAM
             # TODO: Use second 32Mbit PSRAM chip.
             dq      = platform.request("IO_psram_dq")
             rwds    = platform.request("IO_psram_rwds")
@@ -142,6 +142,7 @@ def main():
     target_group.add_argument("--prog-kit",             default="openfpgaloader", help="Programmer select from Gowin/openFPGALoader.")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -154,6 +155,7 @@ def main():
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
 
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
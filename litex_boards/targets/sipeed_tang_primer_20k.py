@@ -14,12 +14,11 @@ from litex.soc.cores.clock.gowin_gw2a import GW2APLL
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser, WS2812
 from litex.soc.cores.gpio import GPIOIn
 from litex.soc.cores.video import *
 
-from liteeth.phy.rmii import LiteEthPHYRMII
-
 from litex_boards.platforms import sipeed_tang_primer_20k
 
 from litedram.common import PHYPadsReducer
@@ -160,6 +159,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.rmii import LiteEthPHYRMII
             # FIXME: Un-tested.
             from liteeth.phy.rmii import LiteEthPHYRMII
             self.submodules.ethphy = LiteEthPHYRMII(
@@ -228,6 +228,7 @@ def main():
     target_group.add_argument("--eth-dynamic-ip",  action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -246,6 +247,7 @@ def main():
     if args.with_sdcard:
         soc.add_sdcard()
 
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
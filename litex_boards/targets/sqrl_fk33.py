@@ -20,17 +20,12 @@ from litex_boards.platforms import sqrl_fk33
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.interconnect.axi import *
 from litex.soc.cores.ram.xilinx_usp_hbm2 import USPHBM2
 from litex.soc.cores.led import LedChaser
 
-from litepcie.phy.usppciephy import USPHBMPCIEPHY
-from litepcie.core import LitePCIeEndpoint, LitePCIeMSI
-from litepcie.frontend.dma import LitePCIeDMA
-from litepcie.frontend.wishbone import LitePCIeWishboneBridge
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -93,6 +88,10 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.usppciephy import USPHBMPCIEPHY
+            from litepcie.core import LitePCIeEndpoint, LitePCIeMSI
+            from litepcie.frontend.dma import LitePCIeDMA
+            from litepcie.frontend.wishbone import LitePCIeWishboneBridge
             assert self.csr_data_width == 32
             # PHY
             self.submodules.pcie_phy = USPHBMPCIEPHY(platform, platform.request("pcie_x4"),
@@ -145,6 +144,7 @@ def main():
     target_group.add_argument("--driver",       action="store_true", help="Generate PCIe driver.")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -153,11 +153,13 @@ def main():
         with_hbm     = args.with_hbm,
         **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
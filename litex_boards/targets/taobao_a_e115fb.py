@@ -13,6 +13,7 @@ from litex_boards.platforms import taobao_a_e115fb
 
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.clock import CycloneIVPLL
 from litex.soc.cores.led import LedChaser
 
@@ -63,12 +64,14 @@ def main():
     target_group.add_argument("--sys-clk-freq", default=50e6,        help="System clock frequency.")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = int(float(args.sys_clk_freq)),
         **soc_core_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
@@ -16,19 +16,25 @@ from litex_boards.platforms import terasic_deca
 from litex.soc.cores.clock import Max10PLL
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
-from litex.soc.cores.video import VideoDVIPHY
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
+from litex_boards.cores.altera_ddr3phy import AlteraDDR3PHY
 from litex.soc.cores.led import LedChaser
 
-from liteeth.phy.mii import LiteEthPHYMII
+from litedram.modules import MT41K256M16
 
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
-    def __init__(self, platform, sys_clk_freq, with_usb_pll=False):
+    def __init__(self, platform, sys_clk_freq, with_usb_pll=False, with_ddr3=False, ddr3_rd_phase=90):
         self.rst = Signal()
         self.clock_domains.cd_sys    = ClockDomain()
         self.clock_domains.cd_hdmi   = ClockDomain()
         self.clock_domains.cd_usb    = ClockDomain()
+        if with_ddr3:
+            self.clock_domains.cd_sys4x    = ClockDomain(reset_less=True)
+            self.clock_domains.cd_sys4x_dq = ClockDomain(reset_less=True)
+            self.clock_domains.cd_sys4x_rd = ClockDomain(reset_less=True)
 
         # # #
 
@@ -41,6 +47,10 @@ class _CRG(Module):
         pll.register_clkin(clk50, 50e6)
         pll.create_clkout(self.cd_sys,  sys_clk_freq)
         pll.create_clkout(self.cd_hdmi, 40e6)
+        if with_ddr3:
+            pll.create_clkout(self.cd_sys4x,    4*sys_clk_freq, with_reset=False)
+            pll.create_clkout(self.cd_sys4x_dq, 4*sys_clk_freq, phase=270,           with_reset=False)
+            pll.create_clkout(self.cd_sys4x_rd, 4*sys_clk_freq, phase=ddr3_rd_phase, with_reset=False)
 
         # USB PLL.
         if with_usb_pll:
@@ -56,12 +66,16 @@ class _CRG(Module):
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(50e6), with_led_chaser=True, with_uartbone=False, with_jtagbone=False, with_video_terminal=False,
                  with_ethernet=False, with_etherbone=False, eth_ip="192.168.1.50",
-                 eth_dynamic_ip=False,
+                 eth_dynamic_ip=False, with_ddr3=False, ddr3_rd_phase=90,
                  **kwargs):
         self.platform = platform = terasic_deca.Platform()
 
         # CRG --------------------------------------------------------------------------------------
-        self.submodules.crg = self.crg = _CRG(platform, sys_clk_freq, with_usb_pll=False)
+        with_ddr3 = with_ddr3 and not kwargs.get("integrated_main_ram_size", 0)
+        self.submodules.crg = self.crg = _CRG(platform, sys_clk_freq,
+            with_usb_pll  = False,
+            with_ddr3     = with_ddr3,
+            ddr3_rd_phase = ddr3_rd_phase)
 
         # SoCCore ----------------------------------------------------------------------------------
         # Defaults to JTAG-UART since no hardware UART.
@@ -75,6 +89,19 @@ class BaseSoC(SoCCore):
             kwargs["uart_name"] = "crossover"
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Terasic DECA", **kwargs)
 
+        # DDR3 SDRAM -------------------------------------------------------------------------------
+        if with_ddr3:
+            self.submodules.ddrphy = AlteraDDR3PHY(platform.request("ddram"), sys_clk_freq)
+            self.add_sdram("sdram",
+                phy                     = self.ddrphy,
+                module                  = MT41K256M16(sys_clk_freq, "1:4"),
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True)
+            )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
+
         # UARTbone ---------------------------------------------------------------------------------
         if with_uartbone:
             self.add_uartbone(name=real_uart_name, baudrate=kwargs["uart_baudrate"])
@@ -85,6 +112,7 @@ class BaseSoC(SoCCore):
         
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.mii import LiteEthPHYMII
             self.platform.toolchain.additional_sdc_commands += [
                 'create_clock -name eth_rx_clk -period 40.0 [get_ports {eth_clocks_rx}]',
                 'create_clock -name eth_tx_clk -period 40.0 [get_ports {eth_clocks_tx}]',
@@ -102,6 +130,7 @@ class BaseSoC(SoCCore):
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal:
+            from litex.soc.cores.video import VideoDVIPHY
             self.submodules.videophy = VideoDVIPHY(platform.request("hdmi"), clock_domain="hdmi")
             self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
 
@@ -128,8 +157,13 @@ def main():
     target_group.add_argument("--with-uartbone",       action="store_true", help="Enable UARTbone support.")
     target_group.add_argument("--with-jtagbone",       action="store_true", help="Enable JTAGbone support.")
     target_group.add_argument("--with-video-terminal", action="store_true", help="Enable Video Terminal (VGA).")
+    target_group.add_argument("--with-ddr3",           action="store_true", help="Enable DDR3 SDRAM (DRAM clock: 4x the system clock).")
+    target_group.add_argument("--ddr3-rd-phase",       default=90, type=int, choices=range(0, 180), metavar="[0-179]",
+        help="DDR3 read capture clock phase (in degrees).")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -141,8 +175,12 @@ def main():
         with_uartbone            = args.with_uartbone,
         with_jtagbone            = args.with_jtagbone,
         with_video_terminal      = args.with_video_terminal,
-        **soc_core_argdict(args)
+        with_ddr3                = args.with_ddr3,
+        ddr3_rd_phase            = args.ddr3_rd_phase,
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
@@ -11,18 +11,21 @@ from litex_boards.platforms import terasic_sockit
 from litex.soc.cores.clock import CycloneVPLL
 from litex.soc.integration.soc_core  import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
+from litex_boards.cores.altera_ddr3phy import AlteraDDR3PHY
 from litex.soc.cores.led import LedChaser
-from litex.soc.cores.video import VideoVGAPHY
 
 from litex.build.io import DDROutput
 
-from litedram.modules import W9825G6KH6, AS4C32M16
+from litedram.modules import W9825G6KH6, AS4C32M16, MT41K256M16
 from litedram.phy import HalfRateGENSDRPHY, GENSDRPHY
 
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
-    def __init__(self, platform, sys_clk_freq, with_sdram=False, sdram_rate="1:2", with_video_terminal=False):
+    def __init__(self, platform, sys_clk_freq, with_sdram=False, sdram_rate="1:2", with_ddr3=False, ddr3_rd_phase=90,
+                 with_video_terminal=False):
         self.sdram_rate = sdram_rate
         self.rst = Signal()
         self.clock_domains.cd_sys = ClockDomain()
@@ -34,6 +37,10 @@ class _CRG(Module):
                 self.clock_domains.cd_sys2x_ps = ClockDomain()
             else:
                 self.clock_domains.cd_sys_ps = ClockDomain()
+        if with_ddr3:
+            self.clock_domains.cd_sys4x    = ClockDomain(reset_less=True)
+            self.clock_domains.cd_sys4x_dq = ClockDomain(reset_less=True)
+            self.clock_domains.cd_sys4x_rd = ClockDomain(reset_less=True)
 
         # Clk / Rst
         clk50 = platform.request("clk50")
@@ -54,6 +61,11 @@ class _CRG(Module):
             else:
                 pll.create_clkout(self.cd_sys_ps, sys_clk_freq, phase=90)
 
+        if with_ddr3:
+            pll.create_clkout(self.cd_sys4x,    4*sys_clk_freq, with_reset=False)
+            pll.create_clkout(self.cd_sys4x_dq, 4*sys_clk_freq, phase=270,           with_reset=False)
+            pll.create_clkout(self.cd_sys4x_rd, 4*sys_clk_freq, phase=ddr3_rd_phase, with_reset=False)
+
         # SDRAM clock
         if with_sdram:
             sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
@@ -63,13 +75,17 @@ class _CRG(Module):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(50e6), revision="revd", sdram_rate="1:2", mister_sdram=None,
-                 with_led_chaser=True, with_video_terminal=False, **kwargs):
+                 with_ddr3=False, ddr3_rd_phase=90, with_led_chaser=True, with_video_terminal=False, **kwargs):
         platform = terasic_sockit.Platform(revision)
+        assert not (with_ddr3 and mister_sdram is not None)
 
         # CRG --------------------------------------------------------------------------------------
+        with_ddr3 = with_ddr3 and not kwargs.get("integrated_main_ram_size", 0)
         self.submodules.crg = _CRG(platform, sys_clk_freq,
             with_sdram          = mister_sdram != None,
             sdram_rate          = sdram_rate,
+            with_ddr3           = with_ddr3,
+            ddr3_rd_phase       = ddr3_rd_phase,
             with_video_terminal = with_video_terminal
         )
 
@@ -84,13 +100,31 @@ class BaseSoC(SoCCore):
             sdrphy_mod = {"xs_v22": W9825G6KH6, "xs_v24": AS4C32M16}[mister_sdram]
             self.submodules.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
             self.add_sdram("sdram",
-                phy           = self.sdrphy,
-                module        = sdrphy_mod(sys_clk_freq, sdram_rate),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                phy                     = self.sdrphy,
+                module                  = sdrphy_mod(sys_clk_freq, sdram_rate),
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True)
+            )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
+
+        # DDR3 SDRAM -------------------------------------------------------------------------------
+        if with_ddr3:
+            self.submodules.ddrphy = AlteraDDR3PHY(platform.request("ddram"), sys_clk_freq)
+            self.add_sdram("sdram",
+                phy                     = self.ddrphy,
+                module                  = MT41K256M16(sys_clk_freq, "1:4"),
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True)
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # Video Terminal ---------------------------------------------------------------------------
         if with_video_terminal:
+            from litex.soc.cores.video import VideoVGAPHY
             vga_pads = platform.request("vga")
             self.comb += [ vga_pads.sync_n.eq(0), vga_pads.blank_n.eq(1) ]
             self.specials += DDROutput(i1=1, i2=0, o=vga_pads.clk, clk=ClockSignal("vga"))
@@ -110,8 +144,12 @@ def main():
     parser = LiteXSoCArgumentParser(description="LiteX SoC on the Terasic SoCKit")
     target_group = parser.add_argument_group(title="Target options")
     target_group.add_argument("--single-rate-sdram",   action="store_true", help="Clock SDRAM with 1x the sytem clock (instead of 2x).")
-    target_group.add_argument("--mister-sdram-xs-v22", action="store_true", help="Use optional MiSTer SDRAM module XS v2.2 on J2 on GPIO daughter card.")
-    target_group.add_argument("--mister-sdram-xs-v24", action="store_true", help="Use optional MiSTer SDRAM module XS v2.4 on J2 on GPIO daughter card.")
+    sdramopts = target_group.add_mutually_exclusive_group()
+    sdramopts.add_argument("--mister-sdram-xs-v22", action="store_true", help="Use optional MiSTer SDRAM module XS v2.2 on J2 on GPIO daughter card.")
+    sdramopts.add_argument("--mister-sdram-xs-v24", action="store_true", help="Use optional MiSTer SDRAM module XS v2.4 on J2 on GPIO daughter card.")
+    sdramopts.add_argument("--with-ddr3",           action="store_true", help="Enable FPGA DDR3 SDRAM (DRAM clock: 4x the system clock).")
+    target_group.add_argument("--ddr3-rd-phase",       default=90, type=int, choices=range(0, 180), metavar="[0-179]",
+        help="DDR3 read capture clock phase (in degrees).")
     target_group.add_argument("--build",               action="store_true", help="Build design.")
     target_group.add_argument("--load",                action="store_true", help="Load bitstream.")
     target_group.add_argument("--revision",            default="revd",      help="Board revision (revb, revc or revd).")
@@ -119,6 +157,8 @@ def main():
     target_group.add_argument("--with-video-terminal", action="store_true", help="Enable Video Terminal (VGA).")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -126,9 +166,13 @@ def main():
         revision            = args.revision,
         sdram_rate          = "1:1" if args.single_rate_sdram else "1:2",
         mister_sdram        = "xs_v22" if args.mister_sdram_xs_v22 else "xs_v24" if args.mister_sdram_xs_v24 else None,
+        with_ddr3           = args.with_ddr3,
+        ddr3_rd_phase       = args.ddr3_rd_phase,
         with_video_terminal = args.with_video_terminal,
-        **soc_core_argdict(args)
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
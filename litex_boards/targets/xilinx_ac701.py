@@ -16,19 +16,14 @@ from litex_boards.platforms import xilinx_ac701
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 from litex.soc.cores.led import LedChaser
 
 from litedram.common import PHYPadsReducer
 from litedram.modules import MT8JTF12864
 from litedram.phy import s7ddrphy
 
-from liteeth.phy.a7_gtp import QPLLSettings, QPLL
-from liteeth.phy.a7_1000basex import A7_1000BASEX
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(Module):
@@ -73,15 +68,20 @@ class BaseSoC(SoCCore):
                 nphases      = 4,
                 sys_clk_freq = sys_clk_freq)
             self.add_sdram("sdram",
-                phy           = self.ddrphy,
-                module        = MT8JTF12864(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                phy                     = self.ddrphy,
+                module                  = MT8JTF12864(sys_clk_freq, "1:4"),
+                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True)
             )
+            if kwargs.get("with_l2_stats", False):
+                add_l2_cache_stats(self)
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet:
             # RGMII Ethernet PHY -------------------------------------------------------------------
             if eth_phy == "rgmii":
+                from liteeth.phy.s7rgmii import LiteEthPHYRGMII
                 # phy
                 self.submodules.ethphy = LiteEthPHYRGMII(
                     clock_pads = self.platform.request("eth_clocks"),
@@ -89,6 +89,8 @@ class BaseSoC(SoCCore):
 
             # 1000BaseX Ethernet PHY ---------------------------------------------------------------
             if eth_phy == "1000basex":
+                from liteeth.phy.a7_gtp import QPLLSettings, QPLL
+                from liteeth.phy.a7_1000basex import A7_1000BASEX
                 # phy
                 self.comb += self.platform.request("sfp_mgt_clk_sel0", 0).eq(0)
                 self.comb += self.platform.request("sfp_mgt_clk_sel1", 0).eq(0)
@@ -123,6 +125,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.submodules.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
@@ -149,6 +152,8 @@ def main():
     target_group.add_argument("--driver",         action="store_true", help="Generate PCIe driver.")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -157,13 +162,16 @@ def main():
         eth_phy        = args.eth_phy,
         with_spi_flash = args.with_spi_flash,
         with_pcie      = args.with_pcie,
-        **soc_core_argdict(args)
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
     )
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
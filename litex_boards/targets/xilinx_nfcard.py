@@ -34,6 +34,7 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores import add_args, apply_args
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -216,6 +217,7 @@ def main():
     parser.add_argument("--preset", default="nfcard.xml", help="preset file")
     builder_args(parser)
     soc_core_args(parser)
+    add_args(parser)
     vivado_build_args(parser)
     parser.set_defaults(cpu_type="zynqmp")
     parser.set_defaults(no_uart=True)
@@ -229,6 +231,7 @@ def main():
 
     target_name = 'xilinx_nfcard'
     builder_kwargs = get_builder_kwargs(args, target_name)
+    apply_args(soc, args)
     builder = Builder(soc, **builder_kwargs)
     builder.csr_csv = os.path.join(builder.output_dir, 'csr.csv')
 
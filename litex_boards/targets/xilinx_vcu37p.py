@@ -23,6 +23,8 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
+from litex_boards.cores.l2_cache import l2_cache_args, l2_cache_argdict, add_l2_cache_stats
+from litex_boards.cores import add_args, apply_args
 from litex.soc.interconnect.axi import *
 from litex.soc.interconnect.csr import *
 from litex.soc.cores.ram.xilinx_usp_hbm2 import USPHBM2
@@ -31,13 +33,7 @@ from litex.soc.cores.led import LedChaser
 from litedram.modules import MTA18ASF2G72PZ
 from litedram.phy import usddrphy
 
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 from litedram.common import *
-from litedram.frontend.axi import *
-
-from litescope import LiteScopeAnalyzer
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -132,11 +128,15 @@ class BaseSoC(SoCCore):
                     iodelay_clk_freq = 500e6,
                     is_rdimm         = True)
                 self.add_sdram("sdram",
-                    phy           = self.ddrphy,
-                    module        = MTA18ASF2G72PZ(sys_clk_freq, "1:4"),
-                    size          = 0x40000000,
-                    l2_cache_size = kwargs.get("l2_size", 8192)
+                    phy                     = self.ddrphy,
+                    module                  = MTA18ASF2G72PZ(sys_clk_freq, "1:4"),
+                    size                    = 0x40000000,
+                    l2_cache_size           = kwargs.get("l2_size", 8192),
+                    l2_cache_min_data_width = kwargs.get("l2_min_data_width", 128),
+                    l2_cache_full_memory_we = kwargs.get("l2_full_memory_we", True)
                 )
+                if kwargs.get("with_l2_stats", False):
+                    add_l2_cache_stats(self)
 
             # Firmware RAM (To ease initial LiteDRAM calibration support) --------------------------
             self.add_ram("firmware_ram", 0x20000000, 0x8000)
@@ -147,6 +147,7 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.usppciephy import USPPCIEPHY
             self.submodules.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
@@ -181,6 +182,8 @@ def main():
     target_group.add_argument("--with-led-chaser", action="store_true", help="Enable LED Chaser.")
     builder_args(parser)
     soc_core_args(parser)
+    l2_cache_args(parser)
+    add_args(parser)
     args = parser.parse_args()
 
     if args.with_hbm:
@@ -193,13 +196,16 @@ def main():
         with_led_chaser = args.with_led_chaser,
         with_hbm        = args.with_hbm,
         with_analyzer   = args.with_analyzer,
-        **soc_core_argdict(args)
+        **soc_core_argdict(args),
+        **l2_cache_argdict(args)
 	)
+    apply_args(soc, args)
     builder = Builder(soc, **builder_argdict(args))
     if args.build:
         builder.build()
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
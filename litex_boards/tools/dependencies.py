@@ -0,0 +1,133 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Dependencies of the platforms/targets, used to select and cache tests/builds:
+# - litex_boards files: followed statically from the litex_boards imports (no module is imported).
+# - Installed packages: versions of the LiteX ecosystem packages the platforms/targets use.
+
+import os
+import ast
+import json
+import hashlib
+import subprocess
+import importlib.util
+
+root = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# litex_boards Files -------------------------------------------------------------------------------
+
+def module_file(module):
+    """Return the file of a litex_boards module/package (relative to root), None if not a module."""
+    for path in [os.path.join(*module.split(".")) + ".py", os.path.join(*module.split("."), "__init__.py")]:
+        if os.path.exists(os.path.join(root, path)):
+            return path
+    return None
+
+def imports(path):
+    """Return the litex_boards files directly imported by a file."""
+    files = set()
+    tree  = ast.parse(open(os.path.join(root, path)).read())
+    for node in ast.walk(tree):
+        modules = []
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module is not None and node.level == 0:
+            modules = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+        for module in modules:
+            if module.startswith("litex_boards."):
+                f = module_file(module)
+                if f is not None:
+                    files.add(f)
+    return files
+
+_deps_cache = {}
+
+def dependencies(path):
+    """Return a file and the litex_boards files it depends on (transitively)."""
+    if path not in _deps_cache:
+        deps  = {path}
+        stack = [path]
+        while stack:
+            for f in imports(stack.pop()):
+                if f not in deps:
+                    deps.add(f)
+                    stack.append(f)
+        _deps_cache[path] = deps
+    return _deps_cache[path]
+
+def platform_files(name):
+    # Platforms are tested/built with the simple target.
+    return dependencies(f"litex_boards/platforms/{name}.py") | dependencies("litex_boards/targets/simple.py")
+
+def target_files(name):
+    return dependencies(f"litex_boards/targets/{name}.py")
+
+# Installed Packages -------------------------------------------------------------------------------
+
+packages = [
+    "migen",
+    "litex",
+    "litedram",
+    "liteeth",
+    "litepcie",
+    "litesata",
+    "litesdcard",
+    "liteiclink",
+    "litescope",
+    "litespi",
+    "pythondata_cpu_vexriscv",
+]
+
+def _git(directory, *args):
+    return subprocess.check_output(["git", "-C", directory] + list(args), stderr=subprocess.DEVNULL)
+
+def _distribution_version(name):
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError: # Python < 3.8.
+        return "unknown"
+    for distribution in [name, name.replace("_", "-")]:
+        try:
+            return version(distribution)
+        except PackageNotFoundError:
+            pass
+    return "unknown"
+
+def package_version(name):
+    """Return the version of an installed package (None if not installed).
+
+    Development installs (package in a git checkout) also get the commit and a hash of the
+    uncommitted changes, since their distribution version does not change between commits.
+    """
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    v = _distribution_version(name)
+    directory = os.path.dirname(list(spec.submodule_search_locations or [spec.origin])[0])
+    try:
+        if os.path.normpath(_git(directory, "rev-parse", "--show-toplevel").decode().strip()) == os.path.normpath(directory):
+            v += "+" + _git(directory, "rev-parse", "HEAD").decode().strip()
+            v += "+" + hashlib.sha256(_git(directory, "diff", "HEAD")).hexdigest()[:16]
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return v
+
+_versions = None
+
+def package_versions():
+    """Return the {package: version} of the installed packages (see package_version)."""
+    global _versions
+    if _versions is None:
+        _versions = {name: package_version(name) for name in packages}
+    return _versions
+
+def content_hash(files, cmd):
+    """Return a hash of a command, the litex_boards files and installed packages it depends on."""
+    h = hashlib.sha256(cmd.encode())
+    h.update(json.dumps(package_versions(), sort_keys=True).encode())
+    for f in sorted(files):
+        h.update(f.encode())
+        h.update(open(os.path.join(root, f), "rb").read())
+    return h.hexdigest()
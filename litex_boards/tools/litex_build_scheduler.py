@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Multi-target build scheduler.
+#
+# Builds a list of (target, args) jobs in two phases:
+# - Elaboration: each target is run with --build --no-compile (in parallel), generating the
+#   gateware and toolchain build script. The elaboration is skipped when the job, the litex_boards
+#   files of the target and the installed LiteX packages are unchanged since the previous run
+#   (elaboration cache).
+# - Toolchain: the build scripts are run concurrently, limited by the number of CPU slots, the
+#   per-toolchain licenses and a memory budget (per-toolchain memory estimates).
+# A summary of the elaboration/build times and timing results is printed (and written as JSON).
+#
+# Use:
+# ./litex_build_scheduler.py --jobs-file=nightly.txt --license=vivado=2 --license=quartus=1 --mem-budget=64
+# (nightly.txt: one "target [args]" job per line, ex: "digilent_arty --with-ethernet")
+
+import os
+import re
+import sys
+import json
+import time
+import shlex
+import argparse
+import subprocess
+
+from concurrent.futures import ThreadPoolExecutor
+
+from litex_boards.tools.dependencies import target_files, content_hash
+
+# Toolchains ---------------------------------------------------------------------------------------
+
+# Toolchain: (Build script pattern, default memory estimate (GB)).
+toolchains = {
+    "vivado"  : (r"\bvivado\b",                     8),
+    "ise"     : (r"\bxst\b|\bpar\b",                4),
+    "quartus" : (r"\bquartus_",                     6),
+    "diamond" : (r"\bdiamondc\b|\bpnmainc\b",       4),
+    "radiant" : (r"\bradiantc\b",                   4),
+    "gowin"   : (r"\bgw_sh\b",                      2),
+    "efinity" : (r"\befx_run",                      2),
+    "nextpnr" : (r"\bnextpnr-",                     2),
+}
+
+def detect_toolchain(script):
+    contents = open(script).read()
+    for name, (pattern, _) in toolchains.items():
+        if re.search(pattern, contents):
+            return name
+    return "unknown"
+
+# Timing results (first match of the toolchain reports/logs).
+_timing_patterns = [
+    (r"WNS\(ns\)\s+TNS\(ns\).*\n\s*-+.*\n\s*(-?[\d.]+)", "WNS {} ns"),       # Vivado.
+    (r"Max frequency for clock\s+'([^']+)':\s+([\d.]+) MHz", "{} {} MHz"),  # nextpnr.
+    (r"Slack\s*:\s*(-?[\d.]+)", "Slack {} ns"),                             # Quartus.
+]
+
+def timing_summary(gateware_dir):
+    results = []
+    for f in sorted(os.listdir(gateware_dir)):
+        if not (f.endswith(".rpt") or f.endswith(".log") or f.endswith(".sta.summary")):
+            continue
+        contents = open(os.path.join(gateware_dir, f), errors="ignore").read()
+        for pattern, fmt in _timing_patterns:
+            for m in re.finditer(pattern, contents):
+                results.append(fmt.format(*m.groups()))
+            if results:
+                return results[-4:]
+    return results
+
+# Jobs ---------------------------------------------------------------------------------------------
+
+class Job:
+    def __init__(self, spec, output_dir):
+        self.spec       = spec
+        self.target, *self.args = shlex.split(spec)
+        self.name       = re.sub(r"[^a-zA-Z0-9_]+", "_", spec).strip("_")
+        self.output_dir = os.path.join(output_dir, self.name)
+        self.toolchain  = None
+        self.script     = None
+        self.status     = "pending"
+        self.elab_time  = None
+        self.build_time = None
+        self.timing     = []
+        self.proc       = None
+
+    @property
+    def gateware_dir(self):
+        return os.path.join(self.output_dir, "gateware")
+
+    def elab_hash(self):
+        return content_hash(target_files(self.target), self.spec)
+
+    def elaborate(self):
+        hash_file = os.path.join(self.output_dir, ".elab_hash")
+        h         = self.elab_hash()
+        if os.path.exists(hash_file) and open(hash_file).read() == h and self.find_script():
+            self.elab_time = 0.0
+            self.status    = "elaborated (cached)"
+            return True
+        start = time.time()
+        cmd   = [sys.executable, "-m", f"litex_boards.targets.{self.target}",
+            "--build", "--no-compile", f"--output-dir={self.output_dir}"] + self.args
+        with open(os.path.join(self.output_dir + ".elab.log"), "w") as log:
+            r = subprocess.run(cmd, stdout=log, stderr=subprocess.STDOUT)
+        self.elab_time = time.time() - start
+        if r.returncode != 0 or not self.find_script():
+            self.status = "elaboration failed"
+            return False
+        open(hash_file, "w").write(h)
+        self.status = "elaborated"
+        return True
+
+    def find_script(self):
+        if not os.path.isdir(self.gateware_dir):
+            return False
+        for f in sorted(os.listdir(self.gateware_dir)):
+            if f.startswith("build_") and (f.endswith(".sh") or f.endswith(".bat")):
+                self.script    = f
+                self.toolchain = detect_toolchain(os.path.join(self.gateware_dir, f))
+                return True
+        return False
+
+    def start(self):
+        self.start_time = time.time()
+        self.log        = open(os.path.join(self.output_dir + ".build.log"), "w")
+        self.proc       = subprocess.Popen(["bash", self.script], cwd=self.gateware_dir,
+            stdout=self.log, stderr=subprocess.STDOUT)
+        self.status     = "building"
+
+    def poll(self):
+        if self.proc.poll() is None:
+            return False
+        self.log.close()
+        self.build_time = time.time() - self.start_time
+        self.status     = "done" if self.proc.returncode == 0 else "build failed"
+        self.timing     = timing_summary(self.gateware_dir)
+        return True
+
+# Scheduler ----------------------------------------------------------------------------------------
+
+def _mem_total():
+    try:
+        for line in open("/proc/meminfo"):
+            if line.startswith("MemTotal:"):
+                return int(line.split()[1])/1024/1024
+    except OSError:
+        pass
+    return 16
+
+def _key_values(items, cast=int):
+    return {k: cast(v) for k, v in (item.split("=") for item in items)}
+
+def schedule(jobs, slots, licenses, mem_budget, mem_estimates, poll=1.0):
+    pending = [job for job in jobs if job.status.startswith("elaborated")]
+    running = []
+    while pending or running:
+        # Completed jobs.
+        for job in [job for job in running if job.poll()]:
+            running.remove(job)
+            print("[{}] {} ({:.0f}s).".format(job.toolchain, job.spec, job.build_time))
+        # Start jobs (in order) when a slot, a license and enough memory are available.
+        for job in list(pending):
+            if len(running) >= slots:
+                break
+            used_licenses = sum(1 for j in running if j.toolchain == job.toolchain)
+            used_mem      = sum(mem_estimates[j.toolchain] for j in running)
+            if used_licenses >= licenses.get(job.toolchain, slots):
+                continue
+            if running and used_mem + mem_estimates[job.toolchain] > mem_budget:
+                continue
+            pending.remove(job)
+            running.append(job)
+            job.start()
+        time.sleep(poll)
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-target build scheduler.")
+    parser.add_argument("--job",        default=[], action="append",      help="Job (target and args, can be repeated).")
+    parser.add_argument("--jobs-file",  default=None,                     help="Jobs file (one job per line).")
+    parser.add_argument("--output-dir", default="build_scheduler",        help="Base output directory.")
+    parser.add_argument("--slots",      default=os.cpu_count(), type=int, help="Concurrent toolchain runs.")
+    parser.add_argument("--license",    default=[], action="append",      help="Toolchain license limit (toolchain=n, ex: vivado=2).")
+    parser.add_argument("--mem",        default=[], action="append",      help="Toolchain memory estimate (toolchain=GB, ex: vivado=12).")
+    parser.add_argument("--mem-budget", default=None, type=float,         help="Memory budget (in GB, default: total memory).")
+    parser.add_argument("--elab-only",  action="store_true",              help="Only elaborate the jobs.")
+    parser.add_argument("--json",       default=None,                     help="Write the summary as JSON.")
+    args = parser.parse_args()
+
+    specs = list(args.job)
+    if args.jobs_file is not None:
+        for line in open(args.jobs_file):
+            line = line.split("#")[0].strip()
+            if line:
+                specs.append(line)
+    if not specs:
+        parser.error("No job.")
+    os.makedirs(args.output_dir, exist_ok=True)
+    jobs = [Job(spec, args.output_dir) for spec in specs]
+
+    # Elaboration (in parallel).
+    def elaborate(job):
+        os.makedirs(job.output_dir, exist_ok=True)
+        job.elaborate()
+        print("[elab] {} {}.".format(job.spec, job.status))
+    with ThreadPoolExecutor(max_workers=args.slots) as executor:
+        list(executor.map(elaborate, jobs))
+
+    # Toolchain builds.
+    if not args.elab_only:
+        mem_estimates = {name: mem for name, (_, mem) in toolchains.items()}
+        mem_estimates["unknown"] = 4
+        mem_estimates.update(_key_values(args.mem, float))
+        schedule(jobs,
+            slots         = args.slots,
+            licenses      = _key_values(args.license),
+            mem_budget    = args.mem_budget or _mem_total(),
+            mem_estimates = mem_estimates)
+
+    # Summary.
+    print("")
+    print("{:<48} {:<8} {:>9} {:>10} {:<20} {}".format("Job", "Tool", "Elab (s)", "Build (s)", "Status", "Timing"))
+    for job in jobs:
+        print("{:<48} {:<8} {:>9} {:>10} {:<20} {}".format(job.spec[:48], job.toolchain or "-",
+            "-" if job.elab_time  is None else "{:.0f}".format(job.elab_time),
+            "-" if job.build_time is None else "{:.0f}".format(job.build_time),
+            job.status, ", ".join(job.timing)))
+    if args.json is not None:
+        with open(args.json, "w") as f:
+            json.dump([{
+                "job"        : job.spec,
+                "toolchain"  : job.toolchain,
+                "elab_time"  : job.elab_time,
+                "build_time" : job.build_time,
+                "status"     : job.status,
+                "timing"     : job.timing,
+            } for job in jobs], f, indent=2)
+    sys.exit(0 if all(job.status in ["done", "elaborated", "elaborated (cached)"] for job in jobs) else 1)
+
+if __name__ == "__main__":
+    main()
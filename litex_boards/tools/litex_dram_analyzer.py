@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# DRAM Analyzer capture.
+#
+# Configures/arms the LiteScope Analyzer with DRAM storage added with --with-dram-analyzer (using
+# the LiteScope driver), waits for the capture and uploads it with bulk main_ram reads over the
+# litex_server bridge (Etherbone/PCIe recommended) instead of CSR polling.
+#
+# Use:
+# litex_server --udp --udp-ip=192.168.1.50 (or --pcie)
+# ./litex_dram_analyzer.py --csr-csv=csr.csv --config-csv=dram_analyzer.csv \
+#     --rising-edge=<signal from dram_analyzer.csv> --offset=1024 --length=1000000 --dump=dump.vcd
+
+import sys
+import time
+import argparse
+
+from litex import RemoteClient
+
+from litescope.software.dump.common import DumpData
+from litescope.software.driver.analyzer import LiteScopeAnalyzerDriver
+
+# DRAM Analyzer Driver -----------------------------------------------------------------------------
+
+class LiteScopeDRAMAnalyzerDriver(LiteScopeAnalyzerDriver):
+    def __init__(self, bus, name, config_csv=None, burst=128, debug=False):
+        self.bus   = bus
+        self.burst = burst
+        LiteScopeAnalyzerDriver.__init__(self, bus.regs, name, config_csv, debug)
+
+    def _evict_l2(self):
+        # The capture is written directly to DRAM: evict L2 Cache lines possibly holding a previous
+        # capture by reading a L2-sized region outside of the ring buffer (the L2 is direct-mapped).
+        l2_size = self.bus.constants.d.get("config_l2_size", 0)
+        if l2_size:
+            base = self.bus.mems.d["main_ram"].base
+            for addr in range(base, base + l2_size, 4*self.burst):
+                self.bus.read(addr, length=min(self.burst, (base + l2_size - addr)//4))
+
+    def upload(self):
+        if self.storage_overflow.read():
+            print("Warning: samples dropped during capture (DRAM bandwidth exceeded).")
+        self._evict_l2()
+
+        # Compute capture position in the ring buffer.
+        captured = self.storage_mem_level.read()
+        trigger  = self.storage_trigger.read()
+        length   = self.length
+        if captured < self.depth:
+            # Ring buffer not filled: fewer pre-trigger samples may be available.
+            missing     = max(0, self.offset - trigger)
+            self.offset = self.offset - missing
+            length      = min(length - missing, captured - (trigger - self.offset))
+        start = (trigger - self.offset) % self.depth
+
+        # Read ring buffer (as 32-bit words, wrapping).
+        sample_bytes = self.sample_width//8
+        words        = []
+        first_word   = (start*sample_bytes)//4
+        nwords       = (length*sample_bytes + 3)//4 + 1
+        ring_words   = self.depth*sample_bytes//4
+        remaining    = nwords
+        t0           = time.time()
+        while remaining > 0:
+            index = (first_word + nwords - remaining) % ring_words
+            n     = min(remaining, self.burst, ring_words - index)
+            words += self.bus.read(self.base + 4*index, length=n)
+            remaining -= n
+            sys.stdout.write("[{}>{}] {}%\r".format('=' * (20-20*remaining//nwords),
+                                                   ' ' * (20*remaining//nwords),
+                                                   100-(100*remaining//nwords)))
+        duration = time.time() - t0
+        print("")
+        print("Uploaded {} samples in {:.2f}s ({:.2f}MB/s).".format(
+            length, duration, 4*nwords/(duration*1e6) if duration else 0))
+
+        # Unpack samples (little-endian).
+        raw  = b"".join(w.to_bytes(4, "little") for w in words)
+        skip = (start*sample_bytes) % 4
+        mask = 2**self.data_width - 1
+        self.data = DumpData(self.data_width)
+        for i in range(length):
+            offset = skip + i*sample_bytes
+            self.data.append(int.from_bytes(raw[offset:offset + sample_bytes], "little") & mask)
+        return self.data
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="DRAM Analyzer capture.")
+    parser.add_argument("--csr-csv",       default="csr.csv",           help="SoC CSV file.")
+    parser.add_argument("--config-csv",    default="dram_analyzer.csv", help="Analyzer CSV file.")
+    parser.add_argument("--host",          default="localhost",         help="Host ip address.")
+    parser.add_argument("--port",          default=1234, type=int,      help="Host bind port.")
+    parser.add_argument("--name",          default="dram_analyzer",     help="Analyzer name in the SoC.")
+    parser.add_argument("--group",         default=0,    type=int,      help="Capture group.")
+    parser.add_argument("--subsampling",   default=1,    type=int,      help="Capture subsampling.")
+    parser.add_argument("--rising-edge",   action="append",             help="Add rising edge trigger.")
+    parser.add_argument("--falling-edge",  action="append",             help="Add falling edge trigger.")
+    parser.add_argument("--value-trigger", action="append", nargs=2,    help="Add conditional trigger with given value.", metavar=("TRIGGER", "VALUE"))
+    parser.add_argument("--offset",        default=0,    type=int,      help="Capture offset (pre-trigger samples).")
+    parser.add_argument("--length",        default=None, type=int,      help="Capture length (in samples, default to depth).")
+    parser.add_argument("--burst",         default=128,  type=int,      help="Read burst length (in 32-bit words).")
+    parser.add_argument("--dump",          default="dump.vcd",          help="Capture dump (.vcd, .csv, .py, .json, .sr).")
+    args = parser.parse_args()
+
+    bus = RemoteClient(host=args.host, port=args.port, csr_csv=args.csr_csv)
+    bus.open()
+    try:
+        analyzer = LiteScopeDRAMAnalyzerDriver(bus, args.name, config_csv=args.config_csv, burst=args.burst)
+        analyzer.configure_group(args.group)
+        analyzer.configure_subsampler(args.subsampling)
+        triggers = False
+        for signal in (args.rising_edge or []):
+            analyzer.add_rising_edge_trigger(signal)
+            triggers = True
+        for signal in (args.falling_edge or []):
+            analyzer.add_falling_edge_trigger(signal)
+            triggers = True
+        for signal, value in (args.value_trigger or []):
+            analyzer.add_trigger(cond={signal: value})
+            triggers = True
+        if not triggers:
+            analyzer.add_trigger(cond={})
+        analyzer.run(offset=args.offset, length=args.length)
+        analyzer.wait_done()
+        analyzer.upload()
+        analyzer.save(args.dump)
+    finally:
+        bus.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Targets elaboration benchmark.
+#
+# Elaborates a representative set of targets/options with --build --no-compile and records for each
+# one the wall time, peak RSS, generated Verilog size and signal count. Results are stored as JSON
+# per commit and compared to a baseline (the previous result by default), regressions beyond the
+# threshold are reported and make the run fail, as do benchmarks failing to elaborate.
+#
+# Use:
+# ./litex_elab_bench.py --results=bench --threshold=0.3
+# ./litex_elab_bench.py --results=bench --target=digilent_arty --target="xilinx_alveo_u280 --with-hbm"
+
+import os
+import re
+import sys
+import json
+import time
+import shlex
+import argparse
+import tempfile
+import subprocess
+
+# Benchmarks ---------------------------------------------------------------------------------------
+
+# Representative targets/options (small/large Xilinx, Lattice, Intel, Ethernet/PCIe/HBM/Video).
+benchmarks = [
+    "digilent_arty",
+    "digilent_arty --with-ethernet --with-sdcard",
+    "digilent_nexys_video --with-ethernet --with-video-framebuffer",
+    "xilinx_kc705 --with-ethernet",
+    "xilinx_vc707 --with-pcie",
+    "xilinx_alveo_u280 --with-hbm",
+    "xilinx_alveo_u250 --with-pcie",
+    "lambdaconcept_ecpix5 --with-ethernet --with-video-terminal",
+    "lattice_versa_ecp5",
+    "icebreaker",
+    "terasic_de10nano",
+]
+
+# Regression metrics.
+metrics = ["time", "rss", "verilog_size", "signals"]
+
+_signal_re = re.compile(r"^\s*(reg|wire|logic)\b")
+
+def _verilog_stats(output_dir):
+    size    = 0
+    signals = 0
+    gateware_dir = os.path.join(output_dir, "gateware")
+    if os.path.isdir(gateware_dir):
+        for f in os.listdir(gateware_dir):
+            if f.endswith(".v") or f.endswith(".sv"):
+                path = os.path.join(gateware_dir, f)
+                size += os.path.getsize(path)
+                with open(path, errors="ignore") as v:
+                    signals += sum(1 for line in v if _signal_re.match(line))
+    return size, signals
+
+def run_benchmark(benchmark, cpu_type=None):
+    target, *options = shlex.split(benchmark)
+    with tempfile.TemporaryDirectory() as output_dir:
+        cmd = [sys.executable, "-m", f"litex_boards.targets.{target}",
+            "--build", "--no-compile", f"--output-dir={output_dir}"] + options
+        if cpu_type is not None:
+            cmd += [f"--cpu-type={cpu_type}"]
+        start = time.time()
+        proc  = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        stderr = proc.stderr.read()
+        _, status, rusage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(status) if hasattr(os, "waitstatus_to_exitcode") else (status >> 8)
+        duration = time.time() - start
+        if proc.returncode != 0:
+            return {"error": stderr.decode(errors="ignore").strip().split("\n")[-1]}
+        size, signals = _verilog_stats(output_dir)
+    return {
+        "time"         : round(duration, 3),
+        "rss"          : rusage.ru_maxrss*1024, # bytes.
+        "verilog_size" : size,
+        "signals"      : signals,
+    }
+
+# Results ------------------------------------------------------------------------------------------
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def latest_results(results_dir, exclude):
+    files = [os.path.join(results_dir, f) for f in os.listdir(results_dir)
+        if f.endswith(".json") and f != exclude]
+    return max(files, key=os.path.getmtime) if files else None
+
+def compare(results, baseline, threshold):
+    """Return the regressions as (benchmark, metric, baseline, current) tuples."""
+    regressions = []
+    for benchmark, r in results.items():
+        b = baseline.get(benchmark, {})
+        for metric in metrics:
+            if metric in r and b.get(metric):
+                if r[metric] > b[metric]*(1 + threshold):
+                    regressions.append((benchmark, metric, b[metric], r[metric]))
+    return regressions
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Targets elaboration benchmark.")
+    parser.add_argument("--target",    default=[], action="append",  help="Benchmark (target and options, can be repeated, default: representative set).")
+    parser.add_argument("--cpu-type",  default=None,                 help="Force CPU type.")
+    parser.add_argument("--results",   default="bench",              help="Results directory (one JSON per commit).")
+    parser.add_argument("--baseline",  default=None,                 help="Baseline JSON (default: latest result of another commit).")
+    parser.add_argument("--threshold", default=0.3, type=float,      help="Regression threshold (ratio).")
+    args = parser.parse_args()
+
+    commit  = git_commit()
+    results = {}
+    print("{:<64} {:>8} {:>10} {:>12} {:>10}".format("Benchmark", "Time (s)", "RSS (MB)", "Verilog (KB)", "Signals"))
+    for benchmark in args.target or benchmarks:
+        r = run_benchmark(benchmark, cpu_type=args.cpu_type)
+        results[benchmark] = r
+        if "error" in r:
+            print("{:<64} error: {}".format(benchmark, r["error"]))
+        else:
+            print("{:<64} {:>8.1f} {:>10.1f} {:>12.1f} {:>10}".format(
+                benchmark, r["time"], r["rss"]/1e6, r["verilog_size"]/1024, r["signals"]))
+
+    # Store.
+    os.makedirs(args.results, exist_ok=True)
+    filename = f"{commit}.json"
+    baseline = args.baseline or latest_results(args.results, exclude=filename)
+    with open(os.path.join(args.results, filename), "w") as f:
+        json.dump({"commit": commit, "date": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results}, f, indent=2)
+
+    # Errors.
+    errors = [benchmark for benchmark, r in results.items() if "error" in r]
+    for benchmark in errors:
+        print("Error: {} failed to elaborate.".format(benchmark))
+
+    # Compare.
+    if baseline is None:
+        print("No baseline, results stored as {}.".format(filename))
+        sys.exit(1 if errors else 0)
+    baseline_data = json.load(open(baseline))
+    regressions   = compare(results, baseline_data["results"], args.threshold)
+    print("\nBaseline: {} ({}).".format(baseline_data.get("commit", "?"), baseline))
+    for benchmark, metric, b, r in regressions:
+        print("Regression: {} {}: {} -> {} (+{:.0f}%).".format(benchmark, metric, b, r, (r/b - 1)*100))
+    if regressions or errors:
+        sys.exit(1)
+    print("No regression above {:.0f}%.".format(args.threshold*100))
+
+if __name__ == "__main__":
+    main()
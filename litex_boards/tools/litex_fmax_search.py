@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Target Fmax search.
+#
+# Searches the highest --sys-clk-freq closing timing for a target and option set: each round builds
+# the target at several frequencies in parallel (k-ary bisection of the [min, max] range) until the
+# range is narrower than the resolution. A frequency is:
+# - invalid: the elaboration fails as the CRG PLL can't generate the derived clocks (sys4x, idelay,
+#   video...), the frequency is then considered as failing.
+# - failing: the build fails or timing is not met (Vivado WNS < 0, nextpnr FAIL, Quartus slack < 0).
+# - passing: timing is met.
+# - unknown: the build succeeds but no timing result is found (toolchains without timing report
+#   support: Diamond, Radiant, Gowin, Efinity, ISE), the search is then aborted.
+#
+# Use:
+# ./litex_fmax_search.py --target=digilent_arty --min=80e6 --max=150e6 --resolution=1e6 --jobs=4 -- --with-ethernet
+
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+
+from concurrent.futures import ThreadPoolExecutor
+
+# Timing -------------------------------------------------------------------------------------------
+
+_vivado_wns_re  = re.compile(r"WNS\(ns\)\s+TNS\(ns\).*\n\s*-+.*\n\s*(-?[\d.]+)")
+_nextpnr_re     = re.compile(r"Max frequency for clock\s+'[^']+':\s+[\d.]+ MHz \((PASS|FAIL) at")
+_quartus_re     = re.compile(r"Slack\s*:\s*(-?[\d.]+)")
+_pll_errors_re  = re.compile(r"No PLL config found")
+
+def timing_met(gateware_dir, log):
+    """Return True/False if timing is met/not met, None if no timing result found."""
+    # Vivado.
+    for f in os.listdir(gateware_dir):
+        if f.endswith("_timing.rpt"):
+            m = _vivado_wns_re.search(open(os.path.join(gateware_dir, f), errors="ignore").read())
+            if m is not None:
+                return float(m.group(1)) >= 0
+    # nextpnr (post-routing report of the build log).
+    results = _nextpnr_re.findall(log[log.rfind("Routing"):] if "Routing" in log else log)
+    if results:
+        return "FAIL" not in results
+    # Quartus.
+    for f in os.listdir(gateware_dir):
+        if f.endswith(".sta.summary"):
+            slacks = [float(s) for s in _quartus_re.findall(open(os.path.join(gateware_dir, f)).read())]
+            if slacks:
+                return min(slacks) >= 0
+    return None
+
+# Build --------------------------------------------------------------------------------------------
+
+def build(target, freq, args, output_dir):
+    """Build target at freq, return ("pass"/"fail"/"invalid"/"unknown", details)."""
+    output_dir = os.path.join(output_dir, "{:.0f}".format(freq))
+    cmd = [sys.executable, "-m", f"litex_boards.targets.{target}",
+        "--build", f"--sys-clk-freq={freq:.0f}", f"--output-dir={output_dir}"] + args
+    os.makedirs(output_dir, exist_ok=True)
+    r   = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    log = r.stdout.decode(errors="ignore")
+    open(os.path.join(output_dir, "build.log"), "w").write(log)
+    gateware_dir = os.path.join(output_dir, "gateware")
+    # Elaboration failure (no gateware generated): clocking not possible at this frequency.
+    if not os.path.isdir(gateware_dir) or not any(f.endswith(".v") for f in os.listdir(gateware_dir)):
+        line = log.strip().split("\n")[-1] if log.strip() else ""
+        return ("invalid" if _pll_errors_re.search(log) else "fail"), line
+    if r.returncode != 0:
+        return "fail", "build failed"
+    met = timing_met(gateware_dir, log)
+    if met is None:
+        return "unknown", "no timing report found (build succeeded)"
+    return ("pass", "timing met") if met else ("fail", "timing not met")
+
+# Search -------------------------------------------------------------------------------------------
+
+def search(target, args, fmin, fmax, resolution, jobs, output_dir, log=print):
+    results = {}
+    lo      = fmin - resolution # Highest passing frequency (fmin - resolution: none).
+    hi      = fmax + resolution # Lowest failing frequency above lo (fmax + resolution: none).
+    while hi - lo > resolution:
+        # Frequencies to test (evenly spaced in ]lo, hi[, on the resolution grid).
+        freqs = [lo + (hi - lo)*(i + 1)/(jobs + 1) for i in range(jobs)]
+        freqs = sorted(set(round(f/resolution)*resolution for f in freqs))
+        freqs = [f for f in freqs if lo < f < hi and f not in results]
+        if not freqs:
+            break
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            for f, r in zip(freqs, executor.map(lambda f: build(target, f, args, output_dir), freqs)):
+                results[f] = r
+                log("{:8.2f}MHz: {:<8} {}".format(f/1e6, r[0], r[1]))
+        # Abort when timing can't be checked.
+        if any(r[0] == "unknown" for r in results.values()):
+            return None, results
+        # Update range.
+        passing = [f for f, r in results.items() if r[0] == "pass"]
+        lo      = max(passing + [fmin - resolution])
+        hi      = min([f for f, r in results.items() if r[0] != "pass" and f > lo] + [fmax + resolution])
+    return (lo if lo >= fmin else None), results
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Target Fmax search.")
+    parser.add_argument("--target",     required=True,              help="Target (litex_boards.targets module name).")
+    parser.add_argument("--min",        required=True, type=float,  help="Minimum sys_clk frequency (Hz).")
+    parser.add_argument("--max",        required=True, type=float,  help="Maximum sys_clk frequency (Hz).")
+    parser.add_argument("--resolution", default=1e6,   type=float,  help="Search resolution (Hz).")
+    parser.add_argument("--jobs",       default=2,     type=int,    help="Parallel builds per round.")
+    parser.add_argument("--output-dir", default="build_fmax",       help="Base output directory.")
+    parser.add_argument("--json",       default=None,               help="Write results as JSON.")
+    parser.add_argument("args",         nargs="*",                  help="Target arguments (after --).")
+    args = parser.parse_args()
+
+    fmax, results = search(args.target, args.args,
+        fmin       = args.min,
+        fmax       = args.max,
+        resolution = args.resolution,
+        jobs       = args.jobs,
+        output_dir = args.output_dir)
+
+    if any(r[0] == "unknown" for r in results.values()):
+        print("No timing results found in the build reports (unsupported toolchain), search aborted.")
+    elif fmax is None:
+        print("No frequency closing timing in [{:.2f}, {:.2f}]MHz.".format(args.min/1e6, args.max/1e6))
+    else:
+        print("Fmax: {:.2f}MHz ({}).".format(fmax/1e6, " ".join([args.target] + args.args)))
+    if args.json is not None:
+        with open(args.json, "w") as f:
+            json.dump({
+                "target"  : args.target,
+                "args"    : args.args,
+                "fmax"    : fmax,
+                "results" : {"{:.0f}".format(k): v for k, v in sorted(results.items())},
+            }, f, indent=2)
+    sys.exit(0 if fmax is not None else 1)
+
+if __name__ == "__main__":
+    main()
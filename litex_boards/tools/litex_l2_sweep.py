@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# L2 Cache sweep in simulation.
+#
+# Builds a simulated SoC (Verilator + LiteDRAM SDRAM model) for each L2 Cache profile, lets the BIOS
+# run its memspeed test on main_ram and reports Write/Read speeds for each profile. Profiles use the
+# same format as the targets' --l2-profile: size[:min_data_width[:full_memory_we]].
+#
+# Use:
+# ./litex_l2_sweep.py --sizes=0,2048,8192,32768 --min-data-widths=128,256 --csv=l2_sweep.csv
+
+import os
+import re
+import sys
+import csv
+import time
+import signal
+import selectors
+import argparse
+import itertools
+import subprocess
+
+# Speed parsing ------------------------------------------------------------------------------------
+
+_units = {"B": 1, "KiB": 1024, "MiB": 1024**2, "GiB": 1024**3}
+
+def _parse_speed(s):
+    m = re.match(r"([0-9]+)(?:\.([0-9]))?(B|KiB|MiB|GiB)/s", s)
+    if m is None:
+        return None
+    value = int(m.group(1)) + int(m.group(2) or 0)/10
+    return value*_units[m.group(3)]
+
+def _format_speed(speed):
+    if speed is None:
+        return "-"
+    return "{:.2f}MiB/s".format(speed/1024**2)
+
+# Simulation SoC -----------------------------------------------------------------------------------
+
+def build_and_run(profile, cpu_type, sdram_module, sdram_data_width, test_size, output_dir):
+    from migen.genlib.io import CRG
+
+    from litex.build.generic_platform import Pins, Subsignal
+    from litex.build.sim import SimPlatform
+    from litex.build.sim.config import SimConfig
+
+    from litex.soc.integration.soc_core import SoCCore
+    from litex.soc.integration.builder import Builder
+
+    from litedram import modules as litedram_modules
+    from litedram.phy.model import SDRAMPHYModel, sdram_module_nphases, get_sdram_phy_settings
+
+    from litex_boards.cores.l2_cache import parse_l2_profile
+
+    _io = [
+        ("sys_clk", 0, Pins(1)),
+        ("sys_rst", 0, Pins(1)),
+        ("serial", 0,
+            Subsignal("source_valid", Pins(1)),
+            Subsignal("source_ready", Pins(1)),
+            Subsignal("source_data",  Pins(8)),
+            Subsignal("sink_valid",   Pins(1)),
+            Subsignal("sink_ready",   Pins(1)),
+            Subsignal("sink_data",    Pins(8)),
+        ),
+    ]
+
+    l2 = parse_l2_profile(profile)
+
+    class SimSoC(SoCCore):
+        def __init__(self):
+            platform     = SimPlatform("SIM", _io)
+            sys_clk_freq = int(1e6)
+
+            # CRG ----------------------------------------------------------------------------------
+            self.submodules.crg = CRG(platform.request("sys_clk"))
+
+            # SoCCore ------------------------------------------------------------------------------
+            SoCCore.__init__(self, platform, clk_freq=sys_clk_freq,
+                cpu_type  = cpu_type,
+                uart_name = "sim",
+                ident     = "LiteX L2 Cache sweep ({})".format(profile))
+
+            # SDRAM --------------------------------------------------------------------------------
+            sdram_clk_freq   = int(100e6)
+            sdram_module_cls = getattr(litedram_modules, sdram_module)
+            sdram_rate       = "1:{}".format(sdram_module_nphases[sdram_module_cls.memtype])
+            module           = sdram_module_cls(sdram_clk_freq, sdram_rate)
+            self.submodules.sdrphy = SDRAMPHYModel(
+                module   = module,
+                settings = get_sdram_phy_settings(
+                    memtype    = module.memtype,
+                    data_width = sdram_data_width,
+                    clk_freq   = sdram_clk_freq),
+                clk_freq = sdram_clk_freq)
+            self.add_sdram("sdram",
+                phy                     = self.sdrphy,
+                module                  = module,
+                l2_cache_size           = l2["l2_size"],
+                l2_cache_min_data_width = l2.get("l2_min_data_width", 128),
+                l2_cache_full_memory_we = l2.get("l2_full_memory_we", True),
+            )
+            self.add_constant("MEMTEST_BUS_SIZE",  512)
+            self.add_constant("MEMTEST_ADDR_SIZE", 512)
+            self.add_constant("MEMTEST_DATA_SIZE", test_size)
+
+    sim_config = SimConfig()
+    sim_config.add_clocker("sys_clk", freq_hz=int(1e6))
+    sim_config.add_module("serial2console", "serial")
+
+    soc     = SimSoC()
+    builder = Builder(soc, output_dir=output_dir)
+    builder.build(sim_config=sim_config, interactive=False)
+
+# Sweep --------------------------------------------------------------------------------------------
+
+def run_profile(profile, args):
+    """Run one profile in a sub-process and return (write_speed, read_speed) from the BIOS memspeed."""
+    tag        = profile.replace(":", "_")
+    output_dir = os.path.join(args.output_dir, tag)
+    cmd = [sys.executable, os.path.abspath(__file__),
+        "--run-profile",      profile,
+        "--cpu-type",         args.cpu_type,
+        "--sdram-module",     args.sdram_module,
+        "--sdram-data-width", str(args.sdram_data_width),
+        "--test-size",        str(args.test_size),
+        "--output-dir",       output_dir,
+    ]
+    log = open(os.path.join(args.output_dir, tag + ".log"), "w")
+    p   = subprocess.Popen(cmd,
+        stdout                = subprocess.PIPE,
+        stderr                = subprocess.STDOUT,
+        start_new_session     = True)
+    write_speed = None
+    read_speed  = None
+    deadline    = time.time() + args.timeout
+    # The output is read unbuffered with a deadline: the timeout also applies when the simulation
+    # is stuck without printing (or in the middle of a line).
+    sel = selectors.DefaultSelector()
+    sel.register(p.stdout, selectors.EVENT_READ)
+    buf = b""
+    try:
+        while read_speed is None:
+            remaining = deadline - time.time()
+            if remaining <= 0 or not sel.select(timeout=remaining):
+                print("Timeout on {}, see {}.".format(profile, log.name))
+                break
+            data = os.read(p.stdout.fileno(), 4096)
+            if not data:
+                break
+            buf += data
+            *lines, buf = buf.split(b"\n")
+            for line in lines:
+                line = line.decode(errors="replace")
+                log.write(line + "\n")
+                m = re.search(r"Write speed: (\S+)", line)
+                if m:
+                    write_speed = _parse_speed(m.group(1))
+                m = re.search(r"Read speed: (\S+)", line)
+                if m:
+                    read_speed = _parse_speed(m.group(1))
+                    break
+    finally:
+        sel.close()
+        # The simulation does not exit by itself: stop the whole process group.
+        if p.poll() is None:
+            os.killpg(p.pid, signal.SIGTERM)
+            try:
+                p.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                os.killpg(p.pid, signal.SIGKILL)
+        p.wait()
+        p.stdout.close()
+        log.close()
+    return write_speed, read_speed
+
+def main():
+    parser = argparse.ArgumentParser(description="L2 Cache sweep in simulation.")
+    parser.add_argument("--sizes",            default="0,2048,8192,32768", help="L2 Cache sizes to sweep (comma separated).")
+    parser.add_argument("--min-data-widths",  default="128",               help="L2 Cache min data widths to sweep (comma separated).")
+    parser.add_argument("--full-memory-we",   default="1",                 help="L2 Cache full_memory_we choices to sweep (comma separated 0/1).")
+    parser.add_argument("--profiles",         default=None,                help="Explicit profiles to run (comma separated size:min_data_width:full_memory_we), overrides the sweep.")
+    parser.add_argument("--cpu-type",         default="vexriscv",          help="CPU type.")
+    parser.add_argument("--sdram-module",     default="MT48LC16M16",       help="SDRAM module (LiteDRAM model).")
+    parser.add_argument("--sdram-data-width", default=32,     type=int,    help="SDRAM data width.")
+    parser.add_argument("--test-size",        default=64*1024, type=int,   help="BIOS memspeed test size (in bytes).")
+    parser.add_argument("--timeout",          default=3600,   type=int,    help="Timeout per profile (in seconds).")
+    parser.add_argument("--output-dir",       default="build/l2_sweep",    help="Output directory.")
+    parser.add_argument("--csv",              default=None,                help="Save results to CSV file.")
+    parser.add_argument("--run-profile",      default=None,                help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Single profile (sub-process).
+    if args.run_profile is not None:
+        build_and_run(
+            profile          = args.run_profile,
+            cpu_type         = args.cpu_type,
+            sdram_module     = args.sdram_module,
+            sdram_data_width = args.sdram_data_width,
+            test_size        = args.test_size,
+            output_dir       = args.output_dir)
+        return
+
+    # Profiles.
+    if args.profiles is not None:
+        profiles = args.profiles.split(",")
+    else:
+        profiles = ["{}:{}:{}".format(*p) for p in itertools.product(
+            args.sizes.split(","),
+            args.min_data_widths.split(","),
+            args.full_memory_we.split(","))]
+
+    # Sweep.
+    os.makedirs(args.output_dir, exist_ok=True)
+    results = []
+    for profile in profiles:
+        print("Running {}...".format(profile))
+        write_speed, read_speed = run_profile(profile, args)
+        print("  Write: {} Read: {}".format(_format_speed(write_speed), _format_speed(read_speed)))
+        results.append((profile, write_speed, read_speed))
+
+    # Report.
+    print("")
+    print("{:<20} {:>14} {:>14}".format("Profile", "Write", "Read"))
+    for profile, write_speed, read_speed in results:
+        print("{:<20} {:>14} {:>14}".format(profile, _format_speed(write_speed), _format_speed(read_speed)))
+    if args.csv is not None:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["profile", "write_speed", "read_speed"])
+            for profile, write_speed, read_speed in results:
+                writer.writerow([profile, write_speed, read_speed])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# OpenOCD SPI Flash programming for one or several boards.
+#
+# Flashes an image through the OpenOCD programmer of a platform (create_programmer() config and
+# bscan_spi proxy), in parallel over several FTDI cables (one OpenOCD per cable). For each board:
+# - The adapter clock is the highest reliable one for the cable (probed from the fastest rate
+#   supported by the cable, falling back when the Flash readback is not stable).
+# - The Flash is read back and compared to the image per sector (SHA-256), only changed sectors
+#   are erased/programmed (and verified). Sectors are Flash erase sectors (or multiples of them),
+#   the Flash contents after the image in its last sector are preserved.
+# - Throughput is reported per board and for the whole run.
+#
+# Use:
+# ./litex_openocd_flash.py --platform=digilent_arty --image=build/digilent_arty/gateware/digilent_arty.bin --all
+
+import os
+import re
+import sys
+import time
+import hashlib
+import argparse
+import tempfile
+import importlib
+import subprocess
+import threading
+
+# FTDI Cables --------------------------------------------------------------------------------------
+
+# (VID, PID, bcdDevice): (Name, JTAG clocks (kHz) from the fastest).
+_hs_speeds = [30000, 25000, 15000, 10000, 6000]
+_fs_speeds = [6000, 3000, 1000]
+_cables = {
+    (0x0403, 0x6010, 0x0700): ("FT2232H", _hs_speeds),
+    (0x0403, 0x6010, 0x0500): ("FT2232D", _fs_speeds),
+    (0x0403, 0x6011, 0x0800): ("FT4232H", _hs_speeds),
+    (0x0403, 0x6014, 0x0900): ("FT232H",  _hs_speeds),
+}
+
+def _sysfs_read(path, name, base=16):
+    try:
+        value = open(os.path.join(path, name)).read().strip()
+        return value if base is None else int(value, base)
+    except (OSError, ValueError):
+        return None
+
+def list_cables():
+    """Return the connected FTDI cables as (serial, name, speeds) tuples."""
+    cables = []
+    root   = "/sys/bus/usb/devices"
+    if not os.path.isdir(root):
+        return cables
+    for device in sorted(os.listdir(root)):
+        path = os.path.join(root, device)
+        key  = (_sysfs_read(path, "idVendor"), _sysfs_read(path, "idProduct"), _sysfs_read(path, "bcdDevice"))
+        if key in _cables:
+            serial = _sysfs_read(path, "serial", base=None)
+            if serial is not None:
+                cables.append((serial,) + _cables[key])
+    return cables
+
+# OpenOCD ------------------------------------------------------------------------------------------
+
+class FlashError(Exception):
+    pass
+
+class OpenOCDBoard:
+    def __init__(self, config, flash_proxy, serial=None, speeds=(_hs_speeds[0],), sector_size=None, verbose=False):
+        self.config      = config
+        self.flash_proxy = flash_proxy
+        self.serial      = serial
+        self.speeds      = speeds
+        self.speed       = speeds[0]
+        self.sector_size = sector_size
+        self.verbose     = verbose
+
+    def run(self, commands, speed=None, capture=False):
+        script = "; ".join([
+            "gdb_port disabled",
+            "tcl_port disabled",
+            "telnet_port disabled",
+            "ftdi_serial {}".format(self.serial) if self.serial is not None else "",
+            "adapter_khz {}".format(self.speed if speed is None else speed),
+            "init",
+            "jtagspi_init 0 {{{}}}".format(self.flash_proxy),
+        ] + commands + ["exit"])
+        output = None if self.verbose else subprocess.DEVNULL
+        r = subprocess.run(["openocd", "-f", self.config, "-c", script],
+            stdout             = subprocess.PIPE   if capture else output,
+            stderr             = subprocess.STDOUT if capture else output,
+            universal_newlines = True)
+        if capture and self.verbose:
+            print(r.stdout, end="")
+        if r.returncode != 0:
+            raise FlashError("OpenOCD failed ({}).".format(self.name))
+        return r.stdout
+
+    @property
+    def name(self):
+        return self.serial if self.serial is not None else "default"
+
+    def read(self, tmpdir, address, length, speed=None, copies=1):
+        files = [os.path.join(tmpdir, "read{}.bin".format(n)) for n in range(copies)]
+        self.run(["flash read_bank 0 {{{}}} 0x{:x} {}".format(f, address, length) for f in files], speed=speed)
+        return [open(f, "rb").read() for f in files]
+
+    def erase_size(self):
+        """Return the Flash erase sector size (from OpenOCD flash info, at the slowest clock)."""
+        output = self.run(["flash info 0"], speed=self.speeds[-1], capture=True)
+        m = re.search(r"#\s*0\s*:\s*0x[0-9a-fA-F]+\s*\(0x([0-9a-fA-F]+)", output)
+        if m is None:
+            raise FlashError("Unable to get the Flash erase size ({}).".format(self.name))
+        return int(m.group(1), 16)
+
+    def readback(self, tmpdir, address, length):
+        """Read back the Flash at the highest reliable adapter clock.
+
+        Each clock is probed with two short reads (that must match), the Flash is then read once.
+        """
+        probe = min(length, self.sector_size)
+        for speed in self.speeds:
+            try:
+                data, check = self.read(tmpdir, address, probe, speed=speed, copies=2)
+                if (data != check) or (len(data) != probe):
+                    continue
+                data, = self.read(tmpdir, address, length, speed=speed)
+            except FlashError:
+                continue
+            if len(data) == length:
+                self.speed = speed
+                return data
+        raise FlashError("No reliable adapter clock ({}).".format(self.name))
+
+    def program(self, tmpdir, address, image, skip_unchanged=True):
+        """Program changed sectors, return the number of programmed bytes."""
+        # Sectors: erase sectors of the Flash (write_image erase erases whole erase sectors).
+        erase_size = self.erase_size()
+        if self.sector_size is None:
+            self.sector_size = erase_size
+        if self.sector_size % erase_size:
+            raise FlashError("Sector size {} is not a multiple of the Flash erase size {} ({}).".format(
+                self.sector_size, erase_size, self.name))
+        if address % erase_size:
+            raise FlashError("Address 0x{:x} is not aligned on the Flash erase size {} ({}).".format(
+                address, erase_size, self.name))
+        # Read back the Flash (the contents after the image in its last sector are kept).
+        tail = -len(image)%self.sector_size
+        if skip_unchanged:
+            current = self.readback(tmpdir, address, len(image) + tail)
+            image  += current[len(image):]
+        else:
+            current = b""
+            if tail:
+                image += self.readback(tmpdir, address + len(image), tail)
+        # Find changed sector runs.
+        runs = []
+        for offset in range(0, len(image), self.sector_size):
+            new = image[offset:offset + self.sector_size]
+            old = current[offset:offset + self.sector_size]
+            if hashlib.sha256(new).digest() == hashlib.sha256(old).digest():
+                continue
+            if runs and runs[-1][1] == offset:
+                runs[-1][1] = offset + len(new)
+            else:
+                runs.append([offset, offset + len(new)])
+        if not runs:
+            return 0
+        # Program runs.
+        commands = []
+        for n, (start, end) in enumerate(runs):
+            f = os.path.join(tmpdir, "run{}.bin".format(n))
+            open(f, "wb").write(image[start:end])
+            commands.append("flash write_image erase {{{}}} 0x{:x} bin".format(f, address + start))
+            commands.append("flash verify_image {{{}}} 0x{:x} bin".format(f, address + start))
+        commands.append("fpga_program")
+        self.run(commands)
+        return sum(end - start for start, end in runs)
+
+# Run ----------------------------------------------------------------------------------------------
+
+def _flash_board(board, address, image, skip_unchanged, results):
+    start = time.time()
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            programmed = board.program(tmpdir, address, image, skip_unchanged)
+        results[board.name] = (None, programmed, time.time() - start, board.speed)
+    except FlashError as e:
+        results[board.name] = (e, 0, time.time() - start, board.speed)
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenOCD SPI Flash programming for one or several boards.")
+    parser.add_argument("--platform",    required=True,                  help="Platform (litex_boards.platforms module name).")
+    parser.add_argument("--image",       required=True,                  help="Image to flash.")
+    parser.add_argument("--address",     default="0x0",                  help="Flash address.")
+    parser.add_argument("--serial",      default=[], action="append",    help="FTDI cable serial (can be repeated).")
+    parser.add_argument("--all",         action="store_true",            help="Flash all the connected FTDI cables.")
+    parser.add_argument("--speed",       default=None, type=int,         help="Force adapter clock (in kHz).")
+    parser.add_argument("--sector-size", default=None, type=int,         help="Flash sector size (in bytes, multiple of the Flash erase size, default: erase size).")
+    parser.add_argument("--no-skip",     action="store_true",            help="Program all sectors (no readback/compare).")
+    parser.add_argument("--verbose",     action="store_true",            help="Show OpenOCD outputs.")
+    args = parser.parse_args()
+
+    platform = importlib.import_module(f"litex_boards.platforms.{args.platform}").Platform()
+    prog     = platform.create_programmer()
+    if not hasattr(prog, "find_flash_proxy") or not hasattr(prog, "config"):
+        print("{} programmer is not OpenOCD based.".format(args.platform))
+        sys.exit(1)
+    config      = prog.find_config()
+    flash_proxy = prog.find_flash_proxy()
+    address     = int(args.address, 0)
+    image       = open(args.image, "rb").read()
+
+    # Boards.
+    cables = {serial: (name, speeds) for serial, name, speeds in list_cables()}
+    serials = list(cables.keys()) if args.all else args.serial
+    boards  = []
+    for serial in serials or [None]:
+        name, speeds = cables.get(serial, (None, _hs_speeds))
+        if args.speed is not None:
+            speeds = [args.speed]
+        boards.append(OpenOCDBoard(config, flash_proxy,
+            serial      = serial,
+            speeds      = speeds,
+            sector_size = args.sector_size,
+            verbose     = args.verbose))
+
+    # Flash (in parallel).
+    results = {}
+    start   = time.time()
+    threads = [threading.Thread(target=_flash_board, args=(board, address, image, not args.no_skip, results)) for board in boards]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.time() - start
+
+    # Report.
+    errors = 0
+    print("{:<20} {:>10} {:>12} {:>10} {:>12}".format("Board", "kHz", "Programmed", "Time (s)", "KB/s"))
+    for name, (error, programmed, t, speed) in results.items():
+        if error is not None:
+            errors += 1
+            print("{:<20} {}".format(name, error))
+            continue
+        print("{:<20} {:>10} {:>12} {:>10.1f} {:>12.1f}".format(name, speed, programmed, t, len(image)/1024/t))
+    print("{} board(s), {:.1f}s, {:.1f} KB/s aggregate.".format(len(boards), duration, len(boards)*len(image)/1024/duration))
+    sys.exit(1 if errors else 0)
+
+if __name__ == "__main__":
+    main()
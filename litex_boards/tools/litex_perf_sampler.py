@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Bus Performance Counters sampler.
+#
+# Periodically snapshots the PerfCounters added with --with-perf-counters and prints a utilization
+# table. Uses a litex_server bridge (JTAGbone/UARTbone/Etherbone/PCIe).
+#
+# Use:
+# litex_server --uart --uart-port=/dev/ttyUSBX (or --jtag / --udp)
+# ./litex_perf_sampler.py --csr-csv=csr.csv --interval=1
+
+import sys
+import time
+import argparse
+
+from litex import RemoteClient
+
+# Helpers ------------------------------------------------------------------------------------------
+
+_fields = ["active", "transfers", "waits"]
+
+def _get_taps(bus, name):
+    prefix = name + "_"
+    taps   = []
+    for reg in bus.regs.d.keys():
+        if reg.startswith(prefix) and reg.endswith("_active"):
+            taps.append(reg[len(prefix):-len("_active")])
+    return taps
+
+def _snapshot(bus, name, taps):
+    getattr(bus.regs, f"{name}_snapshot").write(1)
+    r = {"cycles": getattr(bus.regs, f"{name}_cycles").read()}
+    for tap in taps:
+        for field in _fields:
+            r[(tap, field)] = getattr(bus.regs, f"{name}_{tap}_{field}").read()
+    return r
+
+def _delta(new, old):
+    return (new - old) % 2**32
+
+# Sampler ------------------------------------------------------------------------------------------
+
+def sample(bus, name, interval, count, sort):
+    taps = _get_taps(bus, name)
+    if not len(taps):
+        print(f"No {name} found in csr.csv, was the SoC built with --with-perf-counters?")
+        sys.exit(1)
+    sys_clk_freq = bus.constants.d.get("config_clock_frequency", None)
+
+    prev = _snapshot(bus, name, taps)
+    n    = 0
+    while count == 0 or n < count:
+        time.sleep(interval)
+        curr   = _snapshot(bus, name, taps)
+        cycles = _delta(curr["cycles"], prev["cycles"])
+        rows   = []
+        for tap in taps:
+            active, transfers, waits = [_delta(curr[(tap, f)], prev[(tap, f)]) for f in _fields]
+            rows.append((tap, active, transfers, waits))
+        prev = curr
+        n   += 1
+        if sort:
+            rows.sort(key=lambda r: r[1], reverse=True)
+
+        # Print table.
+        duration = cycles/sys_clk_freq if sys_clk_freq else None
+        print("")
+        print("Sample {} ({} cycles{}):".format(n, cycles, "" if duration is None else ", {:.3f}s".format(duration)))
+        print("{:<32} {:>8} {:>8} {:>14} {:>14}".format("Tap", "Util", "Wait", "Transfers", "Transfers/s"))
+        for tap, active, transfers, waits in rows:
+            util = 100*active/cycles if cycles else 0
+            wait = 100*waits/active  if active else 0
+            rate = "-" if duration is None else "{:.0f}".format(transfers/duration)
+            print("{:<32} {:>7.2f}% {:>7.2f}% {:>14} {:>14}".format(tap, util, wait, transfers, rate))
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Bus Performance Counters sampler.")
+    parser.add_argument("--csr-csv",  default="csr.csv",       help="SoC CSV file.")
+    parser.add_argument("--host",     default="localhost",     help="Host ip address.")
+    parser.add_argument("--port",     default=1234, type=int,  help="Host bind port.")
+    parser.add_argument("--name",     default="perf_counters", help="PerfCounters name in the SoC.")
+    parser.add_argument("--interval", default=1.0, type=float, help="Sampling interval (in seconds, < 2^32 cycles).")
+    parser.add_argument("--count",    default=0,   type=int,   help="Number of samples (0 for infinite).")
+    parser.add_argument("--sort",     action="store_true",     help="Sort taps by utilization.")
+    args = parser.parse_args()
+
+    bus = RemoteClient(host=args.host, port=args.port, csr_csv=args.csr_csv)
+    bus.open()
+    try:
+        sample(bus, args.name, args.interval, args.count, args.sort)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        bus.close()
+
+if __name__ == "__main__":
+    main()
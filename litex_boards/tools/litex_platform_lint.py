@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Platform I/O static lint.
+#
+# Parses the platforms/*.py I/O tables (_io, _connectors...) with the ast module (no migen/LiteX
+# import, no elaboration) and reports:
+# - errors:   duplicated dict keys (silently overwritten), duplicated (name, number) resources,
+#             pins used twice in a Pins, dangling connector references (unknown connector, index
+#             out of range, unknown key, unconnected "-" pin), pins not in the package pinout.
+# - warnings: pins shared between resources/connectors, conflicting IOStandard voltages within an
+#             I/O bank (requires a package pinout with the pin banks).
+#
+# Package pinouts are optional and given per device prefix: Xilinx package files (Pin ... Bank
+# columns) or two columns "pin bank" text files.
+#
+# Use:
+# ./litex_platform_lint.py
+# ./litex_platform_lint.py --warnings --pinout=xc7a35t=xc7a35tcsg324pkg.txt --index=pins.json ../platforms/digilent_arty.py
+
+import os
+import re
+import ast
+import sys
+import json
+import glob
+import argparse
+
+from collections import namedtuple
+
+# Issues -------------------------------------------------------------------------------------------
+
+Issue = namedtuple("Issue", ["filename", "line", "level", "message"])
+
+# Unconnected/placeholder pins (ex: "X" for hard IP pins).
+placeholder_pins = [None, "-", "---", "X"]
+
+# AST Helpers --------------------------------------------------------------------------------------
+
+def _const(node):
+    """Return the value of a constant node (None if not constant), string concatenations folded."""
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left, right = _const(node.left), _const(node.right)
+        if isinstance(left, str) and isinstance(right, str):
+            return left + right
+    return None
+
+def _call_name(node):
+    if isinstance(node, ast.Call):
+        if isinstance(node.func, ast.Name):
+            return node.func.id
+        if isinstance(node.func, ast.Attribute):
+            return node.func.attr
+    return None
+
+def _pins(node):
+    """Return the pins of a Pins(...) call, None if not statically known (Pins(n), format...)."""
+    pins = []
+    for arg in node.args:
+        value = _const(arg)
+        if not isinstance(value, str):
+            return None
+        pins += value.split()
+    return pins
+
+def _table_nodes(node):
+    """Yield the List/Tuple/Dict nodes of a table expression (without descending into calls)."""
+    if isinstance(node, (ast.List, ast.Tuple)):
+        yield node
+        for elt in node.elts:
+            yield from _table_nodes(elt)
+    elif isinstance(node, ast.Dict):
+        yield node
+        for value in node.values:
+            yield from _table_nodes(value)
+    elif isinstance(node, ast.BinOp):
+        yield from _table_nodes(node.left)
+        yield from _table_nodes(node.right)
+
+def _iostandard(nodes):
+    """Return the IOStandard of constraints nodes (None if not set)."""
+    for node in nodes:
+        if _call_name(node) == "IOStandard" and node.args:
+            return _const(node.args[0])
+    return None
+
+# I/O Voltages -------------------------------------------------------------------------------------
+
+def iostandard_voltage(iostandard):
+    """Return the VCCIO voltage of an IOStandard (None if unknown/not voltage-specific)."""
+    if not isinstance(iostandard, str):
+        return None
+    # Intel/Efinix style: "3.3-V LVTTL", "1.8 V", "2.5 V".
+    m = re.search(r"(\d\.\d+)[- ]?V\b", iostandard)
+    if m is not None:
+        return float(m.group(1))
+    # Xilinx/Lattice style: LVCMOS33, SSTL135, LVDS_25, HSTL_I_18, POD12...
+    m = re.search(r"(\d{2,3})(?:_[A-Z]+)?$", iostandard.upper())
+    if m is not None:
+        return int(m.group(1))/(10 if len(m.group(1)) == 2 else 100)
+    if iostandard.upper() == "LVTTL":
+        return 3.3
+    return None
+
+# Platform Parsing ---------------------------------------------------------------------------------
+
+class PlatformIO:
+    def __init__(self, filename, source=None):
+        self.filename   = filename
+        self.source     = open(filename).read() if source is None else source
+        self.tree       = ast.parse(self.source, filename)
+        self.ios        = {} # List name: [(name, number, subsignal, pins, iostandard, line)].
+        self.connectors = {} # Connector name: (pins (list or dict), line).
+        self.device     = None
+        self.issues     = []
+        self.parse()
+
+    def error(self, line, message):
+        self.issues.append(Issue(self.filename, line, "error", message))
+
+    def warning(self, line, message):
+        self.issues.append(Issue(self.filename, line, "warning", message))
+
+    def parse(self):
+        lists = {}
+        for node in self.tree.body:
+            if isinstance(node, (ast.Assign, ast.AugAssign)):
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                for target in targets:
+                    if isinstance(target, ast.Name):
+                        elts = self.list_elements(node.value, lists)
+                        if elts is not None:
+                            if isinstance(node, ast.AugAssign):
+                                elts = lists.get(target.id, []) + elts
+                            lists[target.id] = elts
+            elif isinstance(node, ast.ClassDef):
+                self.parse_device(node)
+        # Dict keys (dicts of the module level assignments: I/O tables, connectors...).
+        assigns = [node.value for node in self.tree.body if isinstance(node, (ast.Assign, ast.AugAssign))]
+        for node in (n for value in assigns for n in _table_nodes(value)):
+            if isinstance(node, ast.Dict):
+                seen = {}
+                for key in node.keys:
+                    value = _const(key) if key is not None else None
+                    if value is None:
+                        continue
+                    if value in seen:
+                        self.error(key.lineno, "Duplicated key {!r} (first defined line {}).".format(value, seen[value]))
+                    seen[value] = key.lineno
+        # I/O and connector lists.
+        for name, elts in lists.items():
+            if "connector" in name:
+                self.parse_connectors(name, elts)
+            elif any(isinstance(e, ast.Tuple) and len(e.elts) >= 3 for e in elts):
+                self.ios[name] = self.parse_io(name, elts)
+
+    def list_elements(self, node, lists):
+        """Return the elements of a list expression (list literals, known lists and concatenations)."""
+        if isinstance(node, ast.List):
+            return list(node.elts)
+        if isinstance(node, ast.Name):
+            return list(lists[node.id]) if node.id in lists else None
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+            left  = self.list_elements(node.left,  lists)
+            right = self.list_elements(node.right, lists)
+            if left is not None and right is not None:
+                return left + right
+        return None
+
+    def parse_device(self, node):
+        defaults = {}
+        for f in node.body:
+            if isinstance(f, ast.FunctionDef) and f.name == "__init__":
+                args = f.args.args[len(f.args.args) - len(f.args.defaults):]
+                for arg, default in zip(args, f.args.defaults):
+                    defaults[arg.arg] = _const(default)
+        for call in ast.walk(node):
+            if isinstance(call, ast.Call) and _call_name(call) == "__init__" and len(call.args) >= 2:
+                device = call.args[1]
+                for kw in call.keywords:
+                    if kw.arg == "device":
+                        device = kw.value
+                if isinstance(device, ast.Name):
+                    self.device = defaults.get(device.id, None)
+                else:
+                    self.device = _const(device)
+                if isinstance(self.device, str):
+                    return
+
+    def parse_connectors(self, list_name, elts):
+        seen = {}
+        for elt in elts:
+            if not (isinstance(elt, (ast.Tuple, ast.List)) and len(elt.elts) >= 2):
+                continue
+            name = _const(elt.elts[0])
+            if not isinstance(name, str):
+                continue
+            # Pins: dict or pins strings (joined, as done by the LiteX ConnectorManager).
+            if isinstance(elt.elts[1], ast.Dict):
+                d    = elt.elts[1]
+                pins = {_const(k): _const(v) for k, v in zip(d.keys, d.values) if k is not None}
+            else:
+                strings = [_const(e) for e in elt.elts[1:]]
+                if not all(isinstance(string, str) for string in strings):
+                    continue
+                pins = [None if pin == "None" else pin for pin in " ".join(strings).split()]
+            if name in seen:
+                self.error(elt.lineno, "Duplicated connector {!r} in {} (first defined line {}).".format(
+                    name, list_name, seen[name]))
+            seen[name] = elt.lineno
+            # Connectors lists of the different revisions can define the same connector.
+            self.connectors.setdefault(name, (pins, elt.lineno))
+
+    def parse_io(self, list_name, elts):
+        ios  = []
+        seen = {}
+        for elt in elts:
+            if not (isinstance(elt, ast.Tuple) and len(elt.elts) >= 3):
+                continue
+            name, number = _const(elt.elts[0]), _const(elt.elts[1])
+            if not isinstance(name, str):
+                continue
+            if (name, number) in seen:
+                self.error(elt.lineno, "Duplicated resource ({!r}, {}) in {} (first defined line {}).".format(
+                    name, number, list_name, seen[(name, number)]))
+            seen[(name, number)] = elt.lineno
+            constraints = elt.elts[2:]
+            iostandard  = _iostandard(constraints)
+            for constraint in constraints:
+                if _call_name(constraint) == "Pins":
+                    ios.append((name, number, None, _pins(constraint), iostandard, constraint.lineno))
+                elif _call_name(constraint) == "Subsignal" and constraint.args:
+                    subsignal = _const(constraint.args[0])
+                    sub_iostandard = _iostandard(constraint.args[1:]) or iostandard
+                    for sub_constraint in constraint.args[1:]:
+                        if _call_name(sub_constraint) == "Pins":
+                            ios.append((name, number, subsignal, _pins(sub_constraint), sub_iostandard, sub_constraint.lineno))
+        return ios
+
+    def resolve(self, pin, line):
+        """Resolve a connector reference (connector:index/key) to a pin (None if dangling)."""
+        if ":" not in pin:
+            return pin
+        connector, index = pin.split(":", 1)
+        if connector not in self.connectors:
+            self.error(line, "Dangling connector reference {!r}: unknown connector {!r}.".format(pin, connector))
+            return None
+        pins, _ = self.connectors[connector]
+        if isinstance(pins, dict):
+            index = int(index) if index.isdigit() else index
+            if index not in pins:
+                self.error(line, "Dangling connector reference {!r}: unknown key {!r}.".format(pin, index))
+                return None
+            resolved = pins[index]
+        else:
+            if not index.isdigit() or int(index) >= len(pins):
+                self.error(line, "Dangling connector reference {!r}: index out of range (0-{}).".format(pin, len(pins) - 1))
+                return None
+            resolved = pins[int(index)]
+        if resolved in placeholder_pins:
+            self.error(line, "Dangling connector reference {!r}: unconnected pin.".format(pin))
+            return None
+        return self.resolve(resolved, line)
+
+# Lint ---------------------------------------------------------------------------------------------
+
+def load_pinout(filename):
+    """Load a package pinout: {pin: bank} (Xilinx package file or "pin bank" text file)."""
+    pinout = {}
+    columns = None
+    for line in open(filename):
+        fields = line.split()
+        if not fields or line.startswith("#") or line.startswith("--"):
+            continue
+        # Xilinx package file header (Pin Pin_Name Memory_Byte_Group Bank ...).
+        if fields[0] == "Pin" and "Bank" in fields:
+            columns = fields
+            continue
+        if columns is not None:
+            if len(fields) >= len(columns) - 2:
+                pinout[fields[0]] = fields[columns.index("Bank")]
+        elif len(fields) >= 2 and fields[0] != "Total":
+            pinout[fields[0]] = fields[1]
+    return pinout
+
+def lint(platform, pinouts={}, index=None):
+    """Lint a PlatformIO, return its issues. index (optional) is filled with {device: {pin: [uses]}}."""
+    pinout = None
+    for prefix, p in pinouts.items():
+        if isinstance(platform.device, str) and platform.device.lower().startswith(prefix.lower()):
+            pinout = p
+
+    # Connectors: pins used twice in a connector.
+    for name, (pins, line) in platform.connectors.items():
+        values = list(pins.values()) if isinstance(pins, dict) else pins
+        values = [v for v in values if v not in placeholder_pins]
+        for pin in sorted(set(v for v in values if values.count(v) > 1)):
+            platform.warning(line, "Pin {} used twice in connector {!r}.".format(pin, name))
+
+    # I/Os.
+    for list_name, ios in platform.ios.items():
+        uses  = {} # pin: [(resource, line)].
+        banks = {} # bank: {voltage: [(resource, iostandard, line)]}.
+        for name, number, subsignal, pins, iostandard, line in ios:
+            if pins is None:
+                continue
+            resource = "{}:{}{}".format(name, number, "" if subsignal is None else ":" + subsignal)
+            for pin in sorted(set(p for p in pins if pins.count(p) > 1 and p not in placeholder_pins)):
+                platform.error(line, "Pin {} used twice in {}.".format(pin, resource))
+            for pin in pins:
+                if pin in placeholder_pins:
+                    continue
+                resolved = platform.resolve(pin, line)
+                if resolved is None:
+                    continue
+                uses.setdefault(resolved, []).append((resource, line))
+                if index is not None and isinstance(platform.device, str):
+                    index.setdefault(platform.device, {}).setdefault(resolved, []).append(
+                        "{}:{}".format(os.path.basename(platform.filename), resource))
+                if pinout is not None:
+                    if resolved not in pinout:
+                        platform.error(line, "Pin {} of {} not in {} package.".format(resolved, resource, platform.device))
+                        continue
+                    voltage = iostandard_voltage(iostandard)
+                    if voltage is not None:
+                        banks.setdefault(pinout[resolved], {}).setdefault(voltage, []).append((resource, iostandard, line))
+        for pin, pin_uses in sorted(uses.items()):
+            resources = sorted(set(r.split(":")[0] + ":" + r.split(":")[1] for r, _ in pin_uses))
+            if len(resources) > 1:
+                platform.warning(pin_uses[-1][1], "Pin {} shared by {} in {}.".format(pin, ", ".join(resources), list_name))
+        for bank, voltages in sorted(banks.items()):
+            if len(voltages) > 1:
+                details = ", ".join("{} {}V ({})".format(uses[0][1], voltage, uses[0][0]) for voltage, uses in sorted(voltages.items()))
+                line    = max(uses[0][2] for uses in voltages.values())
+                platform.warning(line, "Conflicting IOStandards in bank {} of {}: {}.".format(bank, list_name, details))
+    return platform.issues
+
+def lint_files(filenames, pinouts={}, index=None):
+    issues = []
+    for filename in filenames:
+        try:
+            issues += lint(PlatformIO(filename), pinouts, index)
+        except SyntaxError as e:
+            issues.append(Issue(filename, e.lineno, "error", "Syntax error: {}.".format(e.msg)))
+    return issues
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    platforms_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "platforms")
+    parser = argparse.ArgumentParser(description="Platform I/O static lint.")
+    parser.add_argument("--pinout",   default=[], action="append", help="Package pinout (device_prefix=file, can be repeated).")
+    parser.add_argument("--index",    default=None,                help="Write the pins index (per device) as JSON.")
+    parser.add_argument("--warnings", action="store_true",         help="Also report warnings (shared pins, bank IOStandards).")
+    parser.add_argument("--strict",   action="store_true",         help="Report warnings and treat them as errors.")
+    parser.add_argument("files",      nargs="*",                   help="Platform files (default: all platforms).")
+    args = parser.parse_args()
+
+    files   = args.files or sorted(f for f in glob.glob(os.path.join(platforms_dir, "*.py")) if not f.endswith("__init__.py"))
+    pinouts = {}
+    for pinout in args.pinout:
+        prefix, filename = pinout.split("=", 1)
+        pinouts[prefix] = load_pinout(filename)
+    index  = {} if args.index is not None else None
+    issues = lint_files(files, pinouts, index)
+
+    for issue in issues:
+        if issue.level != "error" and not (args.warnings or args.strict):
+            continue
+        print("{}:{}: {}: {}".format(os.path.relpath(issue.filename), issue.line, issue.level, issue.message))
+    if index is not None:
+        with open(args.index, "w") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+    errors = [issue for issue in issues if issue.level == "error" or args.strict]
+    sys.exit(1 if errors else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# System Monitor Telemetry streaming.
+#
+# Streams the timestamped XADC/SYSMON conversions recorded by the SystemMonitorTelemetry core (added
+# with --with-telemetry) to a CSV file, optionally while running a benchmark command, and prints a
+# min/avg/max summary for each channel. Uses a litex_server bridge.
+#
+# Use:
+# litex_server --udp --udp-ip=192.168.1.50 (or --jtag / --uart)
+# ./litex_telemetry.py --csr-csv=csr.csv --period=0.01 --csv=telemetry.csv --run="./benchmark.sh"
+
+import sys
+import time
+import argparse
+import subprocess
+
+from litex import RemoteClient
+
+# Conversions --------------------------------------------------------------------------------------
+
+# 7-Series XADC (12-bit results, left aligned on 16-bit).
+def _xadc_temperature(raw):
+    return (raw >> 4)*503.975/4096 - 273.15
+
+def _xadc_supply(raw):
+    return (raw >> 4)*3/4096
+
+def _xadc_vaux(raw):
+    return (raw >> 4)/4096
+
+def convert(channel, raw):
+    if channel == 0x00:
+        return _xadc_temperature(raw), "C"
+    if channel in [0x01, 0x02, 0x06]:
+        return _xadc_supply(raw), "V"
+    if channel >= 0x10:
+        return _xadc_vaux(raw), "V"
+    return raw, "raw"
+
+# Telemetry ----------------------------------------------------------------------------------------
+
+class Telemetry:
+    def __init__(self, bus, name="telemetry", burst=64):
+        self.bus    = bus
+        self.name   = name
+        self.burst  = burst
+        self.regs   = {}
+        for reg in ["enable", "period", "level", "data", "dropped"]:
+            self.regs[reg] = getattr(bus.regs, f"{name}_{reg}")
+        self.labels = {}
+        for k, v in bus.constants.d.items():
+            prefix = f"{name}_channel"
+            if k.startswith(prefix):
+                self.labels[int(k[len(prefix):])] = str(v)
+        self.sys_clk_freq = bus.constants.d["config_clock_frequency"]
+        self.timestamp    = None
+
+    def label(self, channel):
+        return self.labels.get(channel, "ch{}".format(channel))
+
+    def start(self, period):
+        self.regs["enable"].write(0)
+        # Flush.
+        while self.regs["level"].read():
+            self.read()
+        self.regs["period"].write(int(period*self.sys_clk_freq))
+        self.regs["enable"].write(1)
+
+    def stop(self):
+        self.regs["enable"].write(0)
+
+    def read(self):
+        """Return available records as (time (s), channel, raw) tuples."""
+        records = []
+        level   = self.regs["level"].read()
+        words   = []
+        while level > 0:
+            n = min(level, self.burst)
+            data = self.regs["data"]
+            words += self.bus.read(data.addr, length=2*n, burst="fixed")
+            level -= n
+        for i in range(0, len(words), 2):
+            timestamp = words[i] | ((words[i+1] >> 24) << 32)
+            # Extend 40-bit timestamps.
+            if self.timestamp is not None:
+                timestamp += (self.timestamp >> 40) << 40
+                if timestamp < self.timestamp:
+                    timestamp += 2**40
+            self.timestamp = timestamp
+            records.append((timestamp/self.sys_clk_freq, (words[i+1] >> 16) & 0xff, words[i+1] & 0xffff))
+        return records
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="System Monitor Telemetry streaming.")
+    parser.add_argument("--csr-csv",  default="csr.csv",                help="SoC CSV file.")
+    parser.add_argument("--host",     default="localhost",              help="Host ip address.")
+    parser.add_argument("--port",     default=1234,  type=int,          help="Host bind port.")
+    parser.add_argument("--name",     default="telemetry",              help="Telemetry name in the SoC.")
+    parser.add_argument("--period",   default=0.01,  type=float,        help="Recording period (in seconds).")
+    parser.add_argument("--poll",     default=0.1,   type=float,        help="Host polling interval (in seconds).")
+    parser.add_argument("--duration", default=0,     type=float,        help="Streaming duration (in seconds, 0 for infinite or --run duration).")
+    parser.add_argument("--run",      default=None,                     help="Benchmark command to run while streaming.")
+    parser.add_argument("--scale",    default=[],    action="append",   help="Channel scaling (label=factor, ex: isns5v0=4.0).")
+    parser.add_argument("--csv",      default="telemetry.csv",          help="Output CSV file.")
+    args = parser.parse_args()
+
+    scales = {}
+    for scale in args.scale:
+        label, factor = scale.split("=")
+        scales[label] = float(factor)
+
+    bus = RemoteClient(host=args.host, port=args.port, csr_csv=args.csr_csv)
+    bus.open()
+    telemetry = Telemetry(bus, name=args.name)
+    stats     = {}
+    proc      = None
+    f         = open(args.csv, "w")
+    f.write("host_time,device_time,channel,label,raw,value,unit\n")
+    try:
+        telemetry.start(args.period)
+        t0 = time.time()
+        if args.run is not None:
+            proc = subprocess.Popen(args.run, shell=True)
+        while True:
+            time.sleep(args.poll)
+            host_time = time.time() - t0
+            for device_time, channel, raw in telemetry.read():
+                label       = telemetry.label(channel)
+                value, unit = convert(channel, raw)
+                value      *= scales.get(label, 1.0)
+                f.write("{:.6f},{:.9f},{},{},{},{:.6f},{}\n".format(
+                    host_time, device_time, channel, label, raw, value, unit))
+                s = stats.setdefault(label, [value, value, 0.0, 0, unit])
+                s[0] = min(s[0], value)
+                s[1] = max(s[1], value)
+                s[2] += value
+                s[3] += 1
+            f.flush()
+            if proc is not None and proc.poll() is not None:
+                break
+            if args.duration and host_time >= args.duration:
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        telemetry.stop()
+        dropped = telemetry.regs["dropped"].read()
+        bus.close()
+        f.close()
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+
+    # Summary.
+    print("")
+    print("{:<16} {:>12} {:>12} {:>12} {:>4} {:>8}".format("Channel", "Min", "Avg", "Max", "Unit", "Samples"))
+    for label, (vmin, vmax, vsum, n, unit) in stats.items():
+        print("{:<16} {:>12.4f} {:>12.4f} {:>12.4f} {:>4} {:>8}".format(label, vmin, vsum/n, vmax, unit, n))
+    if dropped:
+        print("Warning: {} records dropped (increase --period or reduce --poll).".format(dropped))
+    if proc is not None:
+        sys.exit(proc.returncode if proc.returncode is not None else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Change-aware selection of the platforms/targets to test.
+#
+# - LITEX_BOARDS_TEST_BASE=<git ref>: only test the platforms/targets impacted by the files changed
+#   since <git ref> (committed and uncommitted changes), following the litex_boards imports.
+# - LITEX_BOARDS_TEST_CACHE=<file>: skip the platforms/targets that already passed with the same
+#   content (hash of the test command, of the litex_boards files they depend on and of the installed
+#   LiteX packages versions).
+
+import os
+import json
+import subprocess
+
+from litex_boards.tools.dependencies import root, platform_files, target_files, content_hash
+
+# Files changes that impact all the platforms/targets.
+global_files = [
+    "setup.py",
+    "litex_boards/__init__.py",
+    "litex_boards/platforms/__init__.py",
+    "litex_boards/targets/__init__.py",
+    "litex_boards/cores/__init__.py",
+    "litex_boards/tools/dependencies.py",
+    "test/test_targets.py",
+    "test/selection.py",
+]
+
+# Selection ----------------------------------------------------------------------------------------
+
+def changed_files(base):
+    """Return the files changed since base (committed and uncommitted), None if unknown."""
+    try:
+        files = set()
+        for cmd in [["git", "diff", "--name-only", f"{base}...HEAD"], ["git", "diff", "--name-only", "HEAD"]]:
+            files |= set(subprocess.check_output(cmd, cwd=root).decode().split())
+        return files
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def impacted(names, files_fn, changed):
+    """Filter names to the ones depending on a changed file."""
+    if changed is None or any(f in global_files for f in changed):
+        return names
+    return [name for name in names if files_fn(name) & changed]
+
+class Selection:
+    def __init__(self):
+        self.base    = os.environ.get("LITEX_BOARDS_TEST_BASE", None)
+        self.cache   = os.environ.get("LITEX_BOARDS_TEST_CACHE", None)
+        self.changed = changed_files(self.base) if self.base is not None else None
+        self.passed  = {}
+        if self.cache is not None and os.path.exists(self.cache):
+            self.passed = json.load(open(self.cache))
+
+    def select(self, names, files_fn):
+        if self.base is None:
+            return names
+        return impacted(names, files_fn, self.changed)
+
+    def cached(self, key, files, cmd):
+        return self.cache is not None and self.passed.get(key) == content_hash(files, cmd)
+
+    def record(self, key, files, cmd):
+        if self.cache is not None:
+            self.passed[key] = content_hash(files, cmd)
+            with open(self.cache, "w") as f:
+                json.dump(self.passed, f, indent=2, sort_keys=True)
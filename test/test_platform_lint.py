@@ -0,0 +1,115 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import glob
+import time
+import unittest
+
+from litex_boards.tools.litex_platform_lint import PlatformIO, lint, lint_files
+
+_platform = """
+from litex.build.generic_platform import *
+from litex.build.xilinx import XilinxPlatform
+
+_io = [
+    ("clk100",    0, Pins("E3"), IOStandard("LVCMOS33")),
+    ("user_led",  0, Pins("H5"), IOStandard("LVCMOS33")),
+    ("user_led",  1, Pins("J5"), IOStandard("LVCMOS33")),
+    ("serial", 0,
+        Subsignal("tx", Pins("pmoda:0")),
+        Subsignal("rx", Pins("pmoda:1")),
+        IOStandard("LVCMOS33"),
+    ),
+    ("ddram", 0,
+        Subsignal("dq", Pins("K5 L3"), IOStandard("SSTL135")),
+    ),
+]
+
+_connectors = [
+    ("pmoda", "G13 B11 - D13"),
+    ("ck_io", {
+        "ck_io0" : "V15",
+        "ck_io1" : "U16",
+    }),
+    ("j1", {
+        1 : "A1",
+        2 : "A2",
+    }),
+]
+"""
+
+class TestPlatformLint(unittest.TestCase):
+    def lint(self, io=[], connectors=[], pinouts={}):
+        source = _platform
+        for line in io:
+            source = source.replace("_io = [\n", "_io = [\n    " + line + "\n", 1)
+        for line in connectors:
+            source = source.replace("_connectors = [\n", "_connectors = [\n    " + line + "\n", 1)
+        source += """
+class Platform(XilinxPlatform):
+    def __init__(self, device="xc7a35ticsg324-1L", toolchain="vivado"):
+        XilinxPlatform.__init__(self, device, _io, _connectors, toolchain=toolchain)
+"""
+        platform = PlatformIO("platform.py", source)
+        self.assertEqual(platform.device, "xc7a35ticsg324-1L")
+        return [(issue.level, issue.message) for issue in lint(platform, pinouts)]
+
+    def errors(self, *args, **kwargs):
+        return [message for level, message in self.lint(*args, **kwargs) if level == "error"]
+
+    def test_clean(self):
+        self.assertEqual(self.lint(), [])
+
+    def test_duplicates(self):
+        # Duplicated dict key (silently overwritten).
+        errors = self.errors(connectors=['("xadc", {"isns5v0_n" : "A1", "isns5v0_n" : "A2"}),'])
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Duplicated key 'isns5v0_n'", errors[0])
+        # Duplicated resource.
+        errors = self.errors(io=['("user_led", 1, Pins("T10"), IOStandard("LVCMOS33")),'])
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Duplicated resource ('user_led', 1)", errors[0])
+        # Pin used twice in a Pins.
+        errors = self.errors(io=['("user_btn", 0, Pins("D9 C9 D9")),'])
+        self.assertEqual(errors, ["Pin D9 used twice in user_btn:0."])
+        # Duplicated connector.
+        errors = self.errors(connectors=['("pmoda", "A1 A2"),'])
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Duplicated connector 'pmoda'", errors[0])
+
+    def test_shared_pins(self):
+        issues = self.lint(io=['("user_btn", 0, Pins("pmoda:0")),'])
+        self.assertEqual(issues, [("warning", "Pin G13 shared by serial:0, user_btn:0 in _io.")])
+
+    def test_dangling_connectors(self):
+        for pins, message in [
+            ("pmodb:0",      "unknown connector 'pmodb'"),
+            ("pmoda:4",      "index out of range (0-3)"),
+            ("pmoda:2",      "unconnected pin"),
+            ("ck_io:ck_io2", "unknown key 'ck_io2'"),
+            ("j1:3",         "unknown key 3"),
+        ]:
+            errors = self.errors(io=[f'("user_btn", 0, Pins("{pins}")),'])
+            self.assertEqual(len(errors), 1, pins)
+            self.assertIn(message, errors[0])
+        self.assertEqual(self.errors(io=['("user_btn", 0, Pins("ck_io:ck_io0 j1:2")),']), [])
+
+    def test_banks(self):
+        pinouts = {"xc7a35t": {"E3": "35", "H5": "35", "J5": "35", "G13": "15", "B11": "15", "D13": "15",
+            "K5": "34", "L3": "35"}}
+        issues = self.lint(pinouts=pinouts)
+        self.assertEqual(len(issues), 1)
+        self.assertEqual(issues[0][0], "warning")
+        self.assertIn("Conflicting IOStandards in bank 35", issues[0][1])
+        errors = self.errors(io=['("user_btn", 0, Pins("Z99")),'], pinouts=pinouts)
+        self.assertEqual(errors, ["Pin Z99 of user_btn:0 not in xc7a35ticsg324-1L package."])
+
+    def test_platforms_speed(self):
+        platforms_dir = os.path.join(os.path.dirname(__file__), "..", "litex_boards", "platforms")
+        files = glob.glob(os.path.join(platforms_dir, "*.py"))
+        start = time.time()
+        lint_files(files)
+        self.assertLess(time.time() - start, 1.0)
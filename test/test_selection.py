@@ -0,0 +1,61 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from litex_boards.tools import dependencies
+
+from .selection import Selection, impacted, platform_files, target_files
+
+class TestSelection(unittest.TestCase):
+    def test_dependencies(self):
+        # Target importing two platforms.
+        files = target_files("colorlight_5a_75x")
+        self.assertIn("litex_boards/targets/colorlight_5a_75x.py", files)
+        self.assertIn("litex_boards/platforms/colorlight_5a_75b.py", files)
+        self.assertIn("litex_boards/platforms/colorlight_5a_75e.py", files)
+        # Platforms are tested with the simple target.
+        files = platform_files("marble")
+        self.assertIn("litex_boards/platforms/marble.py", files)
+        self.assertIn("litex_boards/targets/simple.py", files)
+        self.assertNotIn("litex_boards/platforms/berkeleylab_marble.py", files)
+
+    def test_impacted(self):
+        targets = ["colorlight_5a_75x", "colorlight_i5", "berkeleylab_marble", "digilent_arty"]
+        # Platform change: targets importing it.
+        self.assertEqual(impacted(targets, target_files, {"litex_boards/platforms/colorlight_5a_75e.py"}),
+            ["colorlight_5a_75x"])
+        self.assertEqual(impacted(targets, target_files, {"litex_boards/platforms/berkeleylab_marble.py"}),
+            ["berkeleylab_marble"])
+        self.assertEqual(impacted(["marble", "berkeleylab_marble"], platform_files, {"litex_boards/platforms/marble.py"}),
+            ["marble"])
+        # Core change: targets using it.
+        self.assertEqual(impacted(targets, target_files, {"litex_boards/cores/telemetry.py"}),
+            ["digilent_arty"])
+        # Unrelated/global changes.
+        self.assertEqual(impacted(targets, target_files, {"README.md"}), [])
+        self.assertEqual(impacted(targets, target_files, {"setup.py"}), targets)
+        self.assertEqual(impacted(targets, target_files, None), targets)
+
+    def test_cache(self):
+        files = target_files("digilent_arty")
+        cmd   = "python3 -m litex_boards.targets.digilent_arty --build --no-compile"
+        with tempfile.TemporaryDirectory() as d:
+            cache = os.path.join(d, "cache.json")
+            with mock.patch.dict(os.environ, {"LITEX_BOARDS_TEST_CACHE": cache}):
+                selection = Selection()
+                self.assertFalse(selection.cached("target:digilent_arty", files, cmd))
+                selection.record("target:digilent_arty", files, cmd)
+                # Reloaded from the cache file.
+                selection = Selection()
+                self.assertTrue(selection.cached("target:digilent_arty", files, cmd))
+                self.assertFalse(selection.cached("target:digilent_arty", files, cmd + " --with-ethernet"))
+                # Installed LiteX packages upgrade.
+                versions = dict(dependencies.package_versions(), litex="upgraded")
+                with mock.patch.object(dependencies, "package_versions", return_value=versions):
+                    self.assertFalse(selection.cached("target:digilent_arty", files, cmd))
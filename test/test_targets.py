@@ -5,6 +5,7 @@
 # This file is Copyright (c) 2019 Tim 'mithro' Ansell <me@mith.ro>
 # SPDX-License-Identifier: BSD-2-Clause
 
+import sys
 import subprocess
 import unittest
 import os
@@ -13,6 +14,8 @@ from migen import *
 
 from litex.soc.integration.builder import *
 
+from .selection import Selection, platform_files, target_files
+
 class TestTargets(unittest.TestCase):
     excluded_platforms = [
         "qmtech_daughterboard",              # Reason: Not a real platform.
@@ -51,17 +54,24 @@ class TestTargets(unittest.TestCase):
                 if file not in ["__init__"] + self.excluded_platforms:
                     platforms.append(file)
 
+        # Select platforms (impacted by changes, not already passed).
+        selection = Selection()
+        platforms = selection.select(platforms, platform_files)
+
         # Test platforms with simple design.
         for name in platforms:
             with self.subTest(platform=name):
-                os.system("rm -rf build")
                 cmd = """\
 python3 -m litex_boards.targets.simple litex_boards.platforms.{} \
     --build            \
     --no-compile       \
     --uart-name="stub" \
 """.format(name)
+                if selection.cached(f"platform:{name}", platform_files(name), cmd):
+                    continue
+                os.system("rm -rf build")
                 subprocess.check_call(cmd, shell=True)
+                selection.record(f"platform:{name}", platform_files(name), cmd)
 
     # Build default configuration for all targets.
     def test_targets(self):
@@ -73,10 +83,13 @@ python3 -m litex_boards.targets.simple litex_boards.platforms.{} \
                 if file not in ["__init__"] + self.excluded_targets:
                     targets.append(file)
 
+        # Select targets (impacted by changes, not already passed).
+        selection = Selection()
+        targets   = selection.select(targets, target_files)
+
         # Test targets.
         for name in targets:
             with self.subTest(target=name):
-                os.system("rm -rf build")
                 cmd = """\
 python3 -m litex_boards.targets.{} \
     --cpu-type=vexriscv     \
@@ -84,4 +97,83 @@ python3 -m litex_boards.targets.{} \
     --build                 \
     --no-compile            \
 """.format(name)
+                if selection.cached(f"target:{name}", target_files(name), cmd):
+                    continue
+                os.system("rm -rf build")
+                subprocess.check_call(cmd, shell=True)
+                selection.record(f"target:{name}", target_files(name), cmd)
+
+    # Check targets startup: import time budget and optional cores only imported when enabled.
+    # The budget is relative to a baseline measured on the same machine: the import of the modules
+    # common to all targets (Migen, LiteX clocking, SoCCore and Builder).
+    startup_baseline = """\
+from migen import *
+from litex.soc.cores.clock import *
+from litex.soc.integration.soc_core import *
+from litex.soc.integration.builder import *
+"""
+    startup_margin   = 1.0 # In seconds, over the baseline.
+    optional_modules = [
+        "liteeth", "litepcie", "litesata", "liteiclink", "litesdcard", "litespi", "litescope",
+        "litedram.frontend",
+    ]
+
+    def import_time(self, code):
+        script = """\
+import time
+start = time.time()
+{}
+print(time.time() - start)
+""".format(code)
+        return float(subprocess.check_output([sys.executable, "-c", script]).decode())
+
+    # Build targets options not covered by the default configurations.
+    target_options = [
+        ("digilent_arty", "--with-telemetry"),
+    ]
+
+    def test_targets_options(self):
+        selection = Selection()
+        for name, options in self.target_options:
+            with self.subTest(target=name, options=options):
+                cmd = """\
+python3 -m litex_boards.targets.{} \
+    --cpu-type=vexriscv     \
+    --cpu-variant=minimal   \
+    --build                 \
+    --no-compile            \
+    {}
+""".format(name, options)
+                if selection.cached(f"target:{name}:{options}", target_files(name), cmd):
+                    continue
+                os.system("rm -rf build")
                 subprocess.check_call(cmd, shell=True)
+                selection.record(f"target:{name}:{options}", target_files(name), cmd)
+
+    def test_targets_startup(self):
+        # Measure baseline (best of 3, with warm caches).
+        baseline = min(self.import_time(self.startup_baseline) for _ in range(3))
+        startup_budget = baseline + self.startup_margin
+
+        # Collect targets.
+        targets = []
+        for file in os.listdir("./litex_boards/targets/"):
+            if file.endswith(".py"):
+                file = file.replace(".py", "")
+                if file not in ["__init__"] + self.excluded_targets:
+                    targets.append(file)
+
+        # Test targets.
+        for name in targets:
+            with self.subTest(target=name):
+                script = """\
+import sys, time
+start = time.time()
+import litex_boards.targets.{}
+print(time.time() - start)
+optional_modules = {}
+print(" ".join(sorted(m for m in sys.modules if any(m == o or m.startswith(o + ".") for o in optional_modules))))
+""".format(name, self.optional_modules)
+                output = subprocess.check_output([sys.executable, "-c", script]).decode().split("\n")
+                self.assertLess(float(output[0]), startup_budget)
+                self.assertEqual(output[1], "")